@@ -0,0 +1,176 @@
+"""Sprite atlases: game sprites packed into a few large page surfaces per target size.
+
+Loaders ask for `sprite(file, size)` and get a subsurface of the page holding every sprite of
+that size (tiles, player and enemy frames, projectiles, cards, shop art, ...). Each small PNG
+is decoded once per process however many sizes, spawns or screens ask for it, and each
+(file, size) is scaled once. Pages are fixed grids (all sprites of one size share a cell
+size), so sprites can be added lazily without repacking; `preload()` packs a known set up
+front. Sprites of one size sitting next to each other in one surface also keep the render
+queue's batched blits reading from a single source.
+
+Sprites handed out are shared: don't draw into them (copy first, as tints.py does).
+
+With a baked asset bundle (bundle.py) a (file, size) comes pre-scaled from the mapped file
+instead of being decoded and scaled here.
+"""
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pygame
+
+import bundle
+
+SPRITES_DIR = Path(__file__).parent.joinpath("sprites")
+PAGE_SIZE = 1024      # max page edge (px); sprites bigger than this get their own surface
+MAX_KEPT_SOURCE = 64  # keep decoded sources up to this edge (px); big art is decoded per size
+
+Size = Union[int, Tuple[int, int], None]
+
+_sources: Dict[str, pygame.Surface] = {}
+_sprites: Dict[tuple, pygame.Surface] = {}
+_pages: Dict[Tuple[int, int], List["_Page"]] = {}
+_page_of: Dict[pygame.Surface, "_Page"] = {}  # page surface -> page
+_decodes = 0
+_lock = threading.RLock()
+
+
+class _Page:
+    """One atlas surface: a grid of cells of a single size."""
+
+    def __init__(self, cell: Tuple[int, int]):
+        cw, ch = cell
+        self.cell = cell
+        self.cols = max(1, PAGE_SIZE // cw)
+        self.rows = max(1, PAGE_SIZE // ch)
+        self.used = 0
+        surf = pygame.Surface((self.cols * cw, self.rows * ch), pygame.SRCALPHA)
+        try:
+            surf = surf.convert_alpha()
+            surf.fill((0, 0, 0, 0))
+        except pygame.error:
+            pass  # no display yet: keep the plain SRCALPHA surface
+        self.surface = surf
+        _page_of[surf] = self
+
+    def full(self) -> bool:
+        return self.used >= self.cols * self.rows
+
+    def place(self, img: pygame.Surface) -> pygame.Surface:
+        cw, ch = self.cell
+        col, row = self.used % self.cols, self.used // self.cols
+        self.used += 1
+        rect = pygame.Rect(col * cw, row * ch, cw, ch)
+        # MAX onto the zeroed cell copies RGBA exactly (a normal blit would blend the alpha)
+        self.surface.blit(img, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return self.surface.subsurface(rect)
+
+
+def png_size(name: str) -> Optional[Tuple[int, int]]:
+    """Pixel size of sprites/<name> from its PNG header (no decode); None if unreadable."""
+    try:
+        with open(SPRITES_DIR.joinpath(name), "rb") as f:
+            head = f.read(24)
+        if head[:8] != b"\x89PNG\r\n\x1a\n":
+            return None
+        return struct.unpack(">II", head[16:24])
+    except OSError:
+        return None
+
+
+def _decode(name: str) -> pygame.Surface:
+    global _decodes
+    img = _sources.get(name)
+    if img is not None:
+        return img
+    img = pygame.image.load(str(SPRITES_DIR.joinpath(name))).convert_alpha()
+    _decodes += 1
+    if max(img.get_size()) <= MAX_KEPT_SOURCE:
+        _sources[name] = img
+    return img
+
+
+def _own(img: pygame.Surface) -> pygame.Surface:
+    try:
+        return img.convert_alpha()
+    except pygame.error:
+        return img.copy()
+
+
+def sprite(name: str, size: Size = None, smooth: bool = False) -> pygame.Surface:
+    """sprites/<name> scaled to `size` (an edge length, a (w, h) pair, or None for native size),
+    with nearest-neighbour scaling or `smooth`scale. Raises like pygame.image.load if the file
+    is missing or unreadable."""
+    if isinstance(size, int):
+        size = (size, size)
+    key = (name, tuple(size) if size else None, smooth)
+    hit = _sprites.get(key)
+    if hit is not None:
+        return hit
+    # the menu's warmup thread (warmup.py) loads sprites too: one page placement at a time
+    with _lock:
+        hit = _sprites.get(key)
+        if hit is not None:
+            return hit
+        img = bundle.sprite(name, size, smooth)
+        if img is not None:
+            shared = True  # a view of the mapped bundle
+        else:
+            img = _decode(name)
+            if size and tuple(size) != img.get_size():
+                img = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(img, size)
+            shared = img is _sources.get(name)
+        cell = img.get_size()
+        if cell[0] > PAGE_SIZE or cell[1] > PAGE_SIZE or not cell[0] or not cell[1]:
+            out = _own(img) if shared else img
+        else:
+            pages = _pages.setdefault(cell, [])
+            if not pages or pages[-1].full():
+                pages.append(_Page(cell))
+            try:
+                out = pages[-1].place(img)
+            except pygame.error:
+                # page locked (e.g. a subsurface of it is being read elsewhere): keep this one apart
+                out = _own(img) if shared else img
+        _sprites[key] = out
+        return out
+
+
+def revision(surface: pygame.Surface) -> int:
+    """Changes whenever a sprite is added to `surface` (an atlas page); 0 for other surfaces.
+    Lets texture uploads of a page (render_backend.py) tell when they are stale."""
+    page = _page_of.get(surface)
+    return page.used if page is not None else 0
+
+
+def keys() -> List[tuple]:
+    """(file, size, smooth) of every sprite handed out so far (what bundle.py bakes)."""
+    return list(_sprites)
+
+
+def game_sprites() -> List[str]:
+    """Every small (in-game sized) PNG in sprites/."""
+    out = []
+    for p in sorted(SPRITES_DIR.glob("*.png")):
+        dims = png_size(p.name)
+        if dims and max(dims) <= MAX_KEPT_SOURCE:
+            out.append(p.name)
+    return out
+
+
+def preload(names: Iterable[str], size: Size = None, smooth: bool = False):
+    """Pack the given sprites at `size` now; unreadable files are skipped."""
+    for name in names:
+        try:
+            sprite(name, size, smooth)
+        except Exception:
+            pass
+
+
+def stats() -> dict:
+    return {
+        "pages": sum(len(p) for p in _pages.values()),
+        "sprites": len(_sprites),
+        "decodes": _decodes,
+    }
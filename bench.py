@@ -0,0 +1,219 @@
+"""Scenario benchmarks: run predefined game situations for a fixed number of ticks and report
+frame-time percentiles plus a per-phase breakdown (input, simulate, draw, present).
+
+Usage: python bench.py [scenario ...] [--ticks N] [--windowed] [--detail] [--out FILE] [--compare OLD.json] [--list]
+
+Every frame advances exactly one simulation tick and is drawn, so "frame time" is the cost of
+one tick plus one render. Results are written as JSON so runs can be compared across commits.
+--detail also collects the in-game profiler's finer phases (see profiler.PHASE_LABELS); that
+collection has a small cost of its own, so compare detailed runs only with detailed runs.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+
+# scenarios are steered by the headless autopilot; --windowed must be known before it is imported
+if "--windowed" in sys.argv:
+    os.environ["DESCEND_WINDOWED"] = "1"
+
+import pygame
+import save
+import headless
+from headless import HeadlessPolicies, percentile
+from profiler import frame_profiler
+
+# Loadout staged on the player profile for every scenario, so results don't depend on the
+# local save.json (what was bought or equipped). A scenario's "profile" overrides these keys.
+DEFAULT_LOADOUT = {
+    "equipped_weapon": "Sword",
+    "equipped_armor": "",
+    "weapons_owned": ["Sword"],
+    "weapons_upgrades": {},
+}
+
+# name -> how to set the run up. "start" goes to run_game (see main._apply_start),
+# "profile" is staged over DEFAULT_LOADOUT for the run (weapon/armor loadout).
+SCENARIOS = {
+    "map7_mixed": {
+        "description": "map7 with 10 mixed enemies",
+        "start": {"map": 7, "enemies": 10, "kind": "mix"},
+    },
+    "boss18": {
+        "description": "level 18 dual boss (zombie + mage) with summons and ring volleys",
+        "start": {"level": 18},
+    },
+    "endless30": {
+        "description": "endless mode, level 30",
+        "mode": "endless",
+        "start": {"level": 30},
+    },
+    "katana_crowd": {
+        "description": "Katana 360 degree swings into a crowd of 16 enemies",
+        "start": {"map": 1, "enemies": 16, "kind": "mix", "crowd": 90},
+        "profile": {"equipped_weapon": "Katana", "weapons_owned": ["Sword", "Katana"]},
+    },
+}
+
+PHASES = ("input", "simulate", "draw", "present")
+DEFAULT_TICKS = 3600
+
+
+class BenchPolicies(HeadlessPolicies):
+    """Headless autopilot that keeps every frame's per-phase timings."""
+
+    def __init__(self, seed=None, detail: bool = False):
+        super().__init__(autopilot=True, render=True, seed=seed)
+        self.detail = detail
+        self.frame_totals = []
+        self.phase_ms = {name: [] for name in PHASES}
+        self.detail_ms = {}  # profiler phase -> per-frame ms (0 where the phase didn't run)
+
+    def begin_session(self, observe, info):
+        super().begin_session(observe, info)
+        frame_profiler.enabled = self.detail
+
+    def end_session(self, summary):
+        frame_profiler.enabled = frame_profiler.visible
+        super().end_session(summary)
+
+    def on_frame(self, frame_no: int, sim_ms: float, render_ms: float, ticks: int = 1, phases=None):
+        super().on_frame(frame_no, sim_ms, render_ms, ticks, phases)
+        phases = phases or {"simulate": sim_ms, "draw": render_ms}
+        self.frame_totals.append(sum(phases.values()))
+        for name, values in self.phase_ms.items():
+            values.append(phases.get(name, 0.0))
+        if self.detail:
+            n = len(self.frame_totals) - 1
+            for name, ms in frame_profiler.last.items():
+                self.detail_ms.setdefault(name, [0.0] * n)
+            for name, values in self.detail_ms.items():
+                values.append(frame_profiler.last.get(name, 0.0))
+
+
+def _stats(values):
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+def run_scenario(name, ticks=DEFAULT_TICKS, seed=1, detail=False):
+    """Run one scenario until `ticks` frames were measured. A run that ends early (death,
+    victory) is restarted with the next seed and measuring continues."""
+    spec = SCENARIOS[name]
+    totals = []
+    phase_ms = {p: [] for p in PHASES}
+    detail_ms = {}
+    runs = []
+    run_seed = seed
+    loadout = dict(DEFAULT_LOADOUT, **(spec.get("profile") or {}))
+    while len(totals) < ticks:
+        save.discard_staged_changes()
+        save.save_player_data(loadout)
+        pol = BenchPolicies(seed=run_seed, detail=detail)
+        summary, _ = headless.run_headless(ticks - len(totals), mode=spec.get("mode", "main"),
+                                           policies=pol, seed=run_seed, start=spec.get("start"))
+        totals.extend(pol.frame_totals)
+        for p in PHASES:
+            phase_ms[p].extend(pol.phase_ms[p])
+        done = len(totals) - len(pol.frame_totals)
+        for k in set(detail_ms) | set(pol.detail_ms):
+            detail_ms.setdefault(k, [0.0] * done).extend(pol.detail_ms.get(k) or [0.0] * len(pol.frame_totals))
+        runs.append(summary)
+        run_seed += 1
+    save.discard_staged_changes()
+    res = {
+        "description": spec.get("description", ""),
+        "ticks": len(totals),
+        "loadout": loadout,
+        "runs": runs,
+        "frame": _stats(totals),
+        "phases": {p: _stats(v) for p, v in phase_ms.items()},
+    }
+    if detail:
+        res["detail"] = {k: _stats(v) for k, v in sorted(detail_ms.items())}
+    return res
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _print_scenario(name, res, old=None):
+    f = res["frame"]
+    line = (f"{name:14s} frame mean {f['mean']:.3f}  p50 {f['p50']:.3f}  p95 {f['p95']:.3f}  "
+            f"p99 {f['p99']:.3f} ms  ({res['ticks']} ticks, {len(res['runs'])} run(s))")
+    if old:
+        o = old["frame"]
+        line += f"  [was mean {o['mean']:.3f}  p95 {o['p95']:.3f}]"
+    print(line)
+    for p, st in res["phases"].items():
+        print(f"    {p:10s} mean {st['mean']:.3f}  p95 {st['p95']:.3f}  p99 {st['p99']:.3f}")
+    for p, st in res.get("detail", {}).items():
+        print(f"      {p:18s} mean {st['mean']:.3f}  p95 {st['p95']:.3f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run Descend benchmark scenarios.")
+    parser.add_argument("scenarios", nargs="*", help="scenario names (default: all)")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--windowed", action="store_true", help="draw to a real window instead of the dummy display")
+    parser.add_argument("--detail", action="store_true", help="also record the profiler's finer phases")
+    parser.add_argument("--out", default=None, help="JSON results file (default: bench-<commit>-<time>.json)")
+    parser.add_argument("--compare", default=None, help="earlier results JSON to compare against")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for n, sc in SCENARIOS.items():
+            print(f"{n:14s} {sc.get('description', '')}")
+        sys.exit(0)
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+
+    old = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            old = json.load(f).get("scenarios", {})
+
+    commit = _git_commit()
+    results = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "windowed": args.windowed,
+        "detail": args.detail,
+        "ticks": args.ticks,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    for n in names:
+        res = run_scenario(n, ticks=args.ticks, seed=args.seed, detail=args.detail)
+        results["scenarios"][n] = res
+        _print_scenario(n, res, old.get(n))
+
+    out = args.out or f"bench-{commit or 'nogit'}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {out}")
+    pygame.quit()
+    sys.exit(0)
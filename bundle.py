@@ -0,0 +1,245 @@
+"""Pre-baked asset bundle: scaled sprite pixels and decoded SFX in one memory-mapped file.
+
+`python bundle.py` plays a short headless run of every bench scenario, then writes
+assets.bundle holding, for each (sprite, size) the atlas handed out, the final scaled RGBA
+pixels, and for each short sound effect its decoded PCM. At runtime the file is mmap'ed on
+first use: atlas.sprite() wraps a block with `pygame.image.frombuffer` (no PNG decode, no
+rescale, no copy until it is packed into an atlas page) and sounds.load_sfx() builds the
+Sound straight from the PCM (no MP3 decode).
+
+Every entry records the size and mtime of the loose file it was made from; an entry whose
+source changed (or whose PCM was decoded for another mixer format) is ignored and the loaders
+read the loose file as before, so a stale or missing bundle only costs speed. SFX are baked in
+sounds.MIXER_FORMAT, the format sounds.py always opens the mixer in, whatever the device.
+DESCEND_ASSET_BUNDLE=0 ignores the bundle altogether.
+
+Layout: magic, u32 index length, JSON index, then the data blocks (16-byte aligned).
+"""
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+BASE_DIR = Path(__file__).parent
+BUNDLE_PATH = BASE_DIR.joinpath("assets.bundle")
+MAGIC = b"DESCBDL1"
+ALIGN = 16
+MAX_SFX_BYTES = 256 * 1024  # sound files bigger than this are music (streamed, not baked)
+
+ENABLED = os.environ.get("DESCEND_ASSET_BUNDLE", "1") != "0"
+
+_map: Optional[mmap.mmap] = None
+_index: Optional[dict] = None  # None: not opened yet; {} : no usable bundle
+_sprites: Dict[tuple, list] = {}  # (name, size, smooth) -> [w, h, offset, nbytes]
+_fresh: Dict[str, bool] = {}  # source path -> unchanged since the bake
+_hits = 0
+
+
+def _stamp(rel: str) -> Optional[list]:
+    try:
+        st = os.stat(BASE_DIR.joinpath(rel))
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _open() -> dict:
+    global _map, _index
+    if _index is not None:
+        return _index
+    _index = {}
+    if not ENABLED:
+        return _index
+    try:
+        with open(BUNDLE_PATH, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:len(MAGIC)] != MAGIC:
+            mm.close()
+            return _index
+        start = len(MAGIC) + 4
+        (n,) = struct.unpack("<I", mm[len(MAGIC):start])
+        index = json.loads(mm[start:start + n].decode("utf-8"))
+    except (OSError, ValueError, struct.error):
+        return _index
+    _map = mm
+    _index = index
+    for name, size, smooth, w, h, off, nbytes in index.get("sprites", []):
+        _sprites[(name, tuple(size) if size else None, bool(smooth))] = [w, h, off, nbytes]
+    return _index
+
+
+def _is_fresh(rel: str) -> bool:
+    ok = _fresh.get(rel)
+    if ok is None:
+        ok = _fresh[rel] = (rel in _index.get("sources", {})
+                            and _stamp(rel) == _index["sources"][rel])
+    return ok
+
+
+def sprite(name: str, size=None, smooth: bool = False) -> Optional[pygame.Surface]:
+    """Baked sprites/<name> at `size` (as atlas.sprite takes it), or None when the bundle
+    doesn't have it or it is stale. The surface reads the mapped file: don't draw into it."""
+    global _hits
+    if not _open():
+        return None
+    if isinstance(size, int):
+        size = (size, size)
+    entry = _sprites.get((name, tuple(size) if size else None, bool(smooth)))
+    if entry is None or not _is_fresh("sprites/" + name):
+        return None
+    w, h, off, nbytes = entry
+    try:
+        surf = pygame.image.frombuffer(memoryview(_map)[off:off + nbytes], (w, h), "RGBA")
+    except (pygame.error, ValueError):
+        return None
+    _hits += 1
+    return surf
+
+
+def sound(path) -> Optional["pygame.mixer.Sound"]:
+    """Sound for the file at `path` from its baked PCM, or None (not baked, stale, or baked
+    for another mixer format)."""
+    global _hits
+    if not _open():
+        return None
+    try:
+        rel = Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return None
+    entry = _index.get("sounds", {}).get(rel)
+    if entry is None or not _is_fresh(rel):
+        return None
+    fmt = pygame.mixer.get_init()
+    if not fmt or list(fmt) != entry["format"]:
+        return None
+    off, nbytes = entry["offset"], entry["nbytes"]
+    try:
+        snd = pygame.mixer.Sound(buffer=memoryview(_map)[off:off + nbytes])
+    except (pygame.error, ValueError):
+        return None
+    _hits += 1
+    return snd
+
+
+def close():
+    """Unmap the bundle (bake() does this before replacing it); reopened on next use."""
+    global _map, _index
+    _sprites.clear()
+    _fresh.clear()
+    _index = None
+    if _map is not None:
+        try:
+            _map.close()
+        except (BufferError, ValueError):
+            pass  # a surface still views it; the mapping goes away with the last one
+        _map = None
+
+
+def stats() -> dict:
+    idx = _open()
+    return {"sprites": len(_sprites), "sounds": len(idx.get("sounds", {})), "hits": _hits}
+
+
+def _sfx_files() -> Iterable[Path]:
+    import sounds
+    for d in sounds.SOUND_DIRS:
+        if not d.exists():
+            continue
+        for p in sorted(d.iterdir()):
+            if p.suffix.lower() in sounds.SUPPORTED_SFX_EXT and p.stat().st_size <= MAX_SFX_BYTES:
+                yield p
+
+
+def bake(sprite_keys: Iterable[Tuple[str, object, bool]], path=BUNDLE_PATH) -> dict:
+    """Write the bundle: `sprite_keys` (name, size, smooth) as atlas.sprite() produces them
+    from the loose files, plus every short SFX decoded for the current mixer format (none if
+    the mixer isn't initialised). Returns stats of what was written."""
+    import atlas
+    close()
+    sources: Dict[str, list] = {}
+    blocks = []
+    sprites = []
+    sounds_idx = {}
+    tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    for name, size, smooth in sprite_keys:
+        try:
+            surf = atlas.sprite(name, size, smooth)
+        except Exception:
+            continue
+        rel = "sprites/" + name
+        stamp = _stamp(rel)
+        if stamp is None:
+            continue
+        sources[rel] = stamp
+        w, h = surf.get_size()
+        sprites.append([name, list(size) if size else None, bool(smooth), w, h, len(blocks)])
+        blocks.append(tobytes(surf, "RGBA"))
+    fmt = pygame.mixer.get_init()
+    if fmt:
+        for p in _sfx_files():
+            try:
+                raw = pygame.mixer.Sound(str(p)).get_raw()
+            except pygame.error:
+                continue
+            rel = p.resolve().relative_to(BASE_DIR.resolve()).as_posix()
+            sources[rel] = _stamp(rel)
+            sounds_idx[rel] = {"format": list(fmt), "block": len(blocks)}
+            blocks.append(raw)
+
+    # offsets depend on the index length, which depends on the offsets: size the index with
+    # placeholder offsets as wide as any real one, then pad it to that length
+    def index_bytes(offsets):
+        sp = [e[:5] + [offsets[e[5]], len(blocks[e[5]])] for e in sprites]
+        sn = {k: {"format": v["format"], "offset": offsets[v["block"]], "nbytes": len(blocks[v["block"]])}
+              for k, v in sounds_idx.items()}
+        return json.dumps({"version": 1, "sources": sources, "sprites": sp, "sounds": sn},
+                          separators=(",", ":")).encode("utf-8")
+
+    total = sum(len(b) + ALIGN for b in blocks)
+    head_len = len(index_bytes([10 ** (len(str(total)) + 1)] * len(blocks))) + len(MAGIC) + 4
+    pos = -(-head_len // ALIGN) * ALIGN
+    offsets = []
+    for b in blocks:
+        offsets.append(pos)
+        pos += -(-len(b) // ALIGN) * ALIGN
+    index = index_bytes(offsets)
+    index += b" " * (head_len - len(MAGIC) - 4 - len(index))
+
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(index)) + index)
+        for off, b in zip(offsets, blocks):
+            f.write(b"\0" * (off - f.tell()))
+            f.write(b)
+    os.replace(tmp, path)
+    return {"sprites": len(sprites), "sounds": len(sounds_idx), "bytes": pos}
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(description="Bake sprites and SFX into assets.bundle.")
+    parser.add_argument("--ticks", type=int, default=120, help="ticks of each bench scenario to play")
+    parser.add_argument("--out", default=str(BUNDLE_PATH))
+    args = parser.parse_args()
+
+    # bake from the loose files, never from an older bundle
+    os.environ["DESCEND_ASSET_BUNDLE"] = "0"
+    import bundle  # this file as the module atlas/sounds use (not __main__)
+    import bench  # selects the dummy drivers (via headless) before pygame opens anything
+    import atlas
+    for n in bench.SCENARIOS:
+        bench.run_scenario(n, ticks=args.ticks)
+    import sounds
+    try:
+        pygame.mixer.init(*sounds.MIXER_FORMAT, allowedchanges=0)  # the format sounds.py plays in
+    except pygame.error:
+        print("no mixer: sounds are not baked")
+    res = bundle.bake(atlas.keys(), args.out)
+    print(f"{args.out}: {res['sprites']} sprites, {res['sounds']} sounds, {res['bytes'] / 1048576:.1f} MiB")
+    pygame.quit()
+    sys.exit(0)
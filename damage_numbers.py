@@ -0,0 +1,120 @@
+"""Floating damage numbers ("-12") composed from cached, pre-outlined glyphs.
+
+Each (character, color) pair is rendered once with its black outline into a small LRU cache,
+and each (text, color) is composed once from those glyphs into one surface (another LRU); a
+number blits that surface, fading via its surface alpha at blit time (fading the whole string,
+not glyph by glyph, so overlapping outlines don't blend twice).
+Indicator records are pooled, so a Katana or poison build spawning dozens per second doesn't
+allocate a dict, two text surfaces and a composite surface per number per frame.
+"""
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import pygame
+
+OUTLINE_W = 2
+_OUTLINE_OFFSETS = [(-OUTLINE_W, 0), (OUTLINE_W, 0), (0, -OUTLINE_W), (0, OUTLINE_W),
+                    (-OUTLINE_W, -OUTLINE_W), (OUTLINE_W, -OUTLINE_W), (-OUTLINE_W, OUTLINE_W), (OUTLINE_W, OUTLINE_W)]
+FADE_MS = 200  # numbers fade out over their last FADE_MS
+
+
+class GlyphCache:
+    """Outlined glyph surfaces keyed by (char, color); least recently used beyond max_size are dropped."""
+
+    def __init__(self, font: pygame.font.Font, max_size: int = 128):
+        self.font = font
+        self.max_size = max_size
+        self._glyphs: "OrderedDict[Tuple[str, tuple], Tuple[pygame.Surface, int]]" = OrderedDict()
+        self._texts: "OrderedDict[Tuple[str, tuple], pygame.Surface]" = OrderedDict()
+
+    def get(self, ch: str, color: tuple) -> Tuple[pygame.Surface, int]:
+        """(outlined glyph surface, advance width) for one character."""
+        key = (ch, color)
+        hit = self._glyphs.get(key)
+        if hit is not None:
+            self._glyphs.move_to_end(key)
+            return hit
+        base = self.font.render(ch, True, color)
+        outline = self.font.render(ch, True, (0, 0, 0))
+        comp = pygame.Surface((base.get_width() + OUTLINE_W * 2, base.get_height() + OUTLINE_W * 2), pygame.SRCALPHA)
+        for ox, oy in _OUTLINE_OFFSETS:
+            comp.blit(outline, (ox + OUTLINE_W, oy + OUTLINE_W))
+        comp.blit(base, (OUTLINE_W, OUTLINE_W))
+        hit = (comp, base.get_width())
+        self._glyphs[key] = hit
+        if len(self._glyphs) > self.max_size:
+            self._glyphs.popitem(last=False)
+        return hit
+
+    def text(self, text: str, color: tuple) -> pygame.Surface:
+        """The outlined glyphs of `text` composed side by side into one surface."""
+        key = (text, color)
+        hit = self._texts.get(key)
+        if hit is not None:
+            self._texts.move_to_end(key)
+            return hit
+        glyphs = [self.get(ch, color) for ch in text]
+        width = sum(adv for _, adv in glyphs) + OUTLINE_W * 2
+        height = max((g.get_height() for g, _ in glyphs), default=0)
+        hit = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        gx = 0
+        for surf, adv in glyphs:
+            hit.blit(surf, (gx, 0))
+            gx += adv
+        self._texts[key] = hit
+        if len(self._texts) > self.max_size:
+            self._texts.popitem(last=False)
+        return hit
+
+    def __len__(self):
+        return len(self._glyphs)
+
+
+class _Indicator:
+    __slots__ = ("x", "y", "text", "color", "life", "vy")
+
+
+class DamageNumbers:
+    """Active floating numbers plus a free list of recycled records."""
+
+    def __init__(self, font: Optional[pygame.font.Font], pool_size: int = 32):
+        self.glyphs = GlyphCache(font) if font is not None else None
+        self.active: List[_Indicator] = []
+        self._free: List[_Indicator] = [_Indicator() for _ in range(pool_size)]
+
+    def spawn(self, x: float, y: float, text: str, color=(200, 40, 40), life: int = 600, vy: float = -0.04):
+        ind = self._free.pop() if self._free else _Indicator()
+        ind.x, ind.y, ind.text, ind.color, ind.life, ind.vy = float(x), float(y), text, tuple(color), life, vy
+        self.active.append(ind)
+
+    def update(self, dt: float):
+        """Advance every number by dt ms (drift up) and recycle expired ones."""
+        alive = []
+        for ind in self.active:
+            ind.life -= dt
+            ind.y += ind.vy * dt
+            if ind.life > 0:
+                alive.append(ind)
+            else:
+                self._free.append(ind)
+        self.active = alive
+
+    def clear(self):
+        self._free.extend(self.active)
+        self.active = []
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Blit all numbers centred on their x; returns the rects drawn (for dirty-rect presents)."""
+        if self.glyphs is None:
+            return []
+        rects = []
+        for ind in self.active:
+            surf = self.glyphs.text(ind.text, ind.color)
+            a = 255
+            if ind.life < FADE_MS:
+                a = max(0, int(255 * (ind.life / float(FADE_MS))))
+                surf.set_alpha(a)
+            rects.append(surface.blit(surf, (int(ind.x - surf.get_width() / 2), int(ind.y))))
+            if a < 255:
+                surf.set_alpha(255)
+        return rects
@@ -0,0 +1,65 @@
+"""Dirty-rectangle presentation: only push the screen areas that changed to the display.
+
+The frame is still drawn completely every time; what changes is what `present()` hands to
+`pygame.display.update`. Anything drawn at a spot that moves (entities, particles, HUD widgets,
+the crosshair) is registered with `add()`. A rect stays dirty for two frames (the frame it was
+drawn in and the next one), so the spot something moved away from is repainted too.
+"""
+from typing import List, Optional
+
+import pygame
+
+
+class DirtyRects:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._rects: List[pygame.Rect] = []
+        self._prev: List[pygame.Rect] = []
+        self._full = True
+
+    def add(self, rect: Optional[pygame.Rect], pad: int = 0):
+        if rect is None or not self.enabled:
+            return
+        r = pygame.Rect(rect)
+        if pad:
+            r.inflate_ip(pad * 2, pad * 2)
+        if r.width > 0 and r.height > 0:
+            self._rects.append(r)
+
+    def invalidate(self):
+        """Next present updates the whole screen (after overlays, modals, a resize, a new map)."""
+        self._full = True
+
+    def present(self, surface: pygame.Surface, force_full: bool = False, screen=None):
+        """Push the changed areas of `surface`. With `screen` (a LogicalScreen), `surface` is its
+        logical surface and the areas are upscaled onto the display first."""
+        current = self._rects
+        self._rects = []
+        if not self.enabled or self._full or force_full:
+            if screen is not None:
+                screen.upscale()
+            pygame.display.update()
+            self._full = False
+            self._prev = current
+            return
+        bounds = surface.get_rect()
+        rects = [r.clip(bounds) for r in self._prev + current]
+        self._prev = current
+        rects = merge([r for r in rects if r.width and r.height])
+        if screen is not None:
+            rects = screen.upscale(rects)
+        pygame.display.update(rects)
+
+
+def merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Fold overlapping rects together so SDL gets a short list without double-copied pixels
+    (none of the returned rects overlap)."""
+    merged: List[pygame.Rect] = []
+    for r in sorted(rects, key=lambda q: (q.y, q.x)):
+        r = pygame.Rect(r)
+        i = r.collidelist(merged)
+        while i >= 0:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
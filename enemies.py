@@ -4,6 +4,26 @@ from pathlib import Path
 import math
 import random
 import pygame
+import stamps  # cached shadow stamps
+import tints  # cached hit / poison tinted sprite variants
+import outlines  # cached boss outline overlays
+import render_queue as rq
+import atlas  # shared sprite atlas pages
+import mapdata  # precomputed per-map spawn tiles
+from render_queue import RenderQueue
+
+# Random streams: spawn placement / initial timers vs. in-fight AI decisions (wander, summons,
+# projectile spin). run_game points these at its per-run seeded streams via use_rng().
+_spawn_rng = random
+_ai_rng = random
+
+
+def use_rng(spawn=None, ai=None):
+    """Route enemy randomness through the given random.Random streams (None = global random)."""
+    global _spawn_rng, _ai_rng
+    _spawn_rng = spawn if spawn is not None else random
+    _ai_rng = ai if ai is not None else random
+
 
 class Enemy:
     """Chasing enemy with optional directional animations."""
@@ -43,7 +63,7 @@ class Enemy:
         # casting (mage) state
         self.can_cast = can_cast
         self.cast_cooldown = cast_cooldown
-        self.cast_timer = random.randint(0, cast_cooldown)  # stagger initial casts slightly
+        self.cast_timer = _spawn_rng.randint(0, cast_cooldown)  # stagger initial casts slightly
         self.projectile_speed = projectile_speed
         self.projectiles: List[Dict[str, float]] = []  # each: {'x','y','vx','vy','speed'}
         self.cast_stop_distance = cast_stop_distance
@@ -71,7 +91,7 @@ class Enemy:
         # limit to one jump every 1.2s (configurable)
         self.hop_cooldown = 1200  # ms between hops
         # stagger initial hop so they don't all jump immediately
-        self.hop_timer = random.randint(0, self.hop_cooldown)
+        self.hop_timer = _spawn_rng.randint(0, self.hop_cooldown)
         # maximum jump distance (approx in pixels): 4 tiles ~= 4 * size
         self.max_jump_distance = float(self.size) * 4.0
         # trap damage cooldown (prevent per-frame damage); enemies take trap damage when on trap
@@ -115,7 +135,7 @@ class Enemy:
         # dash settings
         self.can_dash: bool = False
         self.dash_cooldown: int = 4000       # ms between dashes
-        self._dash_cd_timer: int = random.randint(int(self.dash_cooldown * 0.5), self.dash_cooldown)
+        self._dash_cd_timer: int = _spawn_rng.randint(int(self.dash_cooldown * 0.5), self.dash_cooldown)
         self.dash_duration: int = 200        # ms dash duration (applied via knockback)
         self.dash_force: float = 28.0        # strength of dash knockback impulse
         # summon settings
@@ -411,8 +431,8 @@ class Enemy:
                             m_size = max(28, int(self.size * 0.8))
                             placed = False
                             for _try in range(14):
-                                ang = random.uniform(0, 2 * math.pi)
-                                rad = random.uniform(self.size * 1.0, self.size * 3.5)
+                                ang = _ai_rng.uniform(0, 2 * math.pi)
+                                rad = _ai_rng.uniform(self.size * 1.0, self.size * 3.5)
                                 mcx = (self.x + self.size/2) + math.cos(ang) * rad
                                 mcy = (self.y + self.size/2) + math.sin(ang) * rad
                                 mx = mcx - m_size / 2
@@ -422,15 +442,8 @@ class Enemy:
                                         # build sprites and minion type
                                         kind = (getattr(self, "summon_kind", "zombie") or "zombie").lower()
                                         if kind == "mage":
-                                            direction_files = {
-                                                "down":  ["mdown_idle.png","mdown_walk1.png","mdown_walk2.png"],
-                                                "left":  ["mleft_idle.png","mleft_walk1.png","mleft_walk2.png"],
-                                                "right": ["mright_idle.png","mright_walk1.png","mright_walk2.png"],
-                                                "up":    ["mup_idle.png","mup_walk1.png","mup_walk2.png"],
-                                                "idle":  ["mup_idle.png"]
-                                            }
                                             try:
-                                                sprite_dict = load_enemy_sprites(direction_files, m_size)
+                                                sprite_dict = enemy_sprites("mage", m_size)
                                             except Exception:
                                                 sprite_dict = None
                                             m = Enemy(
@@ -444,29 +457,12 @@ class Enemy:
                                                 cast_stop_distance=140
                                             )
                                             m.kind = "mage"
-                                            # projectile image try-load
-                                            sprites_dir = Path(__file__).parent.joinpath("sprites")
-                                            fp = sprites_dir.joinpath("mage_magic.png")
-                                            if fp.exists():
-                                                try:
-                                                    img = pygame.image.load(str(fp)).convert_alpha()
-                                                    size_px = max(20, int(m_size * 0.7))
-                                                    m.projectile_img = pygame.transform.scale(img, (size_px, size_px))
-                                                except Exception:
-                                                    m.projectile_img = None
-                                            else:
-                                                m.projectile_img = None
+                                            # shared projectile image
+                                            m.projectile_img = projectile_sprite(max(20, int(m_size * 0.7)))
                                         else:
                                             # zombie fallback
-                                            direction_files = {
-                                                "down":  ["zdown_idle.png",  "zdown_walk1.png",  "zdown_walk2.png"],
-                                                "left":  ["zleft_idle.png",  "zleft_walk1.png",  "zleft_walk2.png"],
-                                                "right": ["zright_idle.png", "zright_walk1.png", "zright_walk2.png"],
-                                                "up":    ["zup_idle.png",    "zup_walk1.png",    "zup_walk2.png"],
-                                                "idle":  ["zdown_idle.png"]
-                                            }
                                             try:
-                                                sprite_dict = load_enemy_sprites(direction_files, m_size)
+                                                sprite_dict = enemy_sprites("zombie", m_size)
                                             except Exception:
                                                 sprite_dict = None
                                             m = Enemy(mx, my, m_size, speed=max(0.9, self.speed * 0.85), hp=12, sprites=sprite_dict)
@@ -611,8 +607,8 @@ class Enemy:
         else:
             # wandering behaviour: pick a wander target near home every so often
             if self.wander_target is None or self.wander_timer <= 0:
-                ang = random.random() * 2.0 * math.pi
-                r = random.random() * self.roam_radius
+                ang = _ai_rng.random() * 2.0 * math.pi
+                r = _ai_rng.random() * self.roam_radius
                 tx = self.home_x + r * math.cos(ang)
                 ty = self.home_y + r * math.sin(ang)
                 self.wander_target = (tx, ty)
@@ -683,7 +679,7 @@ class Enemy:
                 dn = math.hypot(dxo, dyo)
                 if dn < 1e-6:
                     # jitter to avoid exact overlap
-                    ang = random.random() * 2.0 * math.pi
+                    ang = _ai_rng.random() * 2.0 * math.pi
                     dxo = math.cos(ang) * 0.1
                     dyo = math.sin(ang) * 0.1
                     dn = math.hypot(dxo, dyo)
@@ -959,6 +955,8 @@ class Enemy:
             sep = self.size * 0.55
             push_x = 0.0
             push_y = 0.0
+            # 35% of the overlap per 60 FPS frame (what it was tuned at), whatever the tick length
+            push_k = 1.0 - (1.0 - 0.35) ** (dt / (1000.0 / 60.0))
             for other in self.group:
                 if other is self or not other.alive:
                     continue
@@ -966,7 +964,7 @@ class Enemy:
                 dyo = (self.y + self.size / 2) - (other.y + other.size / 2)
                 d = math.hypot(dxo, dyo)
                 if d < 1e-4:
-                    ang = random.random() * 2 * math.pi
+                    ang = _ai_rng.random() * 2 * math.pi
                     dxo = math.cos(ang) * 0.1
                     dyo = math.sin(ang) * 0.1
                     d = math.hypot(dxo, dyo)
@@ -974,8 +972,8 @@ class Enemy:
                     overlap = sep - d
                     # avoid dividing by zero defensively
                     if d != 0:
-                        push_x += (dxo / d) * overlap * 0.35
-                        push_y += (dyo / d) * overlap * 0.35
+                        push_x += (dxo / d) * overlap * push_k
+                        push_y += (dyo / d) * overlap * push_k
             if abs(push_x) > 0.0001 or abs(push_y) > 0.0001:
                 nxpos = self.x + push_x
                 nypos = self.y + push_y
@@ -1051,7 +1049,7 @@ class Enemy:
                                     'vy': dvy,
                                     'speed': self.projectile_speed,
                                     'angle': ang_deg,
-                                    'spin': random.uniform(-360.0, 360.0)
+                                    'spin': _ai_rng.uniform(-360.0, 360.0)
                                 })
                             # occasional ring burst around the boss
                             if getattr(self, "volley_ring", False):
@@ -1067,7 +1065,7 @@ class Enemy:
                                         'vy': dvy,
                                         'speed': self.projectile_speed,
                                         'angle': math.degrees(ang),
-                                        'spin': random.uniform(-360.0, 360.0)
+                                        'spin': _ai_rng.uniform(-360.0, 360.0)
                                     })
                         else:
                             # default single shot
@@ -1078,14 +1076,14 @@ class Enemy:
                                 'vy': vy,
                                 'speed': self.projectile_speed,
                                 'angle': math.degrees(math.atan2(vy, vx)),
-                                'spin': random.uniform(-360.0, 360.0)
+                                'spin': _ai_rng.uniform(-360.0, 360.0)
                             })
                         self.cast_timer = self.cast_cooldown
             else:
                 # keep some headroom on the timer to avoid instant fire after gaining aggro
                 # pick a value between 20% and 100% of cooldown if timer would otherwise be small
                 if self.cast_timer <= int(self.cast_cooldown * 0.2):
-                    self.cast_timer = random.randint(int(self.cast_cooldown * 0.2), self.cast_cooldown)
+                    self.cast_timer = _ai_rng.randint(int(self.cast_cooldown * 0.2), self.cast_cooldown)
 
             # move projectiles and prune only on wall / out-of-bounds
             pruned: List[Dict[str, float]] = []
@@ -1121,6 +1119,18 @@ class Enemy:
             self.projectiles = pruned
 
     def draw(self, surface: pygame.Surface, offset_x: int = 0, offset_y: int = 0) -> None:
+        """Draw straight to `surface` (run_game submits to its frame's render queue instead)."""
+        queue = RenderQueue()
+        self.submit(queue, offset_x, offset_y)
+        queue.flush(surface)
+
+    def feet_y(self, offset_y: int = 0) -> int:
+        """Sort key for the entities layer: screen y of the sprite's bottom edge."""
+        return int(self.y) + offset_y + self.size
+
+    def submit(self, queue: RenderQueue, offset_x: int = 0, offset_y: int = 0) -> None:
+        """Queue shadow (ground layer), sprite and boss outline (entities, sorted by feet) and
+        projectiles (projectile layer)."""
         if not self.alive or not self.sprites:
             return
         # Draw shadow under enemy (ground position). For jumping slimes compute ground position and scale.
@@ -1150,9 +1160,7 @@ class Enemy:
             sh_w = shadow_w
             sh_h = shadow_h
         try:
-            sh_surf = pygame.Surface((sh_w, sh_h), pygame.SRCALPHA)
-            pygame.draw.ellipse(sh_surf, (0, 0, 0, 120), sh_surf.get_rect())
-            surface.blit(sh_surf, (shadow_x, shadow_y))
+            queue.blit(rq.GROUND, shadow_y, stamps.shadow(sh_w, sh_h, 120), (shadow_x, shadow_y))
         except Exception:
             pass
         # Rendering: show preparing sprite briefly, then in-air uses normal (idle) image, landing returns to normal.
@@ -1177,33 +1185,22 @@ class Enemy:
                     return
                 img = frames[self.frame % len(frames)]
         # tint layers: red when hit, green when poison ticks (green overrides red briefly)
-        draw_img = img
+        tint = None
         if getattr(self, "poison_green_timer", 0) > 0:
-            try:
-                draw_img = img.copy()
-                draw_img.fill((60, 200, 60, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            except Exception:
-                draw_img = img
+            tint = tints.ENEMY_POISON
         elif getattr(self, "flash_timer", 0) > 0:
-            try:
-                draw_img = img.copy()
-                draw_img.fill((200, 40, 40, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            except Exception:
-                draw_img = img
-        surface.blit(draw_img, (int(self.x) + offset_x, int(self.y) + offset_y))
+            tint = tints.ENEMY_HIT
+        pos = (int(self.x) + offset_x, int(self.y) + offset_y)
+        key = self.feet_y(offset_y)
+        queue.blit(rq.ENTITIES, key, img, pos, tint=tint)
         # --- NEW: boss red outline ---
         if getattr(self, "is_boss", False):
             try:
-                mask = pygame.mask.from_surface(draw_img)
-                outline = mask.outline()
-                if outline:
-                    ox = int(self.x) + offset_x
-                    oy = int(self.y) + offset_y
-                    pts = [(ox + p[0], oy + p[1]) for p in outline]
-                    pygame.draw.lines(surface, (220, 30, 30), True, pts, 3)
+                # outline cached per frame (tinted variants share the frame's mask)
+                ov = outlines.overlay(img, (220, 30, 30), 3)
+                queue.blit(rq.ENTITIES, key, ov, (pos[0] - outlines.MARGIN, pos[1] - outlines.MARGIN))
             except Exception:
-                pygame.draw.rect(surface, (220, 30, 30),
-                                 (int(self.x)+offset_x, int(self.y)+offset_y, self.size, self.size), 3)
+                queue.call(rq.ENTITIES, key, lambda s: pygame.draw.rect(s, (220, 30, 30), (pos[0], pos[1], self.size, self.size), 3))
         # draw projectiles (if any) — use image when available, otherwise fallback to circle
         if self.can_cast and self.projectiles:
             proj_img = getattr(self, "projectile_img", None)
@@ -1211,17 +1208,11 @@ class Enemy:
                 px = int(p['x']) + offset_x
                 py = int(p['y']) + offset_y
                 if proj_img:
-                    # rotate projectile image by its per-projectile angle (if present)
-                    ang = int(p.get('angle', 0.0))
-                    try:
-                        rimg = pygame.transform.rotate(proj_img, -ang)
-                        rect = rimg.get_rect(center=(px, py))
-                        surface.blit(rimg, rect.topleft)
-                    except Exception:
-                        rect = proj_img.get_rect(center=(px, py))
-                        surface.blit(proj_img, rect.topleft)
+                    # rotated by its per-projectile angle (if present)
+                    queue.blit_rotated(rq.PROJECTILES, py, proj_img, (px, py), p.get('angle', 0.0))
                 else:
-                    pygame.draw.circle(surface, (160, 80, 255), (px, py), max(3, int(self.size * 0.12)))
+                    queue.call(rq.PROJECTILES, py, lambda s, c=(px, py): pygame.draw.circle(
+                        s, (160, 80, 255), c, max(3, int(self.size * 0.12))))
 
 
 def load_enemy_sprites(direction_files: Dict[str, List[str]], size: int) -> Dict[str, List[pygame.Surface]]:
@@ -1234,74 +1225,136 @@ def load_enemy_sprites(direction_files: Dict[str, List[str]], size: int) -> Dict
             full = sprites_dir.joinpath(name)
             if full.exists():
                 try:
-                    img = pygame.image.load(str(full)).convert_alpha()
-                    img = pygame.transform.scale(img, (size, size))
-                    frames.append(img)
+                    frames.append(atlas.sprite(name, size))
                 except Exception:
                     continue
         if frames:
+            # hit flashes happen in every fight: build those variants now (poison tints lazily)
+            tints.pretint(frames, (tints.ENEMY_HIT,))
             out[direction] = frames
     return out
 
 
-def spawn_enemies(
-    game_map: List[List[str]],
-    count: int,
-    tile_size: int,
-    offset_x: int,
-    offset_y: int,
-    valid_tile: str = ".",
-    enemy_size: int = 48,
-    speed: float = 1,
-    kind: str = "zombie"  # new: "zombie" (default), "slime", or "mix"
-) -> List[Enemy]:
-    HEIGHT = len(game_map)
-    WIDTH = len(game_map[0]) if HEIGHT > 0 else 0
-    candidates: List[Tuple[int, int]] = []
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            if game_map[y][x] == valid_tile:
-                tlx = offset_x + x * tile_size
-                tly = offset_y + y * tile_size
-                candidates.append((tlx, tly))
-    random.shuffle(candidates)
-
-    # zombie sprite files (existing)
-    zombie_files = {
+# --- Flyweight sprite registry: every enemy (and summoned minion) of a kind and size shares one
+# set of frames, loaded on first use; translucent looks are registry variants, not mutations ---
+SPRITE_SETS: Dict[str, Dict[str, List[str]]] = {
+    "zombie": {
         "down":  ["zdown_idle.png",  "zdown_walk1.png",  "zdown_walk2.png"],
         "left":  ["zleft_idle.png",  "zleft_walk1.png",  "zleft_walk2.png"],
         "right": ["zright_idle.png", "zright_walk1.png", "zright_walk2.png"],
         "up":    ["zup_idle.png",    "zup_walk1.png",    "zup_walk2.png"],
         "idle":  ["zdown_idle.png"]
-    }
-
-    # ghost sprite files (use your project sprite names or placeholders)
-    ghost_files = {
+    },
+    "ghost": {
         "down":  ["gdown_1.png", "gdown_2.png", "gdown_3.png"],
         "left":  ["gleft_1.png", "gleft_2.png", "gleft_3.png"],
         "right": ["gright_1.png", "gright_2.png", "gright_3.png"],
         "up":    ["gup_1.png", "gup_2.png", "gup_3.png"],
         "idle":  ["gdown_1.png", "gdown_2.png", "gdown_3.png"]
-    }
-
-    # mage sprite files
-    mage_files = {
-        "down":  ["mdown_idle.png","mdown_walk1.png","mdown_walk2.png"],
-        "left":  ["mleft_idle.png","mleft_walk1.png","mleft_walk2.png"],
-        "right": ["mright_idle.png","mright_walk1.png","mright_walk2.png"],
-        "up":    ["mup_idle.png","mup_walk1.png","mup_walk2.png"],
+    },
+    "mage": {
+        "down":  ["mdown_idle.png", "mdown_walk1.png", "mdown_walk2.png"],
+        "left":  ["mleft_idle.png", "mleft_walk1.png", "mleft_walk2.png"],
+        "right": ["mright_idle.png", "mright_walk1.png", "mright_walk2.png"],
+        "up":    ["mup_idle.png", "mup_walk1.png", "mup_walk2.png"],
         "idle":  ["mup_idle.png"]
-    }
-
-    # new: slime sprite files (use your project sprite names or placeholders)
-    slime_files = {
+    },
+    "slime": {
         "down":  ["slime_normal.png"],
         "left":  ["slime_normal.png"],
         "right": ["slime_normal.png"],
         "up":    ["slime_normal.png"],
         "idle":  ["slime_normal.png"],
-        "jump":  ["slime_preparingtojump.png"]  # new: sprite shown while about to jump over lava
-    }
+        "jump":  ["slime_preparingtojump.png"]  # shown while about to jump over lava
+    },
+}
+GHOST_ALPHA = 240  # ghosts are slightly see-through
+
+_sprite_sets: Dict[tuple, Optional[Dict[str, List[pygame.Surface]]]] = {}
+_projectile_imgs: Dict[int, Optional[pygame.Surface]] = {}
+
+
+def _with_alpha(surf: pygame.Surface, alpha: int) -> pygame.Surface:
+    """`surf` drawn at surface alpha `alpha`: a second view of the same atlas cell (no pixel copy)."""
+    parent = surf.get_parent()
+    if parent is not None:
+        view = parent.subsurface(pygame.Rect(surf.get_offset(), surf.get_size()))
+    else:
+        view = surf.copy()
+    view.set_alpha(alpha)
+    return view
+
+
+def enemy_sprites(kind: str, size: int, alpha: Optional[int] = None) -> Optional[Dict[str, List[pygame.Surface]]]:
+    """Shared frames of sprite set `kind` (see SPRITE_SETS) at `size`, or None if none of its files
+    load. `alpha` selects a translucent variant. Callers must not modify what they get."""
+    key = (kind, size, alpha)
+    if key in _sprite_sets:
+        return _sprite_sets[key]
+    if alpha is None:
+        out = load_enemy_sprites(SPRITE_SETS[kind], size) or None
+    else:
+        base = enemy_sprites(kind, size)
+        out = None
+        if base:
+            views: Dict[int, pygame.Surface] = {}  # one view per frame, even when directions share it
+            out = {d: [views.setdefault(id(s), _with_alpha(s, alpha)) for s in frames] for d, frames in base.items()}
+            tints.pretint(views.values(), (tints.ENEMY_HIT,))
+    _sprite_sets[key] = out
+    return out
+
+
+def projectile_sprite(size: int) -> Optional[pygame.Surface]:
+    """Shared mage projectile image ("mage_magic.png") at `size`, or None if it doesn't load."""
+    if size not in _projectile_imgs:
+        try:
+            _projectile_imgs[size] = atlas.sprite("mage_magic.png", size)
+        except Exception:
+            _projectile_imgs[size] = None
+    return _projectile_imgs[size]
+
+
+def warm_sprites(enemy_size: int, stop=None):
+    """Load every family spawn_enemies can make at `enemy_size` (the sizes make_enemy derives
+    for each kind), plus the boss summons' minion size and all their projectiles. Returns early,
+    between two loads, once `stop` (a threading.Event) is set."""
+    m_size = max(28, int(enemy_size * 0.8))  # boss summons
+    jobs = [
+        lambda: enemy_sprites("slime", max(16, int(enemy_size * 0.75))),
+        lambda: enemy_sprites("ghost", enemy_size, alpha=GHOST_ALPHA),
+        lambda: enemy_sprites("mage", enemy_size),
+        lambda: enemy_sprites("mage", m_size),
+        lambda: enemy_sprites("zombie", enemy_size),
+        lambda: enemy_sprites("zombie", m_size),
+        lambda: projectile_sprite(max(24, int(enemy_size * 0.8))),
+        lambda: projectile_sprite(max(20, int(m_size * 0.7))),
+    ]
+    for job in jobs:
+        if stop is not None and stop.is_set():
+            return
+        job()
+
+
+def spawn_enemies(
+    game_map: List[List[str]],
+    count: int,
+    tile_size: int,
+    offset_x: int,
+    offset_y: int,
+    valid_tile: str = ".",
+    enemy_size: int = 48,
+    speed: float = 1,
+    kind: str = "zombie"  # new: "zombie" (default), "slime", or "mix"
+) -> List[Enemy]:
+    HEIGHT = len(game_map)
+    WIDTH = len(game_map[0]) if HEIGHT > 0 else 0
+    if valid_tile == mapdata.FLOOR_TILE:
+        # precomputed per map (same row-major order as a scan)
+        tiles = mapdata.info_for(game_map).floor
+    else:
+        tiles = [(x, y) for y in range(HEIGHT) for x in range(WIDTH) if game_map[y][x] == valid_tile]
+    candidates: List[Tuple[int, int]] = [(offset_x + x * tile_size, offset_y + y * tile_size) for x, y in tiles]
+    _spawn_rng.shuffle(candidates)
 
     enemies: List[Enemy] = []
 
@@ -1319,7 +1372,7 @@ def spawn_enemies(
             s_size = max(16, int(enemy_size * 0.75))  # slimes slightly smaller
             s_speed = 0.0                             # slimes move by jumping
             s_hp = 10
-            sprite_dict = load_enemy_sprites(slime_files, s_size) or None
+            sprite_dict = enemy_sprites("slime", s_size)
             ex = tlx + (tile_size - s_size) / 2
             ey = tly + (tile_size - s_size) / 2
             # clamp so enemy is fully inside map bounds
@@ -1331,7 +1384,7 @@ def spawn_enemies(
             # more measured hop cadence; start staggered so they don't all jump immediately
             e.hop_cooldown = 1200
             # bias initial hop timer to a shorter value so slimes will attempt a hop soon after spawning
-            e.hop_timer = random.randint(0, max(0, e.hop_cooldown // 3))
+            e.hop_timer = _spawn_rng.randint(0, max(0, e.hop_cooldown // 3))
             # keep the "preparing to jump" pose a bit longer so players have extra reaction time
             # default preparing_duration was small; extend it for slimes only
             e.preparing_duration = max(220, int(getattr(e, "preparing_duration", 120)))
@@ -1342,15 +1395,8 @@ def spawn_enemies(
             g_size = enemy_size 
             g_speed = max(0.3, speed * 0.3)  # Reduced to be slowest
             g_hp = 5
-            sprite_dict = load_enemy_sprites(ghost_files, g_size) or None
-            # make ghost sprites slightly transparent if loaded
-            if sprite_dict:
-                for key, frames in sprite_dict.items():
-                    for surf in frames:
-                        try:
-                            surf.set_alpha(240)
-                        except Exception:
-                            pass
+            # slightly transparent variant of the shared ghost frames
+            sprite_dict = enemy_sprites("ghost", g_size, alpha=GHOST_ALPHA)
             ex = tlx + (tile_size - g_size) / 2
             ey = tly + (tile_size - g_size) / 2
             # clamp positions so ghosts don't end up partially outside the map
@@ -1363,7 +1409,7 @@ def spawn_enemies(
             m_size = enemy_size
             m_speed = max(0.6, speed * 0.8)  # Increased to be second fastest
             m_hp = 15
-            sprite_dict = load_enemy_sprites(mage_files, m_size) or None
+            sprite_dict = enemy_sprites("mage", m_size)
             ex = tlx + (tile_size - m_size) / 2
             ey = tly + (tile_size - m_size) / 2
             ex = _clamp_pos(ex, m_size)
@@ -1379,25 +1425,15 @@ def spawn_enemies(
                 cast_stop_distance=140
             )
             e.kind = "mage"  # NEW: tag for scoring
-            # attempt to load the single projectile PNG "mage_magic.png" from sprites/
-            sprites_dir = Path(__file__).parent.joinpath("sprites")
-            fp = sprites_dir.joinpath("mage_magic.png")
-            if fp.exists():
-                try:
-                    img = pygame.image.load(str(fp)).convert_alpha()
-                    # make projectile much bigger (increase multiplier)
-                    size_px = max(24, int(m_size * 0.8))  # increased from 12/0.5 to 24/0.8
-                    e.projectile_img = pygame.transform.scale(img, (size_px, size_px))
-                except Exception:
-                    e.projectile_img = None
-            else:
-                e.projectile_img = None
+            # shared projectile image ("mage_magic.png")
+            # make projectile much bigger (increase multiplier)
+            e.projectile_img = projectile_sprite(max(24, int(m_size * 0.8)))  # increased from 12/0.5 to 24/0.8
             return e
         # default: zombie
         z_size = enemy_size
         z_speed = speed * 0.8  # Changed to 80% of base speed
         z_hp = 10
-        sprite_dict = load_enemy_sprites(zombie_files, z_size) or None
+        sprite_dict = enemy_sprites("zombie", z_size)
         ex = tlx + (tile_size - z_size) / 2
         ey = tly + (tile_size - z_size) / 2
         ex = _clamp_pos(ex, z_size)
@@ -1409,7 +1445,7 @@ def spawn_enemies(
     for i in range(min(count, len(candidates))):
         tlx, tly = candidates[i]
         if kind == "mix":
-            chosen = random.choice(["zombie", "slime", "ghost", "mage"])
+            chosen = _spawn_rng.choice(["zombie", "slime", "ghost", "mage"])
         else:
             chosen = kind
         enemies.append(make_enemy(chosen, tlx, tly))
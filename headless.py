@@ -0,0 +1,200 @@
+"""Headless simulation runs: no window, no audio, no blocking modal screens.
+
+Usage: python headless.py [--frames N] [--difficulty normal] [--mode main] [--seed S] [--record FILE] [--no-autopilot] [--render]
+
+Must be imported before pygame opens a display or the mixer (it selects SDL's dummy drivers).
+"""
+import os
+import sys
+import math
+import random
+
+# SDL reads these when the display / audio subsystems are initialised.
+# DESCEND_WINDOWED=1 keeps the real video driver so autopilot/bench runs can be watched.
+if not os.environ.get("DESCEND_WINDOWED"):
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+import sounds
+import powerups
+from policies import InteractivePolicies, FrameInput
+
+# logical window used for headless runs (layout offsets depend on it)
+HEADLESS_SIZE = (1280, 800)
+
+
+class HeadlessPolicies(InteractivePolicies):
+    """Auto-resolving policies: fixed frame time, synthetic input, modals answered instantly.
+    By default every frame advances exactly one simulation tick (main.SIM_STEP_MS).
+
+    With `autopilot` the player walks towards the nearest enemy (or the portal once the
+    room is clear) and attacks continuously, so soak runs actually progress through levels.
+    """
+
+    render = False
+
+    def __init__(self, frame_ms=None, autopilot: bool = True, render: bool = False, seed=None):
+        self.frame_ms = frame_ms
+        # the autopilot's own decisions (detours, powerup picks) — seeded for reproducible runs
+        self.rng = random.Random(seed)
+        self.autopilot = autopilot
+        self.render = render
+        self.sim_ms = []
+        self.ticks = 0
+        self.render_ms = []
+        self.outcome = None  # "over" / "won" once a death or victory screen was requested
+        self._observe = None
+        self._last_player = None
+        self._stuck_frames = 0
+        self._detour = None
+        self._detour_frames = 0
+
+    def begin_session(self, observe, info):
+        self._observe = observe
+        if self.frame_ms is None:
+            import main
+            self.frame_ms = main.SIM_STEP_MS
+
+    def frame_dt(self, clock) -> int:
+        # don't sleep: simulate as fast as possible with a constant step
+        return self.frame_ms
+
+    def poll_input(self) -> FrameInput:
+        # drain SDL's queue so it never fills up; real events are ignored
+        pygame.event.pump()
+        pygame.event.clear()
+        if not self.autopilot or self._observe is None:
+            return FrameInput()
+        return self._autopilot_input(self._observe())
+
+    def _autopilot_input(self, view) -> FrameInput:
+        px, py = view["player"]
+        target = None
+        best = None
+        for ex, ey in view["enemies"]:
+            d = math.hypot(ex - px, ey - py)
+            if best is None or d < best:
+                best, target = d, (ex, ey)
+        if target is None:
+            target = view["portal"]
+        if target is None:
+            return FrameInput(mouse=(int(px), int(py)))
+
+        # detect being stuck on a wall and take a short random detour
+        if self._last_player is not None and math.hypot(px - self._last_player[0], py - self._last_player[1]) < 0.5:
+            self._stuck_frames += 1
+        else:
+            self._stuck_frames = 0
+        self._last_player = (px, py)
+        if self._stuck_frames > 20 and self._detour_frames <= 0:
+            self._detour = self.rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+            self._detour_frames = 30
+            self._stuck_frames = 0
+
+        tx, ty = target
+        dx, dy = tx - px, ty - py
+        if self._detour_frames > 0:
+            self._detour_frames -= 1
+            dx, dy = self._detour
+        held = set()
+        # hover just inside weapon reach of the nearest enemy; walk straight onto the portal
+        if view["enemies"] and best is not None and self._detour_frames <= 0:
+            if best < 50:
+                dx, dy = -dx, -dy
+            elif best < 70:
+                dx, dy = 0, 0
+        if dx < -2:
+            held.add(pygame.K_a)
+        elif dx > 2:
+            held.add(pygame.K_d)
+        if dy < -2:
+            held.add(pygame.K_w)
+        elif dy > 2:
+            held.add(pygame.K_s)
+        events = []
+        if view["enemies"]:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(int(tx), int(ty))))
+        return FrameInput(events, frozenset(held), (int(tx), int(ty)))
+
+    def choose_powerup(self, snapshot, surface, rng=None):
+        return self.rng.choice(powerups.roll_choices(rng=rng)), 0
+
+    def pause(self, snapshot, surface):
+        return ("resume", None)
+
+    def options(self, snapshot, surface):
+        return None
+
+    def death_screen(self, surface, score: int = 0, coins: int = 0, high_score=None):
+        self.outcome = "over"
+
+    def victory_screen(self, surface, score: int = 0, coins: int = 0):
+        self.outcome = "won"
+
+    def on_frame(self, frame_no: int, sim_ms: float, render_ms: float, ticks: int = 1, phases=None):
+        self.sim_ms.append(sim_ms)
+        self.ticks += ticks
+        if self.render:
+            self.render_ms.append(render_ms)
+
+
+def init_display(size=HEADLESS_SIZE):
+    """Create the (dummy) display surface and silence audio."""
+    pygame.init()
+    screen = pygame.display.set_mode(size)
+    sounds.disable_audio()
+    return screen
+
+
+def run_headless(frames: int = 3600, difficulty: str = "normal", mode: str = "main",
+                 autopilot: bool = True, render: bool = False, policies=None, seed=None, start=None):
+    """Run one headless session and return (summary, policies) — see main.run_game for the summary."""
+    screen = init_display()
+    import main  # imported late so the dummy drivers are already selected
+    if policies is None:
+        policies = HeadlessPolicies(autopilot=autopilot, render=render, seed=seed)
+    summary = main.run_game(screen, difficulty=difficulty, mode=mode, policies=policies,
+                            max_frames=frames, seed=seed, start=start)
+    return summary, policies
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def _report(label, values):
+    if not values:
+        return
+    mean = sum(values) / len(values)
+    print(f"{label}: mean {mean:.3f} ms  p50 {percentile(values, 50):.3f}  "
+          f"p95 {percentile(values, 95):.3f}  max {max(values):.3f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a headless Descend session.")
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--difficulty", default="normal")
+    parser.add_argument("--mode", default="main")
+    parser.add_argument("--no-autopilot", action="store_true")
+    parser.add_argument("--render", action="store_true", help="also draw frames (to the dummy display)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--record", default=None, help="save the session's input to this .rec.gz file")
+    args = parser.parse_args()
+    pol = HeadlessPolicies(autopilot=not args.no_autopilot, render=args.render, seed=args.seed)
+    policies = pol
+    if args.record:
+        from replay import RecordingPolicies
+        policies = RecordingPolicies(pol, path=args.record)
+    summary, _ = run_headless(args.frames, args.difficulty, args.mode, policies=policies, seed=args.seed)
+    print(f"seed {summary['seed']}  result {summary['result']}  level {summary['level']}  score {summary['score']}  "
+          f"frames {summary['frames']}  ticks {pol.ticks}")
+    _report("simulate", pol.sim_ms)
+    _report("render", pol.render_ms)
+    pygame.quit()
+    sys.exit(0)
@@ -0,0 +1,114 @@
+"""In-run HUD: score, "Level N"/"Endless" label, hearts row, stamina bars and cooldown bar.
+
+Each widget keeps its rendered surface and only rebuilds it when the value it shows changes
+(score, level, hearts/max_hearts, stamina bucket, cooldown fill). `draw()` blits the cached
+surfaces and returns the rects of the widgets that changed, for the dirty-rect present.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+STAMINA_BARS = 3
+STAMINA_W, STAMINA_H, STAMINA_GAP = 60, 20, 10
+COOLDOWN_W, COOLDOWN_H = 100, 12
+
+
+class Hud:
+    def __init__(self, font: Optional[pygame.font.Font], heart_full: pygame.Surface,
+                 heart_empty: pygame.Surface, heart_spacing: int = 0):
+        self.font = font
+        self.heart_full = heart_full
+        self.heart_empty = heart_empty
+        self.heart_spacing = heart_spacing
+        # widget name -> (key the surface was built for, surface, screen position)
+        self._widgets: Dict[str, Tuple[object, Optional[pygame.Surface], Tuple[int, int]]] = {}
+
+    def invalidate(self):
+        """Rebuild everything on the next draw (e.g. after a resolution change)."""
+        self._widgets.clear()
+
+    def _widget(self, name, key, build, changed: List[pygame.Rect]):
+        cached = self._widgets.get(name)
+        if cached is not None and cached[0] == key:
+            return cached
+        surf, pos = build()
+        old = cached
+        cached = (key, surf, pos)
+        self._widgets[name] = cached
+        # repaint where the old surface was and where the new one goes
+        if old is not None and old[1] is not None:
+            changed.append(old[1].get_rect(topleft=old[2]))
+        if surf is not None:
+            changed.append(surf.get_rect(topleft=pos))
+        return cached
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int], map_width: int, *, score: int,
+             level: int, endless: bool, hearts: int, max_hearts: int, stamina: float,
+             cooldown_ratio: Optional[float]) -> List[pygame.Rect]:
+        """Blit the HUD around the map at `offset` (its top-left) of width `map_width`.
+        `cooldown_ratio` is the attack cooldown fill (0..1), or None when the attack is ready."""
+        ox, oy = offset
+        changed: List[pygame.Rect] = []
+
+        # score, left-aligned above the map
+        def build_score():
+            if self.font is None:
+                return None, (ox, 0)
+            surf = self.font.render(f"Score: {score}", True, (255, 255, 255))
+            return surf, (ox, max(10, oy - 100))
+        score_w = self._widget("score", (score, ox, oy), build_score, changed)
+
+        # stamina bars: one fill width per bar
+        fills = tuple(int(STAMINA_W * min(1.0, max(0.0, stamina - i))) for i in range(STAMINA_BARS))
+
+        def build_stamina():
+            surf = pygame.Surface((STAMINA_BARS * STAMINA_W + (STAMINA_BARS - 1) * STAMINA_GAP, STAMINA_H))
+            surf.fill((0, 0, 0))
+            surf.set_colorkey((0, 0, 0))
+            for i, fill_w in enumerate(fills):
+                bx = i * (STAMINA_W + STAMINA_GAP)
+                pygame.draw.rect(surf, (128, 128, 128), (bx, 0, STAMINA_W, STAMINA_H))
+                if fill_w > 0:
+                    pygame.draw.rect(surf, (225, 225, 225), (bx, 0, fill_w, STAMINA_H))
+            return surf, (ox, oy - 40)
+        stamina_w = self._widget("stamina", (fills, ox, oy), build_stamina, changed)
+
+        # attack cooldown bar: red fill while cooling down, solid green when ready
+        cd_fill = None if cooldown_ratio is None else int(COOLDOWN_W * cooldown_ratio)
+
+        def build_cooldown():
+            surf = pygame.Surface((COOLDOWN_W, COOLDOWN_H))
+            surf.fill((100, 100, 100))
+            if cd_fill is None:
+                surf.fill((0, 200, 0))
+            elif cd_fill > 0:
+                surf.fill((255, 0, 0), (0, 0, cd_fill, COOLDOWN_H))
+            return surf, (ox, oy - 60)
+        cooldown_w = self._widget("cooldown", (cd_fill, ox, oy), build_cooldown, changed)
+
+        # hearts row, right-aligned to the map, vertically centred on the cooldown bar
+        heart_w, heart_h = self.heart_full.get_size()
+        hearts_w = max_hearts * heart_w + max(0, max_hearts - 1) * self.heart_spacing
+        start_x = ox + map_width - max_hearts * heart_w
+        heart_y = oy - 60 + (COOLDOWN_H - heart_h) // 2
+
+        def build_hearts():
+            surf = pygame.Surface((max(1, hearts_w), heart_h), pygame.SRCALPHA)
+            for i in range(max_hearts):
+                img = self.heart_full if i < hearts else self.heart_empty
+                surf.blit(img, (i * (heart_w + self.heart_spacing), 0))
+            return surf, (start_x, heart_y)
+        hearts_widget = self._widget("hearts", (hearts, max_hearts, ox, oy), build_hearts, changed)
+
+        # level label centred over the hearts
+        def build_level():
+            if self.font is None or level <= 0:
+                return None, (0, 0)
+            surf = self.font.render("Endless" if endless else f"Level {level}", True, (255, 255, 255))
+            return surf, (start_x + (hearts_w - surf.get_width()) // 2, heart_y - surf.get_height() - 6)
+        level_w = self._widget("level", (level, endless, ox, oy, hearts_w), build_level, changed)
+
+        for _, surf, pos in (score_w, stamina_w, cooldown_w, level_w, hearts_widget):
+            if surf is not None:
+                surface.blit(surf, pos)
+        return changed
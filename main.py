@@ -2,14 +2,29 @@ import pygame
 import sys
 import math
 import os
-import random
+import time
 from pathlib import Path
-from enemies import spawn_enemies, Enemy  # added: import enemy helpers
-import pause  # NEW: pause + death screens
-import powerups  # NEW: powerup selection UI
+from rng import RunRandom  # per-run seeded random streams
+from enemies import spawn_enemies, Enemy, use_rng as use_enemy_rng  # added: import enemy helpers
 import sounds  # NEW: gameplay music volume reference
 from weapons import WEAPON_LIST  # NEW: weapon definitions
 import save  # ADDED: ensure save module imported for high score persistence
+from policies import InteractivePolicies, FrameInput  # UI/input policies (injectable for headless runs)
+from profiler import frame_profiler as prof  # F3 per-phase timing overlay
+from dirty_rects import DirtyRects  # present only the changed screen areas
+from logical_screen import LogicalScreen  # fixed-size render target upscaled to the display
+import render_backend  # software Surface or SDL2 Renderer/Texture frame drawing
+from damage_numbers import DamageNumbers  # glyph-cached floating damage numbers
+from hud import Hud  # cached score / level / hearts / stamina / cooldown widgets
+import stamps  # cached shadow / crosshair stamps
+import tints  # cached hit / spawn-grace tinted sprite variants
+import outlines  # cached armor outline overlays
+import rotations  # shared quantized rotation atlases (swords, projectiles)
+import render_queue as rq  # layered, y-sorted single draw pass
+import particles  # pooled death debris (NumPy when available)
+import atlas  # sprites packed into shared per-size atlas pages
+import warmup  # menu-time background loading of this run's sprites
+import mapdata  # compiled maps with precomputed spawn tiles / portal spot / masks
 
 BASE_DIR = Path(__file__).parent
 def asset_path(*parts):
@@ -51,6 +66,8 @@ def _find_play_music(mode: str | None = None):
 
 def _start_play_music(mode: str | None = None):
     global _game_music_started
+    if not sounds.audio_enabled():
+        return
     if _game_music_started:
         try:
             if pygame.mixer.music.get_busy():
@@ -70,13 +87,49 @@ def _start_play_music(mode: str | None = None):
     except Exception:
         pass
 
+# Fixed simulation rate. Gameplay advances in SIM_STEP_MS ticks regardless of render rate.
+SIM_HZ = 120
+SIM_STEP_MS = 1000.0 / SIM_HZ
+# player speeds (vel, dash_speed) are tuned as pixels per frame at 60 FPS
+BASE_FRAME_MS = 1000.0 / 60
+# catch-up limits: clamp a single frame's time and the ticks run for it
+MAX_FRAME_MS = 250
+MAX_SIM_STEPS = 10
+# Present only changed screen areas (pygame.display.update(rects)); DESCEND_DIRTY_RECTS=0 pushes the
+# whole screen every frame instead.
+DIRTY_RECTS = os.environ.get("DESCEND_DIRTY_RECTS", "1") != "0"
+# DESCEND_LOGICAL_RES=1 draws the game on a fixed-size surface (the map plus LOGICAL_MARGIN on each
+# side, room for the HUD) and upscales it to the display, instead of drawing at native resolution.
+LOGICAL_RES = os.environ.get("DESCEND_LOGICAL_RES", "0") != "0"
+LOGICAL_MARGIN = (48, 120)
+# DESCEND_RENDERER=sdl2 draws frames through SDL's 2D renderer (textures; see render_backend.py),
+# falling back to the default software "surface" backend when no renderer is available.
+RENDERER = os.environ.get("DESCEND_RENDERER", "surface")
+
 # ======================
 # GAME LOOP
 # ======================
-def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
+def run_game(screen=None, difficulty: str = "normal", mode: str = "main", policies=None, max_frames=None, seed=None, start=None):
     """Run the game loop. If `screen` (a pygame Surface / display) is provided the game will use it
        instead of creating a new fullscreen window — this allows returning to the menu cleanly.
-       `mode` is currently accepted for compatibility with menu.run_menu and is not used."""
+       `mode` selects "main" (campaign) or "endless".
+       `policies` supplies input, frame timing and the modal UIs (powerup picker, pause,
+       death/victory screens); defaults to InteractivePolicies(). `max_frames` stops
+       the run after that many frames (used by headless soak/profiling runs).
+       `seed` makes the run reproducible (maps, spawns, enemy AI, particles, powerup offers);
+       a random seed is chosen when omitted.
+       `start` begins the run somewhere other than level 1 (bench scenarios), e.g.
+       {"level": 18} or {"map": 7, "enemies": 10, "kind": "mix", "crowd": 90} — see _apply_start.
+       Returns a summary dict: {"result": "over"|"won"|"stopped", "score", "level", "frames", "seed"}."""
+    if policies is None:
+        policies = InteractivePolicies()
+        # optional input capture of real play sessions (see replay.py)
+        record_dir = os.environ.get("DESCEND_RECORD_DIR")
+        if record_dir:
+            from replay import RecordingPolicies
+            policies = RecordingPolicies(policies, out_dir=record_dir)
+    # sprites are loaded below from the caches the menu's warmup thread fills; let it finish first
+    warmup.wait()
     # --- Common init ---
     created_display = False
     if screen is None:
@@ -89,43 +142,27 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         # reuse the provided display surface (menu's SCREEN)
         win = screen
     clock = pygame.time.Clock()
+    dirty = DirtyRects(enabled=DIRTY_RECTS)
+    queue = rq.RenderQueue()  # per-frame draw submissions, flushed once at the end of render()
+    # Seeded random streams for this run (see rng.STREAMS)
+    run_rng = RunRandom(seed)
+    maps_rng = run_rng.stream("maps")
+    particle_rng = run_rng.stream("particles")
+    powerup_rng = run_rng.stream("powerups")
+    use_enemy_rng(spawn=run_rng.stream("spawn"), ai=run_rng.stream("enemy_ai"))
     _start_play_music(mode)  # start gameplay music (mode selects EndlessBGM for endless)
 
     # ======================
     # MAP DATA AND LOADER
     # ======================
     TILE_SIZE = 48
-    WIDTH = 13
-    HEIGHT = 13
-
-    WALL_TILES = {"-", "|", "A", "B", "C", "D", "#", "0", "I"}
-    LAVA_TILE = "X"
-    TRAP_TILE = "T"
+    WIDTH = mapdata.WIDTH
+    HEIGHT = mapdata.HEIGHT
 
     def load_map_from_file(filename):
-        """Load a map file from project maps/ folder. If missing, return a default floor map.
-           Ensures result is exactly HEIGHT x WIDTH by padding/truncating."""
-        full_path = asset_path("maps", filename)
-        if os.path.exists(full_path):
-            with open(full_path, "r", encoding="utf-8") as f:
-                raw_lines = [list(line.rstrip("\n")) for line in f.readlines()]
-        else:
-            print(f"Warning: map file not found: {full_path}. Using empty floor map.")
-            raw_lines = [['.' for _ in range(WIDTH)] for _ in range(HEIGHT)]
-
-        # Normalize to HEIGHT x WIDTH
-        lines = []
-        for r in range(HEIGHT):
-            if r < len(raw_lines):
-                row = raw_lines[r]
-                if len(row) < WIDTH:
-                    row = row + ['.'] * (WIDTH - len(row))
-                elif len(row) > WIDTH:
-                    row = row[:WIDTH]
-            else:
-                row = ['.'] * WIDTH
-            lines.append(row)
-        return lines
+        """Tile grid of a map in the project maps/ folder (compiled once, see mapdata.py). If missing,
+           a default floor map. Always HEIGHT x WIDTH."""
+        return mapdata.load(filename).tiles
 
     # --- Add MAPS definition so pick_map() can use it ---
     MAPS = [load_map_from_file(f"map{i}.txt") for i in range(1, 16)]
@@ -133,7 +170,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
     # Original staged non‑repeating normal progression: (1-5), (6-10), (11-15)
     stage_indices = [list(range(0,5)), list(range(5,10)), list(range(10,15))]
     for lst in stage_indices:
-        random.shuffle(lst)
+        maps_rng.shuffle(lst)
     current_stage = 0
     index_in_stage = 0
 
@@ -145,19 +182,23 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         nonlocal stage_indices, current_stage, index_in_stage
         stage_indices = [list(range(0,5)), list(range(5,10)), list(range(10,15))]
         for lst in stage_indices:
-            random.shuffle(lst)
+            maps_rng.shuffle(lst)
         current_stage = 0
         index_in_stage = 0
 
+    def _roll_floor_choices(game_map):
+        """Pick a random floor sprite for every '.' tile of a map."""
+        floor_choices = [[None for _ in range(WIDTH)] for _ in range(HEIGHT)]
+        for x, y in mapdata.info_for(game_map).floor:
+            floor_choices[y][x] = maps_rng.choice(FLOOR_SPRITES)
+        return floor_choices
+
     # Boss levels: inserted AFTER normal levels 5, 10, 15 -> total 18 levels (15 normal + 3 boss)
     # Boss map always uses map1 (index 0) and may repeat even if map1 already appeared as a normal level.
     def get_boss_map():
         game_map = MAPS[0]
-        floor_choices = [[None for _ in range(WIDTH)] for _ in range(HEIGHT)]
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                if game_map[y][x] == ".":
-                    floor_choices[y][x] = random.choice(FLOOR_SPRITES)
+        floor_choices = _roll_floor_choices(game_map)
+        bake_map_layer(game_map, floor_choices)
         return game_map, floor_choices
 
     def pick_normal_map():
@@ -170,19 +211,14 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         idx = stage_indices[current_stage][index_in_stage]
         index_in_stage += 1
         game_map = MAPS[idx]
-        floor_choices = [[None for _ in range(WIDTH)] for _ in range(HEIGHT)]
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                if game_map[y][x] == ".":
-                    floor_choices[y][x] = random.choice(FLOOR_SPRITES)
+        floor_choices = _roll_floor_choices(game_map)
+        bake_map_layer(game_map, floor_choices)
         return game_map, floor_choices
 
     def load_sprite(filename, size=TILE_SIZE, rotation=0):
-        """Load sprite from project sprites/ folder. Return visible placeholder on failure."""
-        full_path = asset_path("sprites", filename)
+        """Load sprite from project sprites/ folder (via the atlas). Return visible placeholder on failure."""
         try:
-            img = pygame.image.load(full_path).convert_alpha()
-            img = pygame.transform.scale(img, (size, size))
+            img = atlas.sprite(filename, size)
             if rotation != 0:
                 img = pygame.transform.rotate(img, rotation)
             return img
@@ -328,6 +364,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                 current_projectile_img = load_sprite(current_weapon.projectile_sprite or "sunball.png", size=32)
             except Exception:
                 current_projectile_img = None
+        rotations.prewarm(current_projectile_img)
 
     # Poison level from powerups (stacks)
     poison_level = 0
@@ -344,7 +381,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
 
     # Stun indicator sprite (native size)
     try:
-        stunned_img = pygame.image.load(asset_path("sprites", "stunned.png")).convert_alpha()
+        stunned_img = atlas.sprite("stunned.png")
     except Exception:
         # fallback to scaled loader if native load fails
         stunned_img = load_sprite("stunned.png", size=48)
@@ -378,20 +415,58 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
     # game_map, floor_choices = pick_map()  # (removed to ensure all 15 maps are played)
     # level_number = 1 if game_map else 0  # (duplicate; real initialization occurs below)
 
-    def draw_map(win, game_map, floor_choices, offset_x, offset_y, trap_active):
+    # NEW: pre-rendered static map layer. Floor (incl. floor_choices), walls and lava are baked
+    # into one surface when a map is chosen; trap tiles are patched in place only when they flip.
+    map_layer = None
+    map_layer_src = (None, None)  # (game_map, floor_choices) the layer was baked from
+    map_layer_traps = []          # (x, y) pixel spots of 'T' tiles inside the layer
+    map_layer_trap_state = None   # trap state currently drawn into the layer
+
+    def bake_map_layer(game_map, floor_choices):
+        nonlocal map_layer, map_layer_src, map_layer_traps, map_layer_trap_state
+        layer = pygame.Surface((WIDTH * TILE_SIZE, HEIGHT * TILE_SIZE)).convert()
+        layer.fill((0, 0, 0))
+        traps = []
         for y in range(HEIGHT):
             for x in range(WIDTH):
                 tile = game_map[y][x]
-                if tile == ".":
+                if tile == mapdata.FLOOR_TILE:
                     sprite = floor_choices[y][x]
-                elif tile == "T":
-                    sprite = trap_on_img if trap_active else trap_off_img
+                elif tile == mapdata.TRAP_TILE:
+                    traps.append((x * TILE_SIZE, y * TILE_SIZE))
+                    continue
                 else:
                     sprite = SPRITES[tile]
-                win.blit(sprite, (offset_x + x*TILE_SIZE, offset_y + y*TILE_SIZE))
+                layer.blit(sprite, (x * TILE_SIZE, y * TILE_SIZE))
+        map_layer = layer
+        map_layer_src = (game_map, floor_choices)
+        map_layer_traps = traps
+        map_layer_trap_state = None
+        dirty.invalidate()  # new map: repaint the whole screen once
+
+    def invalidate_map_layer():
+        """Force a rebake (e.g. after the display mode changed)."""
+        nonlocal map_layer_src
+        map_layer_src = (None, None)
+
+    def draw_map(game_map, floor_choices, offset_x, offset_y, trap_active):
+        nonlocal map_layer_trap_state
+        changed = False
+        if map_layer_src[0] is not game_map or map_layer_src[1] is not floor_choices:
+            bake_map_layer(game_map, floor_choices)
+            changed = True
+        if map_layer_trap_state != trap_active:
+            sprite = trap_on_img if trap_active else trap_off_img
+            for tx, ty in map_layer_traps:
+                map_layer.fill((0, 0, 0), (tx, ty, TILE_SIZE, TILE_SIZE))
+                map_layer.blit(sprite, (tx, ty))
+                dirty.add((offset_x + tx, offset_y + ty, TILE_SIZE, TILE_SIZE))
+            map_layer_trap_state = trap_active
+            changed = True
+        backend.background(map_layer, (offset_x, offset_y), changed)
     
-    def draw_crosshair(win, player_pos):
-        mx, my = pygame.mouse.get_pos()
+    def draw_crosshair(win, player_pos, mouse_pos):
+        mx, my = mouse_pos
         px, py = player_pos
         angle = math.atan2(my - py, mx - px)
 
@@ -400,7 +475,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         cross_y = py + radius * math.sin(angle)
 
         # small circle as crosshair marker
-        pygame.draw.circle(win, (255, 255, 255), (int(cross_x), int(cross_y)), 8, 4)
+        ring = stamps.ring(8, 4)
+        return win.blit(ring, (int(cross_x) - 8, int(cross_y) - 8))
     
     def draw_shadow(win, x, y, char_size, game_map, offset_x, offset_y):
         # Shadow ellipse dimensions
@@ -409,9 +485,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         shadow_x = x + (char_size - shadow_w) / 2
         shadow_y = y + char_size - shadow_h / 2
 
-        shadow = pygame.Surface((int(shadow_w), int(shadow_h)), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow, (0, 0, 0, 100), shadow.get_rect())
-        win.blit(shadow, (shadow_x, shadow_y))
+        return win.blit(stamps.shadow(shadow_w, shadow_h, 100), (shadow_x, shadow_y))
 
     def can_move(new_x, new_y, game_map, dashing=False):
         foot_width = char_size // 2
@@ -419,6 +493,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         foot_x = new_x + (char_size - foot_width) // 2
         foot_y = new_y + char_size - foot_height - 5
         foot_rect = pygame.Rect(foot_x, foot_y, foot_width, foot_height)
+        info = mapdata.info_for(game_map)
 
         for px, py in [
             (foot_rect.left, foot_rect.bottom - 1),
@@ -431,21 +506,15 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             if tile_x < 0 or tile_x >= WIDTH or tile_y < 0 or tile_y >= HEIGHT:
                 return False
             
-            tile = game_map[tile_y][tile_x]
-            if tile in WALL_TILES:
+            i = tile_y * WIDTH + tile_x
+            if info.walls[i]:
                 return False
-            if tile == LAVA_TILE and not dashing:
+            if info.lava[i] and not dashing:
                 return False
 
         return True
     
-    def precompute_rotations(image, step=3):
-        rotations = {}
-        for angle in range(0, 360, step):
-            rotations[angle] = pygame.transform.rotate(image, -angle)
-        return rotations
-
-    sword_rotations = precompute_rotations(sword_img, step=3)
+    rotations.prewarm(sword_img)
     # (ensure projectile sprite for initial weapon if needed)
     if current_weapon.projectile_damage > 0:
         try:
@@ -460,11 +529,9 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
     # CHARACTER SETUP
     # ======================
     def load_char_sprite(name, size):
-        """Load character sprite from project sprites/ folder or return placeholder."""
-        full_path = asset_path("sprites", name)
+        """Load character sprite from project sprites/ folder (via the atlas) or return placeholder."""
         try:
-            img = pygame.image.load(full_path).convert_alpha()
-            return pygame.transform.scale(img, (size, size))
+            return atlas.sprite(name, size)
         except Exception:
             surf = pygame.Surface((size, size), pygame.SRCALPHA)
             surf.fill((90, 120, 200, 255))
@@ -506,6 +573,9 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         ]
     }
 
+    # every level starts with the spawn-grace tint and hits flash red: tint all frames up front
+    tints.pretint([img for frames in animations.values() for img in frames], (tints.PLAYER_GRACE, tints.PLAYER_HIT))
+
     key_to_dir = {
         pygame.K_w: "up",
         pygame.K_s: "down",
@@ -529,6 +599,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         res0 = pick_normal_map()
         if res0:
             game_map, floor_choices = res0
+    # wall / lava / trap masks of the current map (flat, y * WIDTH + x; see mapdata.py)
+    map_info = mapdata.info_for(game_map)
     level_number = 1 if game_map else 0  # NEW: level counter
     is_boss_level = False  # track if current level is a boss level
     normal_levels_completed = 0  # how many normal (non-boss) levels fully cleared
@@ -595,7 +667,16 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             return 2.0
         return 1.0
 
-    screen_width, screen_height = win.get_size()
+    # `canvas` is what frames are drawn on: the display itself, or the fixed logical surface
+    logical = None
+    if LOGICAL_RES:
+        logical = LogicalScreen(win, (WIDTH * TILE_SIZE + 2 * LOGICAL_MARGIN[0],
+                                      HEIGHT * TILE_SIZE + 2 * LOGICAL_MARGIN[1]))
+    canvas = logical.surface if logical else win
+    backend = render_backend.create(RENDERER, win, logical)
+    if backend.name != "surface":
+        dirty.enabled = False  # the renderer redraws and presents whole frames
+    screen_width, screen_height = canvas.get_size()
     offset_x = (screen_width - WIDTH * TILE_SIZE) // 2
     offset_y = (screen_height - HEIGHT * TILE_SIZE) // 2
 
@@ -640,8 +721,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                 best_endless = 0
             # show death screen (coins 0, use high_score param to display endless best)
             try:
-                from pause import show_death_screen
-                show_death_screen(win, score=int(score), coins=0, high_score=best_endless)
+                backend.sync()
+                policies.death_screen(win, score=int(score), coins=0, high_score=best_endless)
             except Exception:
                 pass
             return  # ENDLESS path finished
@@ -658,7 +739,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             pass
         # show Game Over screen with score/coins
         try:
-            pause.show_death_screen(win, score=score, coins=coins_gained)
+            backend.sync()
+            policies.death_screen(win, score=score, coins=coins_gained)
         except Exception:
             pass
 
@@ -682,7 +764,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         except Exception:
             pass
         try:
-            pause.show_victory_screen(win, score=final_score, coins=coins_gained)
+            backend.sync()
+            policies.victory_screen(win, score=final_score, coins=coins_gained)
         except Exception:
             pass
 
@@ -692,28 +775,8 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
     # NEW: one-time per round flag (after clear we show picker, then spawn portal)
     round_cleared = False
 
-    # helper: pick a bottom-most '.' tile near center for the portal
-    def _find_portal_spot(cur_map):
-        center_x = WIDTH // 2
-        # scan from bottom upwards, prefer positions near center
-        for ty in range(HEIGHT - 2, -1, -1):
-            order = [center_x]
-            for k in range(1, WIDTH):
-                if center_x - k >= 0: order.append(center_x - k)
-                if center_x + k < WIDTH: order.append(center_x + k)
-            for tx in order:
-                try:
-                    if cur_map[ty][tx] == '.':
-                        px = offset_x + tx * TILE_SIZE
-                        py = offset_y + ty * TILE_SIZE
-                        return px, py
-                except Exception:
-                    continue
-        # fallback: near bottom center
-        return offset_x + center_x * TILE_SIZE, offset_y + max(0, HEIGHT - 2) * TILE_SIZE
-
     def do_map_transition():
-        nonlocal game_map, floor_choices, x, y, pressed_dirs, is_dashing, frame_index, enemies, spawn_grace_timer, level_transitioning, vel, dash_speed, attack_cooldown, stamina_regen_rate, sword_damage, projectile_damage_bonus, shield_count, poison_level, game_finished, level_number, is_boss_level, normal_levels_completed, portal_active, portal_rect, round_cleared
+        nonlocal game_map, map_info, floor_choices, x, y, pressed_dirs, is_dashing, frame_index, enemies, spawn_grace_timer, level_transitioning, vel, dash_speed, attack_cooldown, stamina_regen_rate, sword_damage, projectile_damage_bonus, shield_count, poison_level, game_finished, level_number, is_boss_level, normal_levels_completed, portal_active, portal_rect, round_cleared
         if level_transitioning or game_finished:
             return
         level_transitioning = True
@@ -729,6 +792,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                 _reset_stage_order()
                 res = pick_normal_map()
             game_map, floor_choices = res
+            map_info = mapdata.info_for(game_map)
             level_number += 1
             is_boss_level = False
             # Reset player state & spawn enemies
@@ -771,6 +835,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                 _on_game_win()
                 return
         game_map, floor_choices = res
+        map_info = mapdata.info_for(game_map)
         level_number += 1  # increment visible level count (includes boss levels)
         is_boss_level = next_is_boss
 
@@ -922,12 +987,11 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         round_cleared = False
         level_transitioning = False
 
-    # --- DEATH PARTICLES SYSTEM ---
-    # Each particle: {'x','y','vx','vy','size','color',(optional) 'life_ms'}
-    death_particles = []
+    # --- DEATH PARTICLES SYSTEM --- (pooled arrays, see particles.py)
+    death_particles = particles.particle_pool()
 
     def spawn_death_particles(enemy: Enemy, count: int = None):
-        """Spawn pixel debris from an enemy's current sprite. If sprite pixels are transparent skip them."""
+        """Spawn pixel debris from an enemy's current sprite (colors from its opaque pixels)."""
         # choose a surface to sample pixels from (prefer current facing frame)
         surf = None
         try:
@@ -944,80 +1008,18 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         if surf is None:
             surf = pygame.Surface((enemy.size, enemy.size), pygame.SRCALPHA)
             surf.fill((180, 60, 60))
-
-        surf_w, surf_h = surf.get_size()
         # number of particles proportional to enemy area (clamped)
         if count is None:
             count = max(8, min(40, (enemy.size * enemy.size) // 64))
+        death_particles.burst(surf, enemy.x, enemy.y, enemy.size, count, particle_rng)
 
-        for _ in range(count):
-            # pick a random pixel within sprite; skip transparent pixels up to a few tries
-            col = None
-            for _try in range(6):
-                sx = random.randint(0, surf_w - 1)
-                sy = random.randint(0, surf_h - 1)
-                try:
-                    c = surf.get_at((sx, sy))
-                except Exception:
-                    c = pygame.Color(200, 60, 60, 255)
-                # skip fully transparent pixels
-                if getattr(c, "a", 255) == 0:
-                    continue
-                # FORCE OPAQUE: ignore any source alpha, use full opacity
-                col = (c.r, c.g, c.b, 255)
-                break
-            if col is None:
-                col = (180, 60, 60, 255)
-
-            # world position: enemy top-left + sampled pixel offset
-            px = enemy.x + (sx if 'sx' in locals() else enemy.size//2)
-            py = enemy.y + (sy if 'sy' in locals() else enemy.size//2)
-
-            # initial velocity: scatter outward and upward a bit
-            vx = random.uniform(-1.8, 1.8) * (1.0 + enemy.size / 48.0)
-            vy = random.uniform(-3.5, -1.0) * (1.0 + enemy.size / 48.0)
-
-            death_particles.append({
-                'x': px,
-                'y': py,
-                'vx': vx,
-                'vy': vy,
-                'size': max(2, int(enemy.size * 0.12)),
-                'color': col,
-                'life': random.randint(900, 1800)  # ms before fade/remove (kept for potential logic)
-            })
-
-    def update_and_draw_particles(dt: int, surface: pygame.Surface):
-        """Update death_particles physics and draw them. Particles fall under gravity and continue past the bottom of the screen until off-bound."""
-        gravity = 0.9 * (dt / 16.0)
-        screen_h = surface.get_height()
-        # work on a copy so removals are safe
-        for p in list(death_particles):
-            # physics
-            p['vy'] += gravity
-            p['x'] += p['vx'] * (dt / 16.0)
-            p['y'] += p['vy'] * (dt / 16.0)
-
-            # NOTE: DO NOT settle at bottom — allow particles to continue falling off-screen.
-            # lifetime (kept but not used for alpha fade)
-            p['life'] -= dt
-
-            # DRAW OPAQUE: use stored color but force alpha to fully opaque
-            col = p['color'][:3] + (255,)
-            try:
-                rect = pygame.Rect(int(p['x']), int(p['y']), p['size'], p['size'])
-                s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                s.fill(col)
-                surface.blit(s, rect.topleft)
-            except Exception:
-                pass
+    def update_particles(dt: int):
+        """Advance death_particles physics. Particles fall under gravity and continue past the bottom of the screen until off-bound."""
+        death_particles.update(dt, canvas.get_height())
 
-            # remove when particle has gone off the bottom of the surface (plus a small margin)
-            if p['y'] > screen_h + p['size'] + 50:
-                try:
-                    death_particles.remove(p)
-                except Exception:
-                    pass
+    def draw_particles(surface: pygame.Surface):
+        """Draw death_particles at their current positions; returns the areas they cover (a list of rects)."""
+        return death_particles.draw(surface)
 
     # --- END death particles ---
 
@@ -1086,14 +1088,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
     heart_spacing = 0
     on_trap_prev = False
 
-    run = True
     # NEW: cheat sequence tracking to unlock Q insta-kill
     cheat_sequence = "descend"
     cheat_progress = 0
     cheat_unlocked = False
 
     # Floating damage indicators (use bundled font if available)
-    dmg_indicators = []  # each: {'x','y','text','color','life','vy'}
     # NEW: score counter
     score = 0
     try:
@@ -1112,22 +1112,91 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             level_font = pygame.font.SysFont("arial", 24, bold=True)
         except Exception:
             level_font = None
-    while run:
-        dt = clock.tick(60)
-        # refresh armor flag from save in case player equipped it in shop before resuming
-        try:
-            _latest = save.load_player_data() or {}
-            eq_arm = (_latest.get("equipped_armor") or "").strip()
-            swiftness_outline = (eq_arm == "Swiftness Armor")
-            tank_outline = (eq_arm == "Tank Armor")
-            life_outline = (eq_arm == "Life Armor")
-            regen_outline = (eq_arm == "Regen Armor")
-            thorns_outline = (eq_arm == "Thorns Armor")
-            # NEW: ensure thorns reflects accumulated damage powerups if armor equipped mid‑run
-            if thorns_outline:
-                thorns_damage = base_thorns_damage + damage_powerup_total
-        except Exception:
-            pass
+    dmg_numbers = DamageNumbers(dmg_font)
+    hud = Hud(level_font, heart_full, heart_empty, heart_spacing)
+    # armor outline flags follow the profile: the shop publishes a change event when the
+    # player equips armor (e.g. from the menu while paused), so nothing is read per frame
+    def _on_armor_changed(changes):
+        nonlocal swiftness_outline, tank_outline, life_outline, regen_outline, thorns_outline, thorns_damage
+        eq_arm = (changes.get("equipped_armor") or "").strip()
+        swiftness_outline = (eq_arm == "Swiftness Armor")
+        tank_outline = (eq_arm == "Tank Armor")
+        life_outline = (eq_arm == "Life Armor")
+        regen_outline = (eq_arm == "Regen Armor")
+        thorns_outline = (eq_arm == "Thorns Armor")
+        # NEW: ensure thorns reflects accumulated damage powerups if armor equipped mid‑run
+        if thorns_outline:
+            thorns_damage = base_thorns_damage + damage_powerup_total
+    save.subscribe(_on_armor_changed, keys=("equipped_armor",))
+
+
+    # Enemy environment queries passed to Enemy.update (they read the current map each call)
+    def make_is_walkable(size):
+        def is_walkable(new_x: float, new_y: float) -> bool:
+            foot_width = int(size * 0.5)
+            foot_height = 10
+            foot_x = int(new_x + (size - foot_width) / 2)
+            foot_y = int(new_y + size - foot_height)
+            for pxp, pyp in [
+                (foot_x, foot_y + foot_height - 1),
+                (foot_x + foot_width - 1, foot_y + foot_height - 1),
+                (foot_x + foot_width // 2, foot_y + foot_height - 1)
+            ]:
+                tile_x = int((pxp - offset_x) // TILE_SIZE)
+                tile_y = int((pyp - offset_y) // TILE_SIZE)
+                if tile_x < 0 or tile_x >= WIDTH or tile_y < 0 or tile_y >= HEIGHT:
+                    return False
+                if not map_info.walkable[tile_y * WIDTH + tile_x]:
+                    return False
+            return True
+        return is_walkable
+
+    def on_trap(px: int, py: int) -> bool:
+        tile_x = int((px - offset_x) // TILE_SIZE)
+        tile_y = int((py - offset_y) // TILE_SIZE)
+        if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
+            return map_info.traps[tile_y * WIDTH + tile_x] and trap_active
+        return False
+
+    def is_lava(px: float, py: float) -> bool:
+        tile_x = int((px - offset_x) // TILE_SIZE)
+        tile_y = int((py - offset_y) // TILE_SIZE)
+        if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
+            return map_info.lava[tile_y * WIDTH + tile_x]
+        return False
+
+    # new: wall test used by enemy projectiles (True for wall tiles or out-of-bounds)
+    def is_wall(px: float, py: float) -> bool:
+        tile_x = int((px - offset_x) // TILE_SIZE)
+        tile_y = int((py - offset_y) // TILE_SIZE)
+        # treat out-of-bounds as a blocking wall so projectiles disappear there
+        if tile_x < 0 or tile_x >= WIDTH or tile_y < 0 or tile_y >= HEIGHT:
+            return True
+        return map_info.walls[tile_y * WIDTH + tile_x]
+
+    # last polled pointer position (aim direction + crosshair)
+    mouse_pos = (0, 0)
+    # player position at the previous simulation tick (render interpolation)
+    prev_x, prev_y = x, y
+
+    def _discard_modal_time():
+        """Drop the wall-clock time spent in a blocking modal (pause, options, powerup picker)
+        so timers and enemies don't jump ahead: restart the frame clock from now."""
+        clock.tick()
+        dirty.invalidate()  # the modal drew over the whole screen
+
+    def simulate(dt, inp):
+        """Advance the game by one frame of `dt` ms using the polled input `inp` (policies.FrameInput).
+        Does not draw; the only display access is the snapshot handed to modal policies.
+        Returns None while the run continues, "over" on death/quit, "won" after the final level."""
+        nonlocal attack_cooldown, attack_timer, attacking, backend, cheat_progress, cheat_unlocked, cooldown_timer, current_angle, damage_powerup_total
+        nonlocal dash_dir, dash_speed, dash_timer, frame_index, frame_timer, hearts, invincible_timer
+        nonlocal is_dashing, last_direction, offset_x, offset_y, on_trap_prev, player_center, player_flash_timer, player_kb_time
+        nonlocal player_kb_vx, player_kb_vy, player_projectiles, poison_level, portal_active, portal_rect, projectile_damage_bonus, regen_timer_ms
+        nonlocal round_cleared, score, screen_height, screen_width, shield_angle, shield_count, spawn_grace_timer, stamina
+        nonlocal stamina_regen_rate, swing_start_angle, sword_damage, thorns_damage, trap_active, trap_timer, vel, x
+        nonlocal y, mouse_pos
+        mouse_pos = inp.mouse
 
         # decrement player invincibility & knockback timers
         if invincible_timer > 0:
@@ -1171,11 +1240,13 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             else:
                 regen_timer_ms = 0
 
-        for event in pygame.event.get():
+
+        prof.mark()
+        for event in inp.events:
             if event.type == pygame.QUIT:
                 # Show Game Over on hard window close and persist 50:1 conversion
                 _on_game_over()
-                return
+                return "over"
             # Track movement key presses/releases to determine facing priority
             if event.type == pygame.KEYDOWN:
                 # REMOVED: weapon switching via number keys (1-5)
@@ -1208,17 +1279,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 # pause overlay
                 try:
-                    snapshot = win.copy()
+                    snapshot = backend.snapshot()
                 except Exception:
                     snapshot = None
-                # Freeze grace timer while paused: measure paused duration and credit it back
-                pause_start = pygame.time.get_ticks()
-                res = pause.show_pause_overlay(snapshot, win)
-                try:
-                    paused_ms = max(0, pygame.time.get_ticks() - pause_start)
-                    spawn_grace_timer += paused_ms
-                except Exception:
-                    pass
+                # Freeze every timer (incl. spawn grace) while paused: the paused time is dropped
+                res = policies.pause(snapshot, win)
+                _discard_modal_time()
                 if res and res[0] == "resume":
                     # simply continue
                     continue
@@ -1226,44 +1292,37 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                     # open options, then go back to pause menu instead of resuming
                     while True:
                         try:
-                            import menu  # ensure menu module is available before calling show_options
-                            opt_start = pygame.time.get_ticks()
-                            opt_res = menu.show_options(snapshot, win)
-                            try:
-                                paused_ms2 = max(0, pygame.time.get_ticks() - opt_start)
-                                spawn_grace_timer += paused_ms2
-                            except Exception:
-                                pass
+                            opt_res = policies.options(snapshot, win)
                             if opt_res and opt_res[0] == "resolution_changed":
                                 new_size = opt_res[1]
+                                backend.close()
                                 pygame.display.set_mode(new_size)
-                                screen_width, screen_height = win.get_size()
+                                if logical:
+                                    logical.layout()
+                                backend = render_backend.create(RENDERER, win, logical)
+                                screen_width, screen_height = canvas.get_size()
                                 offset_x = (screen_width - WIDTH * TILE_SIZE) // 2
                                 offset_y = (screen_height - HEIGHT * TILE_SIZE) // 2
+                                invalidate_map_layer()
+                                hud.invalidate()
                         except Exception:
                             pass
                         # after closing options, show the pause overlay again
-                        pause_start2 = pygame.time.get_ticks()
-                        res2 = pause.show_pause_overlay(snapshot, win)
-                        try:
-                            paused_ms3 = max(0, pygame.time.get_ticks() - pause_start2)
-                            spawn_grace_timer += paused_ms3
-                        except Exception:
-                            pass
+                        res2 = policies.pause(snapshot, win)
                         if res2 and res2[0] == "options":
                             # loop back into options again
                             continue
                         if res2 and res2[0] == "menu":
                             # quitting to menu -> Game Over + coin conversion (50:1)
                             _on_game_over()
-                            return
+                            return "over"
                         # default: resume game
                         break
                     continue
                 if res and res[0] == "menu":
                     # quitting to menu -> Game Over + coin conversion (50:1)
                     _on_game_over()
-                    return
+                    return "over"
 
             # REPLACED: developer hotkey — insta-clear all enemies (now requires cheat unlocked)
             if event.type == pygame.KEYDOWN and event.key == pygame.K_q and cheat_unlocked:
@@ -1290,15 +1349,15 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 if not is_dashing and stamina >= 1.0:
                     # Determine dash direction from current key state; fallback to last_direction
-                    keys = pygame.key.get_pressed()
+                    keys = inp.held
                     dx_tmp, dy_tmp = 0, 0
-                    if keys[pygame.K_a]:
+                    if pygame.K_a in keys:
                         dx_tmp -= 1
-                    if keys[pygame.K_d]:
+                    if pygame.K_d in keys:
                         dx_tmp += 1
-                    if keys[pygame.K_w]:
+                    if pygame.K_w in keys:
                         dy_tmp -= 1
-                    if keys[pygame.K_s]:
+                    if pygame.K_s in keys:
                         dy_tmp += 1
                     if dx_tmp == 0 and dy_tmp == 0:
                         if last_direction == "left":
@@ -1329,7 +1388,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                     attacking = True
                     attack_timer = attack_duration
                     cooldown_timer = attack_duration + attack_cooldown
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = inp.mouse
                     px = x + char_size // 2
                     py = y + char_size // 2
                     player_center = (px, py)
@@ -1357,9 +1416,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                             # CHANGED: include upgrade damage bonus for projectiles
                             'damage': current_weapon.projectile_damage + projectile_damage_bonus + projectile_upgrade_damage,
                             'img': current_projectile_img,
+                            'angle': math.degrees(math.atan2(dyn, dxn)),  # faces its flight direction
                             'radius': max(10, current_projectile_img.get_width() // 2)
                         })
 
+
+        prof.lap("events")
         # --- APPLY PLAYER KNOCKBACK (if active) ---
         knocked = False
         if player_kb_time > 0:
@@ -1391,18 +1453,18 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         if is_dashing:
             dx, dy = dash_dir
         else:
-            keys = pygame.key.get_pressed()
+            keys = inp.held
             if knocked:
                 dx = dy = 0
             else:
                 # Use current key state for movement so walking doesn't depend on pressed_dirs
-                if keys[pygame.K_a]:
+                if pygame.K_a in keys:
                     dx -= 1
-                if keys[pygame.K_d]:
+                if pygame.K_d in keys:
                     dx += 1
-                if keys[pygame.K_w]:
+                if pygame.K_w in keys:
                     dy -= 1
-                if keys[pygame.K_s]:
+                if pygame.K_s in keys:
                     dy += 1
                 if dx != 0 and dy != 0:
                     norm = math.sqrt(dx*dx + dy*dy)
@@ -1436,16 +1498,18 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                     tile_x = int((pxp - offset_x) // TILE_SIZE)
                     tile_y = int((pyp - offset_y) // TILE_SIZE)
                     if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
-                        if game_map[tile_y][tile_x] == LAVA_TILE:
+                        if map_info.lava[tile_y * WIDTH + tile_x]:
                             # death by lava
                             try: sounds.play_sfx('LavaDeath.mp3')
                             except Exception: pass
                             _on_player_death()
-                            return
+                            return "over"
                 is_dashing = False
                 if pressed_dirs:
                     last_direction = pressed_dirs[-1]
 
+        # vel / dash_speed are tuned as pixels per 60 Hz frame; scale to this tick's length
+        speed *= dt / BASE_FRAME_MS
         new_x = x + dx * speed
         new_y = y + dy * speed
 
@@ -1472,12 +1536,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                 tile_x = int((pxp - offset_x) // TILE_SIZE)
                 tile_y = int((pyp - offset_y) // TILE_SIZE)
                 if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
-                    if game_map[tile_y][tile_x] == LAVA_TILE:
+                    if map_info.lava[tile_y * WIDTH + tile_x]:
                         # death by lava
                         try: sounds.play_sfx('LavaDeath.mp3')
                         except Exception: pass
                         _on_player_death()
-                        return
+                        return "over"
             is_dashing = False
             if pressed_dirs:
                 last_direction = pressed_dirs[-1]
@@ -1498,7 +1562,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
             tile_x = int((pxp - offset_x) // TILE_SIZE)
             tile_y = int((pyp - offset_y) // TILE_SIZE)
             if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
-                if game_map[tile_y][tile_x] == TRAP_TILE and trap_active:
+                if map_info.traps[tile_y * WIDTH + tile_x] and trap_active:
                     on_trap_now = True
                     break
 
@@ -1522,7 +1586,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                     except Exception:
                         pass
                     _on_player_death()
-                    return
+                    return "over"
 
         on_trap_prev = on_trap_now
 
@@ -1550,108 +1614,22 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         else:
             frame_index = 0
 
-        angle = int(current_angle) // 3 * 3
-
-        win.fill((0, 0, 0))
-        draw_map(win, game_map, floor_choices, offset_x, offset_y, trap_active)
-        # NEW: draw portal if active
-        if portal_active and portal_rect:
-            try:
-                win.blit(portal_img, portal_rect.topleft)
-            except Exception:
-                pygame.draw.rect(win, (120, 0, 180), portal_rect)
-        # NEW: draw score at top of screen (left-aligned to map)
-        try:
-            if level_font:
-                sc = level_font.render(f"Score: {score}", True, (255, 255, 255))
-                top_y = max(10, offset_y - 100)
-                win.blit(sc, (offset_x, top_y))
-        except Exception:
-            pass
-        draw_shadow(win, x, y, char_size, game_map, offset_x, offset_y)
-        # draw/update death particle debris (map-grounded)
-        update_and_draw_particles(dt, win)
-        # Floating damage indicators: update and draw
-        try:
-            pruned = []
-            for ind in dmg_indicators:
-                ind['life'] -= dt
-                ind['y'] += ind['vy'] * dt
-                if ind['life'] > 0 and dmg_font is not None:
-                    # fade alpha near the end
-                    a = 255
-                    if ind['life'] < 200:
-                        a = max(0, int(255 * (ind['life'] / 200.0)))
-                    # composite outlined text
-                    outline_w = 2
-                    base = dmg_font.render(ind['text'], True, ind['color'])
-                    outline = dmg_font.render(ind['text'], True, (0, 0, 0))
-                    w = base.get_width() + outline_w * 2
-                    h = base.get_height() + outline_w * 2
-                    comp = pygame.Surface((w, h), pygame.SRCALPHA)
-                    for ox, oy in [(-outline_w, 0), (outline_w, 0), (0, -outline_w), (0, outline_w),
-                                   (-outline_w, -outline_w), (outline_w, -outline_w), (-outline_w, outline_w), (outline_w, outline_w)]:
-                        comp.blit(outline, (ox + outline_w, oy + outline_w))
-                    comp.blit(base, (outline_w, outline_w))
-                    if a < 255:
-                        comp.set_alpha(a)
-                    win.blit(comp, (int(ind['x'] - comp.get_width() / 2), int(ind['y'])))
-                if ind['life'] > 0:
-                    pruned.append(ind)
-            dmg_indicators = pruned
-        except Exception:
-            pass
-
-        def make_is_walkable(size):
-            def is_walkable(new_x: float, new_y: float) -> bool:
-                foot_width = int(size * 0.5)
-                foot_height = 10
-                foot_x = int(new_x + (size - foot_width) / 2)
-                foot_y = int(new_y + size - foot_height)
-                for pxp, pyp in [
-                    (foot_x, foot_y + foot_height - 1),
-                    (foot_x + foot_width - 1, foot_y + foot_height - 1),
-                    (foot_x + foot_width // 2, foot_y + foot_height - 1)
-                ]:
-                    tile_x = int((pxp - offset_x) // TILE_SIZE)
-                    tile_y = int((pyp - offset_y) // TILE_SIZE)
-                    if tile_x < 0 or tile_x >= WIDTH or tile_y < 0 or tile_y >= HEIGHT:
-                        return False
-                    tile = game_map[tile_y][tile_x]
-                    if tile in WALL_TILES:
-                        return False
-                    if tile == LAVA_TILE:
-                        return False
-                return True
-            return is_walkable
-
-        def on_trap(px: int, py: int) -> bool:
-            tile_x = int((px - offset_x) // TILE_SIZE)
-            tile_y = int((py - offset_y) // TILE_SIZE)
-            if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
-                return game_map[tile_y][tile_x] == TRAP_TILE and trap_active
-            return False
-
-        def is_lava(px: float, py: float) -> bool:
-            tile_x = int((px - offset_x) // TILE_SIZE)
-            tile_y = int((py - offset_y) // TILE_SIZE)
-            if 0 <= tile_x < WIDTH and 0 <= tile_y < HEIGHT:
-                return game_map[tile_y][tile_x] == LAVA_TILE
-            return False
 
-        # new: wall test used by enemy projectiles (True for wall tiles or out-of-bounds)
-        def is_wall(px: float, py: float) -> bool:
-            tile_x = int((px - offset_x) // TILE_SIZE)
-            tile_y = int((py - offset_y) // TILE_SIZE)
-            # treat out-of-bounds as a blocking wall so projectiles disappear there
-            if tile_x < 0 or tile_x >= WIDTH or tile_y < 0 or tile_y >= HEIGHT:
-                return True
-            return game_map[tile_y][tile_x] in WALL_TILES
+        prof.lap("player")
+        # Floating damage indicators: advance (drawn in render)
+        dmg_numbers.update(dt)
+        prof.lap("indicators")
+        # death particle debris physics
+        update_particles(dt)
+        prof.lap("particles")
 
         # Update enemies
         for e in enemies:
             if e.alive:
+                prof.mark()
                 e.update(dt, player_center, make_is_walkable(e.size), on_trap, is_lava, is_wall)
+                if prof.enabled:
+                    prof.lap("enemy:" + str(getattr(e, "kind", "?")))
             # --- Bleed processing (if any weapon applied bleed) ---
             if getattr(e, 'bleed_time', 0) > 0 and e.alive:
                 e.bleed_time -= dt
@@ -1676,14 +1654,10 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
         for e in enemies:
             try:
                 for ev in e.drain_damage_events():
-                    dmg_indicators.append({
-                        'x': float(ev.get('x', getattr(e, 'x', 0) + getattr(e, 'size', 0) / 2)),
-                        'y': float(ev.get('y', getattr(e, 'y', 0))),
-                        'text': f"-{int(ev.get('amt', 0))}",
-                        'color': tuple(ev.get('color', (200, 40, 40))),
-                        'life': 600,
-                        'vy': -0.04
-                    })
+                    dmg_numbers.spawn(ev.get('x', getattr(e, 'x', 0) + getattr(e, 'size', 0) / 2),
+                                      ev.get('y', getattr(e, 'y', 0)),
+                                      f"-{int(ev.get('amt', 0))}",
+                                      ev.get('color', (200, 40, 40)))
             except Exception:
                 pass
         # spawn particles for enemies that died THIS FRAME
@@ -1727,7 +1701,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                     if not round_cleared:
                         # show powerup picker immediately after last kill
                         try:
-                            snap = win.copy()
+                            snap = backend.snapshot()
                         except Exception:
                             snap = None
                         was_playing = False
@@ -1744,9 +1718,10 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                             pass
                         pick, _elapsed = (None, 0)
                         try:
-                            pick, _elapsed = powerups.choose_powerup(snap, win)
+                            pick, _elapsed = policies.choose_powerup(snap, win, powerup_rng)
                         except Exception:
                             pass
+                        _discard_modal_time()
                         # resume gameplay bgm
                         try:
                             if was_playing:
@@ -1795,54 +1770,22 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                                     poison_level += 1
                         # mark cleared and spawn portal at bottom-center
                         round_cleared = True
-                        try:
-                            cx = WIDTH // 2
-                            ty = HEIGHT - 2  # prefer second-to-last row
-                            # if target tile isn't walkable, search sideways on same row
-                            placed = False
-                            for dx_off in [0] + [i for k in range(1, WIDTH) for i in (-k, k)]:
-                                tx = cx + dx_off
-                                if 0 <= tx < WIDTH and 0 <= ty < HEIGHT and game_map[ty][tx] == '.':
-                                    pxp = offset_x + tx * TILE_SIZE
-                                    pyp = offset_y + ty * TILE_SIZE
-                                    portal_rect = pygame.Rect(pxp, pyp, TILE_SIZE, TILE_SIZE)
-                                    portal_active = True
-                                    placed = True
-                                    break
-                            if not placed:
-                                # fallback to helper scan from bottom up near center
-                                pxp, pyp = _find_portal_spot(game_map)
-                                portal_rect = pygame.Rect(pxp, pyp, TILE_SIZE, TILE_SIZE)
-                                portal_active = True
-                        except Exception:
-                            # ultimate fallback: bottom-center pixel cell
-                            pxp = offset_x + (WIDTH // 2) * TILE_SIZE
-                            pyp = offset_y + max(0, HEIGHT - 2) * TILE_SIZE
-                            portal_rect = pygame.Rect(pxp, pyp, TILE_SIZE, TILE_SIZE)
-                            portal_active = True
+                        # floor tile nearest the bottom-center (precomputed per map, see mapdata.py);
+                        # bottom-center when the map has none
+                        portal_tile = mapdata.info_for(game_map).portal or (WIDTH // 2, max(0, HEIGHT - 2))
+                        pxp = offset_x + portal_tile[0] * TILE_SIZE
+                        pyp = offset_y + portal_tile[1] * TILE_SIZE
+                        portal_rect = pygame.Rect(pxp, pyp, TILE_SIZE, TILE_SIZE)
+                        portal_active = True
             except Exception:
                 pass
 
-        if game_finished:
-            return  # exit game loop
 
-        # Draw enemies
-        for e in enemies:
-            if e.alive:
-                e.draw(win)
-                # Stun indicator overlay using stunned.png above enemy while stunned
-                if getattr(e, 'stun_timer', 0) > 0 and stunned_img is not None:
-                    try:
-                        icon = stunned_img
-                        cx = int(e.x + e.size/2)
-                        top = int(e.y) - 10
-                        rect = icon.get_rect(center=(cx, top))
-                        win.blit(icon, rect.topleft)
-                    except Exception:
-                        pass
+        if game_finished:
+            return "won"  # exit game loop
 
         # === PLAYER PROJECTILES (The Descender: sunball) ===
-       
+        prof.mark()
         if player_projectiles:
             updated_proj = []
             for p in player_projectiles:
@@ -1913,35 +1856,13 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
 
                 updated_proj.append(p)
             player_projectiles = updated_proj
-
-        # Draw enemies
-        for e in enemies:
-            if e.alive:
-                e.draw(win)
-                # Stun indicator overlay using stunned.png above enemy while stunned
-                if getattr(e, 'stun_timer', 0) > 0 and stunned_img is not None:
-                    try:
-                        icon = stunned_img
-                        cx = int(e.x + e.size/2)
-                        top = int(e.y) - 10
-                        rect = icon.get_rect(center=(cx, top))
-                        win.blit(icon, rect.topleft)
-                    except Exception:
-                        pass
-        # Draw player projectiles after enemies (so they appear above ground but below player)
-        if player_projectiles:
-            for p in player_projectiles:
-                img = p.get('img')
-                if img:
-                    rect = img.get_rect(center=(int(p['x']), int(p['y'])))
-                    win.blit(img, rect.topleft)
-                else:
-                    pygame.draw.circle(win, (255, 200, 80), (int(p['x']), int(p['y'])), p['radius'])
+        prof.lap("player_proj")
 
         # --- NEW: enemy projectiles can hit the player (mage magic) --- retaliation for Thorns
         # use player_center computed from previous frame; handle once per frame
         # projectiles should not hurt the player while invincible, during spawn grace,
         # or while the player is actively dashing
+        prof.mark()
         if invincible_timer <= 0 and spawn_grace_timer <= 0 and not is_dashing:
              proj_hit = False
              pcx, pcy = player_center
@@ -2011,11 +1932,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                         # check death
                         if hearts <= 0:
                             _on_player_death()
-                            return
+                            return "over"
                         break
                  if proj_hit:
                     break
 
+        prof.lap("enemy_proj")
         # Enemy -> player collision (damage) --- add Thorns retaliation on contact
         # smaller hitbox for player (inset on all sides)
         inset = 10
@@ -2080,151 +2002,20 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                           pass
                       if hearts <= 0:
                           _on_player_death()
-                          return
+                          return "over"
                       break
 
-        # Then draw character
-        char = animations[last_direction][frame_index]
-        # spawn grace: yellow overlay; damage flash: red overlay (spawn grace takes precedence)
-        draw_char = char
-        if spawn_grace_timer > 0:
-            # When grace is nearly over, blink the yellow tint to signal impending end.
-            try:
-                blink_threshold = 800  # ms before end when blinking starts
-                blink_period = 200     # ms blink interval
-                if spawn_grace_timer <= blink_threshold:
-                    blink_on = (pygame.time.get_ticks() // blink_period) % 2 == 0
-                else:
-                    blink_on = True
-                if blink_on:
-                    draw_char = char.copy()
-                    # soft yellow tint
-                    draw_char.fill((200, 180, 60, 0), special_flags=pygame.BLEND_RGBA_ADD)
-                else:
-                    draw_char = char
-            except Exception:
-                draw_char = char
-        elif player_flash_timer > 0:
-            try:
-                draw_char = char.copy()
-                draw_char.fill((180, 40, 40, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            except Exception:
-                draw_char = char
-        win.blit(draw_char, (x, y))
-        # NEW: outlines for equipped armors using mask edges (no filled circle)
-        try:
-            m_draw = pygame.mask.from_surface(draw_char)
-        except Exception:
-            m_draw = None
-        if swiftness_outline and m_draw:
-            try:
-                pts = m_draw.outline()
-                if pts and len(pts) >= 3:
-                    pts_t = [(x + p[0], y + p[1]) for p in pts]
-                    pygame.draw.polygon(win, (255, 220, 40), pts_t, 3)
-            except Exception:
-                pass
-        if tank_outline and m_draw:
-            try:
-                pts = m_draw.outline()
-                if pts and len(pts) >= 3:
-                    pts_t = [(x + p[0], y + p[1]) for p in pts]
-                    pygame.draw.polygon(win, (245, 245, 245), pts_t, 3)
-            except Exception:
-                pass
-        # NEW: Life Armor red outline
-        if life_outline and m_draw:
-            try:
-                pts = m_draw.outline()
-                if pts and len(pts) >= 3:
-                    pts_t = [(x + p[0], y + p[1]) for p in pts]
-                    pygame.draw.polygon(win, (220, 60, 60), pts_t, 3)
-            except Exception:
-                pass
-        # NEW: Regen Armor blue outline
-        if regen_outline and m_draw:
-            try:
-                pts = m_draw.outline()
-                if pts and len(pts) >= 3:
-                    pts_t = [(x + p[0], y + p[1]) for p in pts]
-                    pygame.draw.polygon(win, (80, 160, 255), pts_t, 3)
-            except Exception:
-                pass
-        # NEW: Thorns Armor green outline
-        if thorns_outline and m_draw:
-            try:
-                pts = m_draw.outline()
-                if pts and len(pts) >= 3:
-                    pts_t = [(x + p[0], y + p[1]) for p in pts]
-                    pygame.draw.polygon(win, (60, 200, 80), pts_t, 3)
-            except Exception:
-                pass
+
         # Update player_center
-        char_rect = char.get_rect(topleft=(x, y))
-        player_center = char_rect.center
-
-        # Crosshair
-        draw_crosshair(win, player_center)
-
-        # HUD: stamina bars
-        bar_x = offset_x
-        bar_y = offset_y - 40
-        BAR_W, BAR_H = 60, 20
-        spacing = 10
-        for i in range(3):
-            x_pos = bar_x + i * (BAR_W + spacing)
-            y_pos = bar_y
-            pygame.draw.rect(win, (128, 128, 128), (x_pos, y_pos, BAR_W, BAR_H))
-            fill = min(1.0, max(0.0, stamina - i))
-            if fill >  0:
-                fill_w = int(BAR_W * fill)
-                pygame.draw.rect(win, (225, 225, 225), (x_pos, y_pos, fill_w, BAR_H))
-        # Attack cooldown bar
-        bar_w, bar_h = 100, 12
-        bar_x = offset_x
-        bar_y = offset_y - 60
-        pygame.draw.rect(win, (100, 100, 100), (bar_x, bar_y, bar_w, bar_h))  # bg
-        if cooldown_timer > 0:
-           
-            ratio = 1 - (cooldown_timer / (attack_duration + attack_cooldown))
-            fill_w = int(bar_w * ratio)
-            pygame.draw.rect(win, (255, 0, 0), (bar_x, bar_y, fill_w, bar_h))
-        else:
-            pygame.draw.rect(win, (0, 200, 0), (bar_x, bar_y, bar_w, bar_h))  # ready
+        player_center = animations[last_direction][frame_index].get_rect(topleft=(x, y)).center
 
-        # Attack drawing and hit detection
+        # Attack hit detection
+        prof.mark()
         if attacking:
             px, py = player_center
             progress = 1 - (attack_timer / attack_duration)  # 0 → 1
             current_angle = swing_start_angle - swing_arc/2 + swing_arc * progress
 
-            # --- Dagger (arc=0) uses a thrust animation: radius grows with progress ---
-            if swing_arc == 0:
-                # Ease-out thrust (fast out, tiny retract at very end)
-                thrust_out = min(1.0, progress * 1.15)
-                ease = 1 - (1 - thrust_out) * (1 - thrust_out)
-                max_len = 68
-                base_len = 12
-                current_len = base_len + ease * (max_len - base_len)
-                # slight retract during last  10% for visual snap
-                if progress > 0.9:
-                    retract = (progress - 0.9) / 0.1
-                    current_len -= retract * 10
-
-                # position the sword image along the thrust direction
-                dx_dir = math.cos(math.radians(swing_start_angle))
-                dy_dir = math.sin(math.radians(swing_start_angle))
-                sword_center_x = px + current_len * dx_dir
-                sword_center_y = py + current_len * dy_dir
-            else:
-                radius = 50
-                sword_center_x = px + radius * math.cos(math.radians(current_angle))
-                sword_center_y = py + radius * math.sin(math.radians(current_angle))
-
-            rotated_sword = pygame.transform.rotate(sword_img, - (swing_start_angle if swing_arc == 0 else current_angle))
-            rect = rotated_sword.get_rect(center=(sword_center_x, sword_center_y))
-            win.blit(rotated_sword, rect.topleft)
-
             # Hit detection
             sword_reach = 64
             if swing_arc == 0:
@@ -2275,7 +2066,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                                 sy = py + dy_dir * (proj * s / samples)
                                 tx = int((sx - offset_x) // TILE_SIZE)
                                 ty = int((sy - offset_y) // TILE_SIZE)
-                                if tx < 0 or tx >= WIDTH or ty < 0 or ty >= HEIGHT or game_map[ty][tx] in WALL_TILES:
+                                if tx < 0 or tx >= WIDTH or ty < 0 or ty >= HEIGHT or map_info.walls[ty * WIDTH + tx]:
                                     los_blocked = True
                                     break
                         if los_blocked:
@@ -2339,7 +2130,7 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                                     ty = int((sy - offset_y) // TILE_SIZE)
                                     if tx < 0 or tx >= WIDTH or ty < 0 or ty >= HEIGHT:
                                         los_clear = False; break
-                                    if game_map[ty][tx] in WALL_TILES:
+                                    if map_info.walls[ty * WIDTH + tx]:
                                         los_clear = False; break
                         if not los_clear:
                             continue
@@ -2420,45 +2211,12 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                             pass
                         # (no enemy flash here so mages don't turn red when their orb is broken)
 
-        # Draw hearts using the configured max_hearts for the chosen difficulty
-        total_hearts = max_hearts
-
-        heart_w = heart_full.get_width()
-        heart_h = heart_full.get_height()
-        margin = 0
-        start_x = offset_x + WIDTH * TILE_SIZE - (total_hearts * heart_w) - margin
-        heart_y = bar_y + (bar_h - heart_h) // 2
-        # NEW: draw Level directly above the hearts (centered over the heart row)
-        try:
-            if level_font and level_number > 0:
-                if not is_endless:
-                    lvl_surf = level_font.render(f"Level {level_number}", True, (255, 255, 255))
-                else:
-                    # Endless: show a static label (no level number)
-                    lvl_surf = level_font.render("Endless", True, (255, 255, 255))
-                hearts_w = total_hearts * heart_w + max(0, total_hearts - 1) * heart_spacing
-                lvl_x = start_x + (hearts_w - lvl_surf.get_width()) // 2
-                lvl_y = heart_y - lvl_surf.get_height() - 6
-                win.blit(lvl_surf, (lvl_x, lvl_y))
-        except Exception:
-            pass
-        for i in range(total_hearts):
-            hx = start_x + i * (heart_w + heart_spacing)
-            img = heart_full if i < hearts else heart_empty
-            win.blit(img, (hx, heart_y))
 
+        prof.lap("melee")
         # --- SHIELD LOGIC: update shield angle ---
         if shield_count > 0:
             shield_angle = (shield_angle + 3 * (dt / 1000.0)) % (2 * math.pi)  # Slower rotation: 0.5 radians per second
 
-        # --- DRAW SHIELD(S) ---
-        if shield_count > 0:
-            for i in range(shield_count):
-                angle = shield_angle + (2 * math.pi * i / shield_count)
-                px, py = player_center
-                sx = int(px + shield_radius * math.cos(angle) - shield_img.get_width() // 2)
-                sy = int(py + shield_radius * math.sin(angle) - shield_img.get_height() // 2)
-                win.blit(shield_img, (sx, sy))
 
         # --- SHIELD COLLISION WITH ENEMIES ---
         if shield_count > 0:
@@ -2500,7 +2258,310 @@ def run_game(screen=None, difficulty: str = "normal", mode: str = "main"):
                             enemy.projectiles.remove(proj)
                             break
 
-        pygame.display.update()
+        return None
+
+    def render(alpha: float = 1.0):
+        """Draw the current game state to `canvas` (the loop presents it). Moving things are drawn
+        `alpha` (0..1) of the way from their previous tick's position to the current one."""
+        # interpolated player position / center for this frame
+        ix = prev_x + (x - prev_x) * alpha
+        iy = prev_y + (y - prev_y) * alpha
+        icenter = (int(ix) + char_size // 2, int(iy) + char_size // 2)
+        prof.mark()
+        backend.begin_frame()
+        draw_map(game_map, floor_choices, offset_x, offset_y, trap_active)
+        prof.lap("draw_map")
+        # everything above the map goes through the render queue: submitted here, then drawn in
+        # one pass by layer and feet-y (see render_queue.py)
+        # NEW: draw portal if active
+        if portal_active and portal_rect:
+            try:
+                queue.blit(rq.GROUND, -1, portal_img, portal_rect.topleft)
+            except Exception:
+                queue.call(rq.GROUND, -1, lambda s: pygame.draw.rect(s, (120, 0, 180), portal_rect))
+        queue.call(rq.GROUND, int(iy) + char_size,
+                   lambda s: draw_shadow(s, ix, iy, char_size, game_map, offset_x, offset_y))
+        # death particle debris (map-grounded)
+        if death_particles:
+            queue.call(rq.GROUND, 0, draw_particles)
+        # Floating damage indicators
+        queue.call(rq.EFFECTS, 0, dmg_numbers.draw)
+
+        # Enemies (shadow, sprite, boss outline, projectiles)
+        for e in enemies:
+            if e.alive:
+                # offset from the current tick position back towards the previous one
+                ex0, ey0 = getattr(e, "prev_pos", None) or (e.x, e.y)
+                eox = int(round((ex0 - e.x) * (1.0 - alpha)))
+                eoy = int(round((ey0 - e.y) * (1.0 - alpha)))
+                e.submit(queue, eox, eoy)
+                # Stun indicator overlay using stunned.png above enemy while stunned
+                if getattr(e, 'stun_timer', 0) > 0 and stunned_img is not None:
+                    cx = int(e.x + e.size/2) + eox
+                    top = int(e.y) - 10 + eoy
+                    rect = stunned_img.get_rect(center=(cx, top))
+                    queue.blit(rq.ENTITIES, e.feet_y(eoy), stunned_img, rect.topleft)
+        # Player projectiles
+        if player_projectiles:
+            for p in player_projectiles:
+                ppx, ppy = p.get('prev', (p['x'], p['y']))
+                cpx = int(ppx + (p['x'] - ppx) * alpha)
+                cpy = int(ppy + (p['y'] - ppy) * alpha)
+                img = p.get('img')
+                if img:
+                    queue.blit_rotated(rq.PROJECTILES, cpy, img, (cpx, cpy), p.get('angle', 0.0))
+                else:
+                    queue.call(rq.PROJECTILES, cpy, lambda s, c=(cpx, cpy), r=p['radius']: pygame.draw.circle(s, (255, 200, 80), c, r))
+
+        # Then the character
+        player_key = int(iy) + char_size
+        char = animations[last_direction][frame_index]
+        # spawn grace: yellow overlay; damage flash: red overlay (spawn grace takes precedence)
+        char_tint = None
+        if spawn_grace_timer > 0:
+            # When grace is nearly over, blink the yellow tint to signal impending end.
+            try:
+                blink_threshold = 800  # ms before end when blinking starts
+                blink_period = 200     # ms blink interval
+                if spawn_grace_timer <= blink_threshold:
+                    blink_on = (pygame.time.get_ticks() // blink_period) % 2 == 0
+                else:
+                    blink_on = True
+                if blink_on:
+                    # soft yellow tint
+                    char_tint = tints.PLAYER_GRACE
+            except Exception:
+                char_tint = None
+        elif player_flash_timer > 0:
+            char_tint = tints.PLAYER_HIT
+        queue.blit(rq.ENTITIES, player_key, char, (ix, iy), tint=char_tint)
+        # NEW: outlines for equipped armors (cached per animation frame; tints share the frame's mask)
+        for flag, armor in ((swiftness_outline, "Swiftness Armor"), (tank_outline, "Tank Armor"),
+                            (life_outline, "Life Armor"), (regen_outline, "Regen Armor"),
+                            (thorns_outline, "Thorns Armor")):
+            if flag:
+                try:
+                    queue.blit(rq.ENTITIES, player_key, outlines.overlay(char, outlines.ARMOR_COLORS[armor], 3),
+                               (int(ix) - outlines.MARGIN, int(iy) - outlines.MARGIN))
+                except Exception:
+                    pass
+
+        # Attack drawing (the weapon stays in the player's hand: same sort key, drawn after it)
+        if attacking:
+            px, py = icenter
+            progress = 1 - (attack_timer / attack_duration)  # 0 → 1
+
+            # --- Dagger (arc=0) uses a thrust animation: radius grows with progress ---
+            if swing_arc == 0:
+                # Ease-out thrust (fast out, tiny retract at very end)
+                thrust_out = min(1.0, progress * 1.15)
+                ease = 1 - (1 - thrust_out) * (1 - thrust_out)
+                max_len = 68
+                base_len = 12
+                current_len = base_len + ease * (max_len - base_len)
+                # slight retract during last  10% for visual snap
+                if progress > 0.9:
+                    retract = (progress - 0.9) / 0.1
+                    current_len -= retract * 10
+
+                # position the sword image along the thrust direction
+                dx_dir = math.cos(math.radians(swing_start_angle))
+                dy_dir = math.sin(math.radians(swing_start_angle))
+                sword_center_x = px + current_len * dx_dir
+                sword_center_y = py + current_len * dy_dir
+            else:
+                radius = 50
+                sword_center_x = px + radius * math.cos(math.radians(current_angle))
+                sword_center_y = py + radius * math.sin(math.radians(current_angle))
+
+            queue.blit_rotated(rq.ENTITIES, player_key, sword_img, (sword_center_x, sword_center_y),
+                               swing_start_angle if swing_arc == 0 else current_angle)
+
+        # --- DRAW SHIELD(S) --- (orbiting: sorted by their own bottom edge)
+        if shield_count > 0:
+            for i in range(shield_count):
+                angle = shield_angle + (2 * math.pi * i / shield_count)
+                px, py = icenter
+                sx = int(px + shield_radius * math.cos(angle) - shield_img.get_width() // 2)
+                sy = int(py + shield_radius * math.sin(angle) - shield_img.get_height() // 2)
+                queue.blit(rq.ENTITIES, sy + shield_img.get_height(), shield_img, (sx, sy))
+
+        # Crosshair over everything but the HUD
+        queue.call(rq.EFFECTS, 1, lambda s: draw_crosshair(s, icenter, mouse_pos))
+
+        # HUD: score, level label, hearts, stamina bars, attack cooldown bar (cached widgets)
+        cd_ratio = None
+        if cooldown_timer > 0:
+            cd_ratio = 1 - (cooldown_timer / (attack_duration + attack_cooldown))
+        queue.call(rq.HUD, 0, lambda s: hud.draw(s, (offset_x, offset_y), WIDTH * TILE_SIZE, score=score,
+                                                 level=level_number, endless=is_endless, hearts=hearts,
+                                                 max_hearts=max_hearts, stamina=stamina, cooldown_ratio=cd_ratio))
+        prof.lap("submit")
+        backend.flush(queue, dirty, prof)
+
+    def _observe():
+        """Read-only view of the run for automated input (e.g. the headless autopilot)."""
+        return {
+            "player": player_center,
+            "enemies": [(e.x + e.size / 2, e.y + e.size / 2) for e in enemies if e.alive],
+            "portal": portal_rect.center if (portal_active and portal_rect) else None,
+            "stamina": stamina,
+        }
+
+    def _capture_prev():
+        """Remember positions before a tick so render() can interpolate from them."""
+        nonlocal prev_x, prev_y
+        prev_x, prev_y = x, y
+        for e in enemies:
+            e.prev_pos = (e.x, e.y)
+        for p in player_projectiles:
+            p['prev'] = (p['x'], p['y'])
+
+    def _snap_teleports():
+        """Don't interpolate across teleports (map change, boss blink): draw those at the new spot."""
+        nonlocal prev_x, prev_y
+        if abs(x - prev_x) > TILE_SIZE * 2 or abs(y - prev_y) > TILE_SIZE * 2:
+            prev_x, prev_y = x, y
+        for e in enemies:
+            pp = getattr(e, "prev_pos", None)
+            if pp and (abs(e.x - pp[0]) > TILE_SIZE * 2 or abs(e.y - pp[1]) > TILE_SIZE * 2):
+                e.prev_pos = (e.x, e.y)
+
+    BOSS_LEVELS = (6, 12, 18)
+
+    def _apply_start(spec):
+        """Jump straight into a given situation instead of level 1:
+           "level": visible level number to start on (built by the normal level transition),
+           "map": use maps/map<N>.txt instead, "enemies"/"kind": respawn that many enemies of that kind,
+           "crowd": move the player to the middle of the map and pack the enemies in a ring of
+           that radius (px) around it."""
+        nonlocal game_map, map_info, floor_choices, enemies, level_number, is_boss_level, normal_levels_completed, x, y, player_center
+        target = int(spec.get("level") or level_number)
+        if target > level_number:
+            # stand on the level just before the target and let do_map_transition build it
+            prev = target - 1
+            is_boss_level = (not is_endless) and prev in BOSS_LEVELS
+            normal_levels_completed = prev - sum(1 for b in BOSS_LEVELS if b <= prev) - (0 if is_boss_level else 1)
+            level_number = prev
+            do_map_transition()
+        respawn = any(k in spec for k in ("map", "enemies", "kind"))
+        if spec.get("map"):
+            game_map = MAPS[int(spec["map"]) - 1]
+            map_info = mapdata.info_for(game_map)
+            floor_choices = _roll_floor_choices(game_map)
+            bake_map_layer(game_map, floor_choices)
+        if respawn:
+            enemies = spawn_enemies(game_map, count=int(spec.get("enemies") or enemy_count_for_level(level_number, is_boss_level)),
+                                    tile_size=TILE_SIZE, offset_x=offset_x, offset_y=offset_y, valid_tile=".",
+                                    enemy_size=48, speed=1.5, kind=spec.get("kind", "mix"))
+            _apply_level_scaling(enemies, level_number)
+        if spec.get("crowd"):
+            if game_map[HEIGHT // 2][WIDTH // 2] == mapdata.FLOOR_TILE:
+                x = offset_x + (WIDTH // 2) * TILE_SIZE
+                y = offset_y + (HEIGHT // 2) * TILE_SIZE
+                player_center = (x + char_size // 2, y + char_size // 2)
+            cx, cy = player_center
+            radius = float(spec["crowd"])
+            alive = [e for e in enemies if e.alive]
+            for i, e in enumerate(alive):
+                a = 2 * math.pi * i / max(1, len(alive))
+                e.x = cx + radius * math.cos(a) - e.size / 2
+                e.y = cy + radius * math.sin(a) - e.size / 2
+
+    if start:
+        _apply_start(start)
+
+    # profile keys that change how the run plays (recorded alongside replays)
+    try:
+        _profile = save.load_player_data() or {}
+    except Exception:
+        _profile = {}
+    session_info = {
+        "seed": run_rng.seed,
+        "difficulty": difficulty,
+        "mode": mode,
+        "size": list(win.get_size()),
+        "logical": list(canvas.get_size()) if logical else None,
+        "renderer": backend.name,
+        "sim_hz": SIM_HZ,
+        "start": dict(start) if start else None,
+        "profile": {k: _profile[k] for k in ("equipped_weapon", "equipped_armor", "weapons_owned", "weapons_upgrades")
+                    if k in _profile},
+    }
+    policies.begin_session(_observe, session_info)
+    # the real mouse is read in display coordinates: let the policies map it onto the canvas
+    use_screen = getattr(policies, "use_screen", None)
+    if use_screen is not None:
+        use_screen(logical)
+    result = None
+    frames = 0
+    try:
+        # Fixed-step clock: the simulation always advances in SIM_STEP_MS ticks, however fast or
+        # slow frames are rendered. Input events gathered in a frame are delivered to its first tick
+        # (or carried over if the frame ran no tick at all).
+        accumulator = 0.0
+        pending_events = []
+        while result is None:
+            frame_ms = policies.frame_dt(clock)
+            accumulator += min(frame_ms, MAX_FRAME_MS)
+            t_in = time.perf_counter()
+            inp = policies.poll_input()
+            pending_events.extend(inp.events)
+            for ev in inp.events:
+                if ev.type == pygame.KEYDOWN and ev.key == pygame.K_F3:
+                    prof.toggle()
+                    dirty.invalidate()  # repaint where the overlay was (or wasn't) once it hides/shows
+                elif ev.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    if logical and ev.type == pygame.VIDEORESIZE:
+                        logical.layout()
+                    dirty.invalidate()
+            ticks = 0
+            t0 = time.perf_counter()
+            while accumulator >= SIM_STEP_MS and result is None:
+                if ticks >= MAX_SIM_STEPS:
+                    # too far behind: drop the backlog instead of spiralling
+                    accumulator = 0.0
+                    break
+                _capture_prev()
+                tick_inp = FrameInput(pending_events, inp.held, inp.mouse)
+                pending_events = []
+                policies.on_tick(tick_inp)
+                result = simulate(SIM_STEP_MS, tick_inp)
+                _snap_teleports()
+                accumulator -= SIM_STEP_MS
+                ticks += 1
+            t1 = time.perf_counter()
+            t_draw = t1
+            if result is None and policies.render:
+                render(min(1.0, accumulator / SIM_STEP_MS))
+                if prof.visible:
+                    prof.mark()
+                    backend.draw_over(prof.draw)
+                    prof.lap("overlay")
+                t_draw = time.perf_counter()
+                prof.mark()
+                # the profiler overlay isn't tracked rect by rect: push the whole screen while it shows
+                backend.present(dirty, force_full=prof.visible)
+                prof.lap("present")
+            t2 = time.perf_counter()
+            frames += 1
+            prof.end_frame((t2 - t_in) * 1000.0)
+            # per-phase cost of this frame in ms (input polling, fixed ticks, drawing, presenting)
+            phases = {"input": (t0 - t_in) * 1000.0, "simulate": (t1 - t0) * 1000.0,
+                      "draw": (t_draw - t1) * 1000.0, "present": (t2 - t_draw) * 1000.0}
+            policies.on_frame(frames, (t1 - t0) * 1000.0, (t2 - t1) * 1000.0, ticks, phases)
+            if result is None and max_frames is not None and frames >= max_frames:
+                result = "stopped"
+    finally:
+        # also on an exception: leave the display as the menu expects it, and don't leave the
+        # armor listener (and with it this whole run) in the profile's subscribers
+        backend.close()
+        save.unsubscribe(_on_armor_changed)
+
+    summary = {"result": result, "score": int(score), "level": level_number, "frames": frames, "seed": run_rng.seed}
+    policies.end_session(summary)
+    return summary
+
         
 # ======================
 # START GAME
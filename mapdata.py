@@ -0,0 +1,275 @@
+"""Compiled maps: each maps/*.txt parsed, validated and analysed once, stored in a small binary.
+
+A MapInfo holds the tile grid run_game plays on (rows of one-character tile IDs, padded or cut
+to WIDTH x HEIGHT, exactly as the text loader produced) plus what used to be rescanned from it
+on every run and level: walkable / lava / wall / trap masks, the floor tiles enemies spawn on
+and floor sprites are rolled for (in the row-major order those scans used, so seeded runs pick
+the same tiles), the portal tile, and the connected walkable regions.
+
+`load(name)` reads maps/compiled/<name>.bin when it was compiled from the current text file
+(same size and mtime), and otherwise compiles the text and rewrites the binary (best effort: a
+read-only install just compiles in memory). Results are kept per process, so later runs reuse
+the same grids. `python mapdata.py` compiles every map and reports validation problems.
+
+Binary layout (little endian): header (magic, version, width, height, source size, source
+mtime_ns), tile bytes, the four masks as bitsets, portal x/y (-1: none), spawn tile count and
+(x, y) byte pairs, region count and one region label byte per tile (0: not walkable).
+"""
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MAPS_DIR = Path(__file__).parent.joinpath("maps")
+COMPILED_DIR = MAPS_DIR.joinpath("compiled")
+
+WIDTH = 13
+HEIGHT = 13
+FLOOR_TILE = "."
+WALL_TILES = frozenset({"-", "|", "A", "B", "C", "D", "#", "0", "I"})
+LAVA_TILE = "X"
+TRAP_TILE = "T"
+KNOWN_TILES = WALL_TILES | {FLOOR_TILE, LAVA_TILE, TRAP_TILE}
+
+MAGIC = b"DMAP"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBBqq")
+
+Tile = Tuple[int, int]
+
+
+class MapInfo:
+    """One map's grid and precomputed metadata. Masks and region labels are flat, row-major
+    (index y * width + x). Shared between runs: don't modify."""
+
+    def __init__(self, tiles: List[List[str]], walkable: List[bool], lava: List[bool], walls: List[bool],
+                 traps: List[bool], floor: List[Tile], portal: Optional[Tile], regions: List[int],
+                 region_count: int, problems: Optional[List[str]] = None):
+        self.tiles = tiles
+        self.width = len(tiles[0]) if tiles else 0
+        self.height = len(tiles)
+        self.walkable = walkable
+        self.lava = lava
+        self.walls = walls
+        self.traps = traps
+        self.floor = floor
+        self.portal = portal
+        self.regions = regions
+        self.region_count = region_count
+        self.problems = problems or []
+
+
+def _normalize(raw_lines: List[List[str]], problems: List[str]) -> List[List[str]]:
+    """Pad / truncate to HEIGHT x WIDTH with floor (the old loader's rules)."""
+    if len(raw_lines) < HEIGHT:
+        problems.append(f"{len(raw_lines)} rows, padded to {HEIGHT}")
+    lines = []
+    for r in range(HEIGHT):
+        if r < len(raw_lines):
+            row = raw_lines[r]
+            if len(row) != WIDTH:
+                problems.append(f"row {r} is {len(row)} tiles wide, not {WIDTH}")
+            if len(row) < WIDTH:
+                row = row + [FLOOR_TILE] * (WIDTH - len(row))
+            elif len(row) > WIDTH:
+                row = row[:WIDTH]
+        else:
+            row = [FLOOR_TILE] * WIDTH
+        lines.append(row)
+    return lines
+
+
+def _portal_tile(tiles: List[List[str]]) -> Optional[Tile]:
+    """Floor tile nearest the bottom-center: rows from HEIGHT-2 upwards, columns outwards from
+    the middle (left before right)."""
+    h, w = len(tiles), len(tiles[0])
+    cx = w // 2
+    order = [cx]
+    for k in range(1, w):
+        if cx - k >= 0:
+            order.append(cx - k)
+        if cx + k < w:
+            order.append(cx + k)
+    for ty in range(h - 2, -1, -1):
+        for tx in order:
+            if tiles[ty][tx] == FLOOR_TILE:
+                return tx, ty
+    return None
+
+
+def _label_regions(walkable: List[bool], w: int, h: int) -> Tuple[List[int], int]:
+    """4-connected components of walkable tiles: per-tile labels 1..n (0 elsewhere), n."""
+    labels = [0] * (w * h)
+    n = 0
+    for start in range(w * h):
+        if not walkable[start] or labels[start]:
+            continue
+        n += 1
+        labels[start] = n
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            x, y = i % w, i // w
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nx < w and 0 <= ny < h:
+                    j = ny * w + nx
+                    if walkable[j] and not labels[j]:
+                        labels[j] = n
+                        stack.append(j)
+    return labels, n
+
+
+def analyze(tiles: List[List[str]], problems: Optional[List[str]] = None) -> MapInfo:
+    """MapInfo of an already normalized grid."""
+    problems = [] if problems is None else problems
+    cells = [t for row in tiles for t in row]
+    h = len(tiles)
+    w = len(tiles[0]) if h else 0
+    unknown = sorted(set(cells) - KNOWN_TILES)
+    if unknown:
+        problems.append("unknown tiles " + " ".join(repr(t) for t in unknown))
+    walls = [t in WALL_TILES for t in cells]
+    lava = [t == LAVA_TILE for t in cells]
+    traps = [t == TRAP_TILE for t in cells]
+    walkable = [not (a or b) for a, b in zip(walls, lava)]
+    floor = [(i % w, i // w) for i, t in enumerate(cells) if t == FLOOR_TILE]
+    if not floor:
+        problems.append("no floor tiles (nowhere to spawn)")
+    portal = _portal_tile(tiles) if h and w else None
+    if portal is None:
+        problems.append("no floor tile for the portal")
+    # several regions are fine (islands reached by dashing over lava); reported by the CLI only
+    regions, n = _label_regions(walkable, w, h)
+    return MapInfo(tiles, walkable, lava, walls, traps, floor, portal, regions, n, problems)
+
+
+def compile_text(path: Path) -> MapInfo:
+    """Parse, validate and analyse a text map."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw_lines = [list(line.rstrip("\n")) for line in f.readlines()]
+    problems: List[str] = []
+    return analyze(_normalize(raw_lines, problems), problems)
+
+
+# --- binary form ---
+def _bits(mask: List[bool]) -> bytes:
+    out = bytearray((len(mask) + 7) // 8)
+    for i, v in enumerate(mask):
+        if v:
+            out[i >> 3] |= 1 << (i & 7)
+    return bytes(out)
+
+
+def _unbits(data: bytes, n: int) -> List[bool]:
+    return [bool(data[i >> 3] >> (i & 7) & 1) for i in range(n)]
+
+
+def encode(info: MapInfo, src_size: int, src_mtime_ns: int) -> bytes:
+    w, h = info.width, info.height
+    out = [_HEADER.pack(MAGIC, VERSION, w, h, src_size, src_mtime_ns)]
+    out.append("".join(t for row in info.tiles for t in row).encode("latin-1"))
+    for mask in (info.walkable, info.lava, info.walls, info.traps):
+        out.append(_bits(mask))
+    px, py = info.portal if info.portal else (-1, -1)
+    out.append(struct.pack("<bbH", px, py, len(info.floor)))
+    out.append(bytes(v for xy in info.floor for v in xy))
+    out.append(struct.pack("<B", info.region_count))
+    out.append(bytes(info.regions))
+    return b"".join(out)
+
+
+def decode(data: bytes, src_size: int, src_mtime_ns: int) -> Optional[MapInfo]:
+    """MapInfo from `data`, or None if it is malformed or compiled from another source."""
+    try:
+        magic, version, w, h, size, mtime = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or (size, mtime) != (src_size, src_mtime_ns):
+            return None
+        pos = _HEADER.size
+        n = w * h
+        cells = data[pos:pos + n].decode("latin-1")
+        pos += n
+        tiles = [list(cells[y * w:(y + 1) * w]) for y in range(h)]
+        nb = (n + 7) // 8
+        masks = []
+        for _ in range(4):
+            masks.append(_unbits(data[pos:pos + nb], n))
+            pos += nb
+        px, py, count = struct.unpack_from("<bbH", data, pos)
+        pos += 4
+        floor = [(data[pos + 2 * i], data[pos + 2 * i + 1]) for i in range(count)]
+        pos += 2 * count
+        (region_count,) = struct.unpack_from("<B", data, pos)
+        pos += 1
+        regions = list(data[pos:pos + n])
+        if len(regions) != n or len(tiles[-1]) != w:
+            return None
+    except (struct.error, IndexError, UnicodeDecodeError):
+        return None
+    portal = (px, py) if px >= 0 else None
+    return MapInfo(tiles, *masks, floor, portal, regions, region_count)
+
+
+# --- runtime loading ---
+_loaded: Dict[str, Tuple[Optional[Tuple[int, int]], MapInfo]] = {}  # name -> ((size, mtime) or None: missing, info)
+_by_grid: Dict[int, MapInfo] = {}  # id(info.tiles) -> info
+
+
+def _remember(info: MapInfo) -> MapInfo:
+    _by_grid[id(info.tiles)] = info
+    return info
+
+
+def load(name: str) -> MapInfo:
+    """maps/<name> (e.g. "map3.txt"), from its compiled form when that is up to date. A missing
+    file gives an all-floor map."""
+    src = MAPS_DIR.joinpath(name)
+    try:
+        st = os.stat(src)
+        stamp = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        stamp = None  # cached like a file, so every run gets the same grid
+    hit = _loaded.get(name)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    if stamp is None:
+        print(f"Warning: map file not found: {src}. Using empty floor map.")
+        info = analyze([[FLOOR_TILE] * WIDTH for _ in range(HEIGHT)])
+        _loaded[name] = (stamp, info)
+        return _remember(info)
+    compiled = COMPILED_DIR.joinpath(Path(name).stem + ".bin")
+    info = None
+    try:
+        info = decode(compiled.read_bytes(), *stamp)
+    except OSError:
+        pass
+    if info is None:
+        info = compile_text(src)
+        try:
+            COMPILED_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = compiled.with_suffix(".tmp")
+            tmp.write_bytes(encode(info, *stamp))
+            os.replace(tmp, compiled)
+        except (OSError, UnicodeEncodeError):
+            pass
+    _loaded[name] = (stamp, info)
+    return _remember(info)
+
+
+def info_for(tiles: List[List[str]]) -> MapInfo:
+    """MapInfo of a grid: the loaded one it came from, else analysed now (not cached)."""
+    info = _by_grid.get(id(tiles))
+    if info is not None and info.tiles is tiles:
+        return info
+    return analyze(tiles)
+
+
+if __name__ == "__main__":
+    import sys
+    bad = 0
+    for p in sorted(MAPS_DIR.glob("*.txt")):
+        info = load(p.name)
+        fresh = compile_text(p)  # load() may have come from the binary: validate the text
+        status = "; ".join(fresh.problems) or "ok"
+        bad += bool(fresh.problems)
+        print(f"{p.name:12s} floor {len(info.floor):3d}  portal {info.portal}  regions {info.region_count}  {status}")
+    sys.exit(1 if bad else 0)
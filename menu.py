@@ -4,6 +4,9 @@ import save
 import sys
 from pathlib import Path
 import os
+import modal  # cached blurred/dimmed backdrops shared by all modals
+import atlas  # shared sprite atlas pages
+import warmup  # background loading of the next run's sprites while the menu is idle
 
 # master volume helper (non-breaking; defaults to 1.0)
 try:
@@ -28,34 +31,60 @@ def _apply_master_volume():
     except Exception:
         pass
 
-pygame.init()
-
-# Screen setup - start fullscreen (toggleable with F11)
-display_info = pygame.display.Info()
-SCREEN_W, SCREEN_H = display_info.current_w, display_info.current_h
-# create fullscreen surface and track state
-SCREEN = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.FULLSCREEN)
-pygame.display.set_caption("Descend")
+# Display state, created by init() (importing this module opens nothing)
+display_info = None
+SCREEN_W, SCREEN_H = 0, 0
+SCREEN = None
 is_fullscreen = True
 
-# player currency shown in shop (from other code)
-# PLAYER_COINS now initialized from save.json (fallback to 0)
-try:
-    _data = save.load_player_data() or {}
-    PLAYER_COINS = int(_data.get("coins", 0))
-    if "master_volume" in _data:
-        try:
-            sounds.set_master_volume(float(_data.get("master_volume", 1.0)))
-        except Exception:
-            pass
-except Exception:
-    PLAYER_COINS = 0  # UPDATED: default to 0
+# player currency shown in shop (from other code); loaded from save.json by init()
+PLAYER_COINS = 0
+
+def init():
+    """Open the (fullscreen) menu window and load the saved coins / volume. Audio is started
+    separately (start_audio) once the first menu frame is on screen. Idempotent."""
+    global display_info, SCREEN_W, SCREEN_H, SCREEN, is_fullscreen, PLAYER_COINS
+    if SCREEN is not None:
+        return SCREEN
+    pygame.display.init()
+    pygame.font.init()
+
+    # Screen setup - start fullscreen (toggleable with F11)
+    display_info = pygame.display.Info()
+    SCREEN_W, SCREEN_H = display_info.current_w, display_info.current_h
+    # create fullscreen surface and track state
+    SCREEN = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.FULLSCREEN)
+    pygame.display.set_caption("Descend")
+    is_fullscreen = True
+
+    # PLAYER_COINS initialized from save.json (fallback to 0)
+    try:
+        _data = save.load_player_data() or {}
+        PLAYER_COINS = int(_data.get("coins", 0))
+        if "master_volume" in _data:
+            try:
+                sounds.set_master_volume(float(_data.get("master_volume", 1.0)))
+            except Exception:
+                pass
+    except Exception:
+        PLAYER_COINS = 0  # UPDATED: default to 0
+    return SCREEN
 
-# After setting sounds.MASTER_VOLUME ensure mixer reflects it
-try:
-    _apply_master_volume()
-except Exception:
-    pass
+def start_audio():
+    """Deferred part of startup: the rest of pygame (mixer, joystick, ...), the saved master
+    volume, click SFX and the menu music."""
+    try:
+        sounds.init()  # before pygame.init(), so the mixer is opened once, in sounds.MIXER_FORMAT
+        pygame.init()
+        sounds.preload('SelectSound')
+    except Exception:
+        pass
+    start_menu_music()
+    # After setting sounds.MASTER_VOLUME ensure mixer reflects it
+    try:
+        _apply_master_volume()
+    except Exception:
+        pass
 
 # Font helper
 def get_font(size):
@@ -120,15 +149,8 @@ class Button:
 def show_options(snapshot, screen_surface):
     """Top-level Options UI. Operates on provided surface and returns ("resume", None)."""
     sw, sh = screen_surface.get_size()
-    # build blurred background from snapshot if provided
-    if snapshot:
-        try:
-            small = pygame.transform.smoothscale(snapshot, (max(1, sw//12), max(1, sh//12)))
-            blurred = pygame.transform.smoothscale(small, (sw, sh))
-        except Exception:
-            blurred = load_background("Background", (sw, sh))
-    else:
-        blurred = load_background("Background", (sw, sh))
+    # blurred background from snapshot if provided (menu background otherwise)
+    fallback = None if snapshot else load_background("Background", (sw, sh))
 
     # fonts
     title_font_local = get_font(64)
@@ -160,6 +182,28 @@ def show_options(snapshot, screen_surface):
         pass
     _apply_master_volume()
 
+    def draw_static(surf):
+        pygame.draw.rect(surf, (40,40,40), panel)
+        pygame.draw.rect(surf, (120,120,120), panel, 4)
+
+        # move title a bit lower to add spacing from the top box line
+        t_s = title_font_local.render("Options", True, (200,200,200))
+        surf.blit(t_s, t_s.get_rect(center=(sw//2, panel.top+48)))
+
+        # audio label placed above the slider with more vertical spacing
+        lbl = button_font_local.render("Audio Volume", True, (220,220,220))
+        surf.blit(lbl, (panel.left+40, panel.top+110))
+
+        # slider track (the handle is drawn per frame)
+        pygame.draw.rect(surf, (80,80,80), slider_rect)
+        # keep button fill constant
+        pygame.draw.rect(surf, (180,180,180), apply_r)
+        pygame.draw.rect(surf, (180,180,180), back_r)
+    # backdrop + panel are static: built once per snapshot (shared with the pause menu's blur)
+    frame = modal.compose(snapshot, (sw, sh), 120, "options", draw_static, fallback)
+    apply_labels = modal.hover_labels(apply_font, "Apply")
+    back_labels = modal.hover_labels(apply_font, "Back")
+
     while True:
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -223,24 +267,9 @@ def show_options(snapshot, screen_surface):
                     pass
 
         # draw
-        screen_surface.blit(blurred, (0,0))
-        overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        overlay.fill((0,0,0,120))
-        screen_surface.blit(overlay, (0,0))
-
-        pygame.draw.rect(screen_surface, (40,40,40), panel)
-        pygame.draw.rect(screen_surface, (120,120,120), panel, 4)
-
-        # move title a bit lower to add spacing from the top box line
-        t_s = title_font_local.render("Options", True, (200,200,200))
-        screen_surface.blit(t_s, t_s.get_rect(center=(sw//2, panel.top+48)))
-
-        # audio label placed above the slider with more vertical spacing
-        lbl = button_font_local.render("Audio Volume", True, (220,220,220))
-        screen_surface.blit(lbl, (panel.left+40, panel.top+110))
+        screen_surface.blit(frame, (0,0))
 
-        # draw slider using panel-relative rect
-        pygame.draw.rect(screen_surface, (80,80,80), slider_rect)
+        # slider handle
         handle_x = slider_rect.left + int(vol * slider_rect.width)
         handle_rect = pygame.Rect(handle_x - handle_w//2, slider_rect.top - 6, handle_w, 20)
         pygame.draw.rect(screen_surface, (200,200,200), handle_rect)
@@ -249,14 +278,9 @@ def show_options(snapshot, screen_surface):
         mouse_pos = pygame.mouse.get_pos()
         apply_hover = apply_r.collidepoint(mouse_pos)
         back_hover = back_r.collidepoint(mouse_pos)
-        # keep button fill constant
-        pygame.draw.rect(screen_surface, (180,180,180), apply_r)
-        pygame.draw.rect(screen_surface, (180,180,180), back_r)
         # only change text color
-        a_txt_col = (0,200,0) if apply_hover else (0,0,0)
-        b_txt_col = (0,200,0) if back_hover  else (0,0,0)
-        a_surf = apply_font.render("Apply", True, a_txt_col)
-        b_surf = apply_font.render("Back", True, b_txt_col)
+        a_surf = apply_labels[1] if apply_hover else apply_labels[0]
+        b_surf = back_labels[1] if back_hover else back_labels[0]
         screen_surface.blit(a_surf, a_surf.get_rect(center=apply_r.center))
         screen_surface.blit(b_surf, b_surf.get_rect(center=back_r.center))
 
@@ -272,15 +296,8 @@ def show_pause_overlay(snapshot, screen_surface):
       ("menu", None) - quit to main menu
     """
     sw, sh = screen_surface.get_size()
-    # build blurred background from snapshot if provided
-    if snapshot:
-        try:
-            small = pygame.transform.smoothscale(snapshot, (max(1, sw//12), max(1, sh//12)))
-            blurred = pygame.transform.smoothscale(small, (sw, sh))
-        except Exception:
-            blurred = load_background("Background", (sw, sh))
-    else:
-        blurred = load_background("Background", (sw, sh))
+    # blurred background from snapshot if provided (menu background otherwise)
+    fallback = None if snapshot else load_background("Background", (sw, sh))
 
     title_f = get_font(48)
     btn_f = get_font(28)
@@ -292,6 +309,23 @@ def show_pause_overlay(snapshot, screen_surface):
     shop_rect = pygame.Rect((sw//2 - 120, sh//2 + 20, 240, 40))
     quit_rect = pygame.Rect((sw//2 - 120, sh//2 + 70, 240, 40))
 
+    def draw_static(surf):
+        panel_w, panel_h = 520, 360
+        panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
+        pygame.draw.rect(surf, (30,30,30), panel)
+        pygame.draw.rect(surf, (120,120,120), panel, 3)
+
+        title_surf = title_f.render("Paused", True, (220,220,220))
+        surf.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 40)))
+
+        # buttons (no hover state here, so the labels are static too)
+        for rect, text in ((resume_rect, "Resume (Esc)"), (options_rect, "Options"),
+                           (shop_rect, "Shop"), (quit_rect, "Quit to Menu")):
+            pygame.draw.rect(surf, (200,200,200), rect)
+            label = btn_f.render(text, True, (0,0,0))
+            surf.blit(label, label.get_rect(center=rect.center))
+    frame = modal.compose(snapshot, (sw, sh), 140, "menu_pause", draw_static, fallback)
+
     while True:
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -330,29 +364,7 @@ def show_pause_overlay(snapshot, screen_surface):
                     return ("menu", None)
 
         # draw overlay onto provided surface
-        screen_surface.blit(blurred, (0,0))
-        overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        overlay.fill((0,0,0,140))
-        screen_surface.blit(overlay, (0,0))
-
-        panel_w, panel_h = 520, 360
-        panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
-        pygame.draw.rect(screen_surface, (30,30,30), panel)
-        pygame.draw.rect(screen_surface, (120,120,120), panel, 3)
-
-        title_surf = title_f.render("Paused", True, (220,220,220))
-        screen_surface.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 40)))
-
-        # draw buttons
-        pygame.draw.rect(screen_surface, (200,200,200), resume_rect)
-        pygame.draw.rect(screen_surface, (200,200,200), options_rect)
-        pygame.draw.rect(screen_surface, (200,200,200), shop_rect)
-        pygame.draw.rect(screen_surface, (200,200,200), quit_rect)
-
-        screen_surface.blit(btn_f.render("Resume (Esc)", True, (0,0,0)), btn_f.render("Resume (Esc)", True, (0,0,0)).get_rect(center=resume_rect.center))
-        screen_surface.blit(btn_f.render("Options", True, (0,0,0)), btn_f.render("Options", True, (0,0,0)).get_rect(center=options_rect.center))
-        screen_surface.blit(btn_f.render("Shop", True, (0,0,0)), btn_f.render("Shop", True, (0,0,0)).get_rect(center=shop_rect.center))
-        screen_surface.blit(btn_f.render("Quit to Menu", True, (0,0,0)), btn_f.render("Quit to Menu", True, (0,0,0)).get_rect(center=quit_rect.center))
+        screen_surface.blit(frame, (0,0))
 
         pygame.display.update()
         clock_local.tick(60)
@@ -363,15 +375,8 @@ def show_shop(snapshot, screen_surface):
     Returns when user closes the shop (Back/Quit to Menu).
     """
     sw, sh = screen_surface.get_size()
-    # build blurred background from snapshot if provided
-    if snapshot:
-        try:
-            small = pygame.transform.smoothscale(snapshot, (max(1, sw//12), max(1, sh//12)))
-            blurred = pygame.transform.smoothscale(small, (sw, sh))
-        except Exception:
-            blurred = load_background("Background", (sw, sh))
-    else:
-        blurred = load_background("Background", (sw, sh))
+    # blurred background from snapshot if provided (menu background otherwise)
+    fallback = None if snapshot else load_background("Background", (sw, sh))
 
     title_f = get_font(44)
     item_f = get_font(16)
@@ -540,6 +545,18 @@ def show_shop(snapshot, screen_surface):
     except Exception:
         armors_equipped = None
 
+    # NEW: keep coins / equipped armor in sync with the profile instead of re-reading it
+    def _on_profile_changed(changes):
+        nonlocal coins, armors_equipped
+        if "coins" in changes:
+            try:
+                coins = int(changes.get("coins") or 0)
+            except Exception:
+                pass
+        if "equipped_armor" in changes:
+            _eq = (changes.get("equipped_armor") or "").strip()
+            armors_equipped = armors.index(_eq) if _eq in armors else None
+
     # Font for resolution display (smaller than other fonts)
     res_font_local = get_font(11)
 
@@ -559,14 +576,7 @@ def show_shop(snapshot, screen_surface):
             snap2 = screen_surface.copy()
         except Exception:
             snap2 = None
-        if snap2:
-            try:
-                small = pygame.transform.smoothscale(snap2, (max(1, sw2//12), max(1, sh2//12)))
-                bg = pygame.transform.smoothscale(small, (sw2, sh2))
-            except Exception:
-                bg = load_background("Background", (sw2, sh2))
-        else:
-            bg = load_background("Background", (sw2, sh2))
+        fallback2 = None if snap2 else load_background("Background", (sw2, sh2))
 
         title_font = get_font(36)
         body_font = get_font(18)
@@ -648,6 +658,36 @@ def show_shop(snapshot, screen_surface):
             ladder = {1: 1, 2: 2, 3: 3}
             return ladder.get(cur_level)
 
+        img_w = min(panel_w//2, 320)
+        img_h = img_w
+        tx = panel.left + 24 + img_w + 20
+        ty = panel.top + 70
+        # wrap description to fit the right area
+        desc_area_w = panel.right - tx - 24
+        wrapped = wrap_text(desc, body_font, max(10, desc_area_w))
+        # limit how many lines fit in the area (leave space for price and buttons)
+        max_lines = max(1, (panel_h - 160) // (body_font.get_linesize() + 2))
+
+        def draw_item_static(surf):
+            pygame.draw.rect(surf, (28,28,28), panel)
+            pygame.draw.rect(surf, (140,140,140), panel, 3)
+            title_s = title_font.render(item_name, True, (220,220,220))
+            surf.blit(title_s, title_s.get_rect(topleft=(panel.left+24, panel.top+18)))
+
+            # large image area (center-left)
+            try:
+                big_img = pygame.transform.smoothscale(item_image, (img_w, img_h))
+            except Exception:
+                big_img = pygame.Surface((img_w, img_h))
+                big_img.fill((100,100,100))
+            surf.blit(big_img, (panel.left+24, panel.top+70))
+
+            # description text on the right
+            for i, line in enumerate(wrapped[:max_lines]):
+                line_s = body_font.render(line, True, (200,200,200))
+                surf.blit(line_s, (tx, ty + i * (body_font.get_linesize() + 2)))
+        item_frame = modal.compose(snap2, (sw2, sh2), 160, ("item", item_name), draw_item_static, fallback2)
+
         while True:
             dtm = clock_modal.tick(60)
             # precompute action rects
@@ -734,38 +774,8 @@ def show_shop(snapshot, screen_surface):
                             except Exception: pass
                             return ("back", None)
 
-            # draw modal
-            screen_surface.blit(bg, (0,0))
-            overlay = pygame.Surface((sw2, sh2), pygame.SRCALPHA)
-            overlay.fill((0,0,0,160))
-            screen_surface.blit(overlay, (0,0))
-
-            pygame.draw.rect(screen_surface, (28,28,28), panel)
-            pygame.draw.rect(screen_surface, (140,140,140), panel, 3)
-            title_s = title_font.render(item_name, True, (220,220,220))
-            screen_surface.blit(title_s, title_s.get_rect(topleft=(panel.left+24, panel.top+18)))
-
-            # large image area (center-left)
-            img_w = min(panel_w//2, 320)
-            img_h = img_w
-            try:
-                big_img = pygame.transform.smoothscale(item_image, (img_w, img_h))
-            except Exception:
-                big_img = pygame.Surface((img_w, img_h))
-                big_img.fill((100,100,100))
-            screen_surface.blit(big_img, (panel.left+24, panel.top+70))
-
-            # description text on the right
-            tx = panel.left + 24 + img_w + 20
-            ty = panel.top + 70
-            # wrap description to fit the right area
-            desc_area_w = panel.right - tx - 24
-            wrapped = wrap_text(desc, body_font, max(10, desc_area_w))
-            # limit how many lines fit in the area (leave space for price and buttons)
-            max_lines = max(1, (panel_h - 160) // (body_font.get_linesize() + 2))
-            for i, line in enumerate(wrapped[:max_lines]):
-                surf = body_font.render(line, True, (200,200,200))
-                screen_surface.blit(surf, (tx, ty + i * (body_font.get_linesize() + 2)))
+            # draw modal: backdrop, panel, title, image and description are static
+            screen_surface.blit(item_frame, (0,0))
             # price/upgrade line under description (gold)
             price_y = ty + (min(len(wrapped), max_lines)) * (body_font.get_linesize() + 2) + 8
             if not purchased:
@@ -835,9 +845,7 @@ def show_shop(snapshot, screen_surface):
         try:
             p = base.joinpath("sprites", fname)
             if p.exists():
-                img = pygame.image.load(str(p)).convert_alpha()
-                img = pygame.transform.smoothscale(img, (img_size, img_size))
-                weapons_imgs[wname] = img
+                weapons_imgs[wname] = atlas.sprite(fname, img_size, smooth=True)
         except Exception:
             pass
     # generic fallback graphic for missing images
@@ -852,8 +860,7 @@ def show_shop(snapshot, screen_surface):
     try:
         p = base.joinpath("sprites", "armor_pic.png")
         if p.exists():
-            sword_img = pygame.image.load(str(p)).convert_alpha()
-            sword_img = pygame.transform.smoothscale(sword_img, (96, 96))
+            sword_img = atlas.sprite("armor_pic.png", 96, smooth=True)
     except Exception:
         sword_img = None
     if sword_img is None:
@@ -873,9 +880,7 @@ def show_shop(snapshot, screen_surface):
         try:
             p = base.joinpath("sprites", fname)
             if p.exists():
-                img = pygame.image.load(str(p)).convert_alpha()
-                img = pygame.transform.smoothscale(img, (img_size, img_size))
-                armors_imgs[aname] = img
+                armors_imgs[aname] = atlas.sprite(fname, img_size, smooth=True)
         except Exception:
             pass
     for name in armors:
@@ -959,405 +964,411 @@ def show_shop(snapshot, screen_surface):
                 break
         return lines
 
-    while True:
-        # reset click state each frame so old clicks don't persist
-        clicked_pos = None
-        for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                # NEW: persist upgrades on hard close
-                try:
-                    persist_shop_state()
-                except Exception:
-                    pass
-                return ("menu", None)
-            if ev.type == pygame.KEYDOWN:
-                if ev.key == pygame.K_ESCAPE:
-                    return ("resume", None)
-                if ev.key == pygame.K_TAB:
-                    # toggle focused row
-                    focused_row = "armors" if focused_row == "weapons" else "weapons"
-                if ev.key == pygame.K_RIGHT:
-                    # move selection in focused row
-                    if focused_row == "weapons":
-                        weapons_selected = min(len(weapons)-1, weapons_selected+1)
-                    else:
-                        armors_selected = min(len(armors)-1, armors_selected+1)
-                if ev.key == pygame.K_LEFT:
-                    if focused_row == "weapons":
-                        weapons_selected = max(0, weapons_selected-1)
-                    else:
-                        armors_selected = max(0, armors_selected-1)
-            if ev.type == pygame.MOUSEBUTTONDOWN:
-                # only treat left-click as selection/click
-                if ev.button == 1:
-                    if back_rect.collidepoint(ev.pos):
-                        # NEW: click SFX on back button and persist upgrades before leaving
-                        try: sounds.play_sfx('SelectSound')
-                        except Exception: pass
-                        try:
-                            persist_shop_state()
-                        except Exception:
-                            pass
+    # shop panel + title never change while the shop is open: composed onto the backdrop once
+    def draw_shop_static(surf):
+        panel = pygame.Rect((80, 80, sw - 160, sh - 160))
+        pygame.draw.rect(surf, (30,30,30), panel)
+        pygame.draw.rect(surf, (120,120,120), panel, 3)
+        title_surf = title_f.render("Shop", True, (220,220,220))
+        surf.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 36)))
+
+    # subscribed only for the loop; the finally drops it on any way out (returns, errors)
+    save.subscribe(_on_profile_changed, keys=("coins", "equipped_armor"))
+    try:
+        while True:
+            # reset click state each frame so old clicks don't persist
+            clicked_pos = None
+            for ev in pygame.event.get():
+                if ev.type == pygame.QUIT:
+                    # NEW: persist upgrades on hard close
+                    try:
+                        persist_shop_state()
+                    except Exception:
+                        pass
+                    return ("menu", None)
+                if ev.type == pygame.KEYDOWN:
+                    if ev.key == pygame.K_ESCAPE:
                         return ("resume", None)
-                    # record click position for later per-row handling
-                    clicked_pos = ev.pos
-                # allow horizontal scroll with wheel
-                if ev.button == 4:  # wheel up
-                    weapons_offset += 40
-                    armors_offset += 40
-                if ev.button == 5:  # wheel down
-                    weapons_offset -= 40
-                    armors_offset -= 40
-
-                # other buttons ignored for click selection
-
-        # clamp scrolling so user can't scroll too far
-        max_scroll = max(0, (len(weapons) * (item_w + spacing)) - (sw - margin_x*2))
-        weapons_offset = max(-max_scroll, min(0, weapons_offset))
-        armors_offset = max(-max_scroll, min(0, armors_offset))
-
-        screen_surface.blit(blurred, (0,0))
-        overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        overlay.fill((0,0,0,140))
-        screen_surface.blit(overlay, (0,0))
+                    if ev.key == pygame.K_TAB:
+                        # toggle focused row
+                        focused_row = "armors" if focused_row == "weapons" else "weapons"
+                    if ev.key == pygame.K_RIGHT:
+                        # move selection in focused row
+                        if focused_row == "weapons":
+                            weapons_selected = min(len(weapons)-1, weapons_selected+1)
+                        else:
+                            armors_selected = min(len(armors)-1, armors_selected+1)
+                    if ev.key == pygame.K_LEFT:
+                        if focused_row == "weapons":
+                            weapons_selected = max(0, weapons_selected-1)
+                        else:
+                            armors_selected = max(0, armors_selected-1)
+                if ev.type == pygame.MOUSEBUTTONDOWN:
+                    # only treat left-click as selection/click
+                    if ev.button == 1:
+                        if back_rect.collidepoint(ev.pos):
+                            # NEW: click SFX on back button and persist upgrades before leaving
+                            try: sounds.play_sfx('SelectSound')
+                            except Exception: pass
+                            try:
+                                persist_shop_state()
+                            except Exception:
+                                pass
+                            return ("resume", None)
+                        # record click position for later per-row handling
+                        clicked_pos = ev.pos
+                    # allow horizontal scroll with wheel
+                    if ev.button == 4:  # wheel up
+                        weapons_offset += 40
+                        armors_offset += 40
+                    if ev.button == 5:  # wheel down
+                        weapons_offset -= 40
+                        armors_offset -= 40
+
+                    # other buttons ignored for click selection
+
+            # clamp scrolling so user can't scroll too far
+            max_scroll = max(0, (len(weapons) * (item_w + spacing)) - (sw - margin_x*2))
+            weapons_offset = max(-max_scroll, min(0, weapons_offset))
+            armors_offset = max(-max_scroll, min(0, armors_offset))
+
+            # backdrop, shop panel and title (cached; see draw_shop_static)
+            screen_surface.blit(modal.compose(snapshot, (sw, sh), 140, "shop", draw_shop_static, fallback), (0,0))
+
+            # draw coin panel with icon and rounded borders
+            coin_panel = pygame.Rect(sw - 220, 12, 200, 48)
+            try:
+                pygame.draw.rect(screen_surface, (30,30,30), coin_panel, border_radius=10)
+                pygame.draw.rect(screen_surface, (120,120,120), coin_panel, 2, border_radius=10)
+                gold = (212,175,55)
+                cx = coin_panel.left + 12
+                cy = coin_panel.centery
+                if coin_img:
+                    img_rect = coin_img.get_rect(center=(cx + coin_img.get_width()//2, cy))
+                    screen_surface.blit(coin_img, img_rect.topleft)
+                    text_x = img_rect.right + 8
+                else:
+                    text_x = coin_panel.left + 10
+                txt = btn_f.render(str(int(coins)), True, gold)
+                ty = coin_panel.centery - txt.get_height()//2
+                screen_surface.blit(txt, (text_x, ty))
+            except Exception:
+                pass
 
-        # draw coin panel with icon and rounded borders
-        coin_panel = pygame.Rect(sw - 220, 12, 200, 48)
-        try:
-            pygame.draw.rect(screen_surface, (30,30,30), coin_panel, border_radius=10)
-            pygame.draw.rect(screen_surface, (120,120,120), coin_panel, 2, border_radius=10)
-            gold = (212,175,55)
-            cx = coin_panel.left + 12
-            cy = coin_panel.centery
-            if coin_img:
-                img_rect = coin_img.get_rect(center=(cx + coin_img.get_width()//2, cy))
-                screen_surface.blit(coin_img, img_rect.topleft)
-                text_x = img_rect.right + 8
+            panel_w, panel_h = sw - 160, sh - 160
+            panel = pygame.Rect((80, 80, panel_w, panel_h))
+
+            # draw weapons row
+            # moved weapons row a bit down so it has breathing room
+            y_weapons = panel.top + 120
+            # compute available visible area and center rows when content is narrower
+            visible_left = panel.left + margin_x
+            visible_w = panel_w - margin_x*2
+            total_weapons_w = max(0, len(weapons) * (item_w + spacing) - spacing)
+            if total_weapons_w < visible_w:
+                x_start_weapons = panel.left + (panel_w - total_weapons_w) // 2
             else:
-                text_x = coin_panel.left + 10
-            txt = btn_f.render(str(int(coins)), True, gold)
-            ty = coin_panel.centery - txt.get_height()//2
-            screen_surface.blit(txt, (text_x, ty))
-        except Exception:
-            pass
-
-        panel_w, panel_h = sw - 160, sh - 160
-        panel = pygame.Rect((80, 80, panel_w, panel_h))
-        pygame.draw.rect(screen_surface, (30,30,30), panel)
-        pygame.draw.rect(screen_surface, (120,120,120), panel, 3)
-
-        title_surf = title_f.render("Shop", True, (220,220,220))
-        screen_surface.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 36)))
-
-        # draw weapons row
-        # moved weapons row a bit down so it has breathing room
-        y_weapons = panel.top + 120
-        # compute available visible area and center rows when content is narrower
-        visible_left = panel.left + margin_x
-        visible_w = panel_w - margin_x*2
-        total_weapons_w = max(0, len(weapons) * (item_w + spacing) - spacing)
-        if total_weapons_w < visible_w:
-            x_start_weapons = panel.left + (panel_w - total_weapons_w) // 2
-        else:
-            x_start_weapons = panel.left + margin_x
-        # same for armors (computed later), default x_start for weapons usage below:
-        x_start = x_start_weapons
-
-        # center the "Weapons" label above the row
-        w_label = item_f.render("Weapons", True, (200,200,200))
-        screen_surface.blit(w_label, w_label.get_rect(center=(panel.left + panel_w//2, y_weapons - 22)))
-
-        # left/right arrow rects for weapons
-        # arrows: larger and vertically centered on the item boxes, slightly inset horizontally
-        w_left_rect = pygame.Rect(panel.left + 24, y_weapons + (item_w - arrow_h)//2, arrow_w, arrow_h)
-        w_right_rect = pygame.Rect(panel.right - 24 - arrow_w, y_weapons + (item_w - arrow_h)//2, arrow_w, arrow_h)
-        pygame.draw.rect(screen_surface, (80,80,80), w_left_rect)
-        pygame.draw.rect(screen_surface, (80,80,80), w_right_rect)
-        screen_surface.blit(item_f.render("<", True, (220,220,220)), (w_left_rect.left+12, w_left_rect.top+6))
-        screen_surface.blit(item_f.render(">", True, (220,220,220)), (w_right_rect.left+12, w_right_rect.top+6))
-
-        for i, name in enumerate(weapons):
-            x = x_start_weapons + i * (item_w + spacing) + weapons_offset
-            item_rect = pygame.Rect(x, y_weapons, item_w, 120)
-             # only draw if visible
-            if item_rect.right >= panel.left + 10 and item_rect.left <= panel.right - 10:
-                pygame.draw.rect(screen_surface, (50,50,50), item_rect)
-                img = weapons_imgs.get(name, sword_img)
-                try:
-                    screen_surface.blit(img, img.get_rect(center=item_rect.center))
-                except Exception:
-                    screen_surface.blit(sword_img, sword_img.get_rect(center=item_rect.center))
-                # Draw name in up to two lines
-                try:
-                    max_name_w = item_w + 16
-                    name_lines = wrap_name_lines(name, item_f, max_name_w, 2)
-                    line_h = item_f.get_linesize()
-                    start_y = item_rect.bottom + 6
-                    for j, line in enumerate(name_lines):
-                        nm = item_f.render(line, True, (220,220,220))
-                        screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, start_y + j * (line_h + 2))))
-                except Exception:
-                    nm = item_f.render(name, True, (220,220,220))
-                    screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, item_rect.bottom + 8)))
-
-                # show upgrade level if purchased
-                lvl = weapons_upgrades.get(name, 0)
-                try:
-                    lvl_font = get_font(12)
-                    lvl_text = lvl_font.render(f"Lv {lvl}", True, (200,200,120))
-                    screen_surface.blit(lvl_text, (item_rect.right - lvl_text.get_width() - 6, item_rect.top + 6))
-                except Exception:
-                    pass
+                x_start_weapons = panel.left + margin_x
+            # same for armors (computed later), default x_start for weapons usage below:
+            x_start = x_start_weapons
+
+            # center the "Weapons" label above the row
+            w_label = item_f.render("Weapons", True, (200,200,200))
+            screen_surface.blit(w_label, w_label.get_rect(center=(panel.left + panel_w//2, y_weapons - 22)))
+
+            # left/right arrow rects for weapons
+            # arrows: larger and vertically centered on the item boxes, slightly inset horizontally
+            w_left_rect = pygame.Rect(panel.left + 24, y_weapons + (item_w - arrow_h)//2, arrow_w, arrow_h)
+            w_right_rect = pygame.Rect(panel.right - 24 - arrow_w, y_weapons + (item_w - arrow_h)//2, arrow_w, arrow_h)
+            pygame.draw.rect(screen_surface, (80,80,80), w_left_rect)
+            pygame.draw.rect(screen_surface, (80,80,80), w_right_rect)
+            screen_surface.blit(item_f.render("<", True, (220,220,220)), (w_left_rect.left+12, w_left_rect.top+6))
+            screen_surface.blit(item_f.render(">", True, (220,220,220)), (w_right_rect.left+12, w_right_rect.top+6))
+
+            for i, name in enumerate(weapons):
+                x = x_start_weapons + i * (item_w + spacing) + weapons_offset
+                item_rect = pygame.Rect(x, y_weapons, item_w, 120)
+                 # only draw if visible
+                if item_rect.right >= panel.left + 10 and item_rect.left <= panel.right - 10:
+                    pygame.draw.rect(screen_surface, (50,50,50), item_rect)
+                    img = weapons_imgs.get(name, sword_img)
+                    try:
+                        screen_surface.blit(img, img.get_rect(center=item_rect.center))
+                    except Exception:
+                        screen_surface.blit(sword_img, sword_img.get_rect(center=item_rect.center))
+                    # Draw name in up to two lines
+                    try:
+                        max_name_w = item_w + 16
+                        name_lines = wrap_name_lines(name, item_f, max_name_w, 2)
+                        line_h = item_f.get_linesize()
+                        start_y = item_rect.bottom + 6
+                        for j, line in enumerate(name_lines):
+                            nm = item_f.render(line, True, (220,220,220))
+                            screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, start_y + j * (line_h + 2))))
+                    except Exception:
+                        nm = item_f.render(name, True, (220,220,220))
+                        screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, item_rect.bottom + 8)))
 
-                # dim/lock overlay for items not purchased
-                if name not in weapons_purchased:
+                    # show upgrade level if purchased
+                    lvl = weapons_upgrades.get(name, 0)
                     try:
-                        lock_s = pygame.Surface((item_rect.width, item_rect.height), pygame.SRCALPHA)
-                        lock_s.fill((0,0,0,160))
-                        screen_surface.blit(lock_s, item_rect.topleft)
-                        lock_font = get_font(14)
-                        lock_surf = lock_font.render("Locked", True, (180,80,80))
-                        screen_surface.blit(lock_surf, lock_surf.get_rect(center=item_rect.center))
+                        lvl_font = get_font(12)
+                        lvl_text = lvl_font.render(f"Lv {lvl}", True, (200,200,120))
+                        screen_surface.blit(lvl_text, (item_rect.right - lvl_text.get_width() - 6, item_rect.top + 6))
                     except Exception:
-                        pygame.draw.rect(screen_surface, (30,30,30), item_rect)
-
-                # REMOVE label: "Equipped" text on tile — keep only green border
-                # (deleted the small text overlay)
-
-                # outline equipped (green) always; outline focused selection (gold) only when row focused
-                if weapons_equipped == i:
-                    pygame.draw.rect(screen_surface, (0,200,0), item_rect, 3)
-                elif i == weapons_selected and focused_row == "weapons":
-                    pygame.draw.rect(screen_surface, (255,220,80), item_rect, 3)
-
-        # handle clicks on weapon arrows/items
-        if clicked_pos:
-            mx,my = clicked_pos
-            if w_left_rect.collidepoint((mx,my)):
-                weapons_selected = max(0, weapons_selected-1)
-                focused_row = "weapons"
-                # NEW: click SFX
-                try: sounds.play_sfx('SelectSound')
-                except Exception: pass
-            elif w_right_rect.collidepoint((mx,my)):
-                weapons_selected = min(len(weapons)-1, weapons_selected+1)
-                focused_row = "weapons"
-                # NEW: click SFX
-                try: sounds.play_sfx('SelectSound')
-                except Exception: pass
-            else:
-                # item clicks
-                for i in range(len(weapons)):
-                    x = x_start_weapons + i * (item_w + spacing) + weapons_offset
-                    item_rect = pygame.Rect(x, y_weapons, item_w, 120)
-                    if item_rect.collidepoint((mx,my)):
-                        weapons_selected = i
-                        focused_row = "weapons"
-                        # NEW: click SFX on opening item page
-                        try: sounds.play_sfx('SelectSound')
-                        except Exception: pass
-                        # open item detail page
+                        pass
+
+                    # dim/lock overlay for items not purchased
+                    if name not in weapons_purchased:
                         try:
-                            res = show_item_page(weapons[i], weapons_imgs.get(weapons[i], sword_img))
-                            # persist purchase/equip if requested
-                            if res and res[0] == "equip":
-                                weapons_purchased.add(res[1])
-                                try:
-                                    idx = weapons.index(res[1])
-                                    weapons_equipped = idx  # remains in sync with border
-                                except Exception:
-                                    pass
-                            # UPDATED: handle upgrade to max Level 4 (starts at 1, +3 upgrades)
-                            if res and res[0] == "upgrade":
-                                try:
-                                    cur = weapons_upgrades.get(res[1], 0)
-                                    weapons_upgrades[res[1]] = min(4, cur + 1)
-                                except Exception:
-                                    pass
+                            lock_s = pygame.Surface((item_rect.width, item_rect.height), pygame.SRCALPHA)
+                            lock_s.fill((0,0,0,160))
+                            screen_surface.blit(lock_s, item_rect.topleft)
+                            lock_font = get_font(14)
+                            lock_surf = lock_font.render("Locked", True, (180,80,80))
+                            screen_surface.blit(lock_surf, lock_surf.get_rect(center=item_rect.center))
                         except Exception:
-                            pass
-                        clicked_pos = None
-                        break
-
-        # draw armors row
-        y_armors = y_weapons + row_gap
-        # center the "Armor" label above the armor row
-        a_label = item_f.render("Armors", True, (200,200,200))
-        # slightly lower the label so there's clearer space from the weapons row
-        screen_surface.blit(a_label, a_label.get_rect(center=(panel.left + panel_w//2, y_armors - 20)))
-
-        # left/right arrow rects for armors
-        # armor arrows also centered vertically relative to armor box
-        a_left_rect = pygame.Rect(panel.left + 24, y_armors + (item_w - arrow_h)//2, arrow_w, arrow_h)
-        a_right_rect = pygame.Rect(panel.right - 24 - arrow_w, y_armors + (item_w - arrow_h)//2, arrow_w, arrow_h)
-        pygame.draw.rect(screen_surface, (80,80,80), a_left_rect)
-        pygame.draw.rect(screen_surface, (80,80,80), a_right_rect)
-        screen_surface.blit(item_f.render("<", True, (220,220,220)), (a_left_rect.left+12, a_left_rect.top+6))
-        screen_surface.blit(item_f.render(">", True, (220,220,220)), (a_right_rect.left+12, a_right_rect.top+6))
-
-        # compute armors x_start (center when narrow)
-        total_armors_w = max(0, len(armors) * (item_w + spacing) - spacing)
-        if total_armors_w < visible_w:
-            x_start_armors = panel.left + (panel_w - total_armors_w) // 2
-        else:
-            x_start_armors = panel.left + margin_x
-
-        for i, name in enumerate(armors):
-            x = x_start_armors + i * (item_w + spacing) + armors_offset
-            item_rect = pygame.Rect(x, y_armors, item_w, 120)
-            if item_rect.right >= panel.left + 10 and item_rect.left <= panel.right - 10:
-                pygame.draw.rect(screen_surface, (50,50,50), item_rect)
-                # UPDATED: use armor-specific image
-                img = armors_imgs.get(name, sword_img)
-                screen_surface.blit(img, img.get_rect(center=item_rect.center))
-                # draw name below, wrapped to two lines
-                try:
-                    max_name_w = item_w + 16
-                    name_lines = wrap_name_lines(name, item_f, max_name_w, 2)
-                    line_h = item_f.get_linesize()
-                    start_y = item_rect.bottom + 6
-                    for j, line in enumerate(name_lines):
-                        nm = item_f.render(line, True, (220,220,220))
-                        screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, start_y + j * (line_h + 2))))
-                except Exception:
-                    nm = item_f.render(name, True, (220,220,220))
-                    screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, item_rect.bottom + 8)))
-
-                # dim/lock overlay for unpurchased armors
-                if name not in armors_purchased:
+                            pygame.draw.rect(screen_surface, (30,30,30), item_rect)
+
+                    # REMOVE label: "Equipped" text on tile — keep only green border
+                    # (deleted the small text overlay)
+
+                    # outline equipped (green) always; outline focused selection (gold) only when row focused
+                    if weapons_equipped == i:
+                        pygame.draw.rect(screen_surface, (0,200,0), item_rect, 3)
+                    elif i == weapons_selected and focused_row == "weapons":
+                        pygame.draw.rect(screen_surface, (255,220,80), item_rect, 3)
+
+            # handle clicks on weapon arrows/items
+            if clicked_pos:
+                mx,my = clicked_pos
+                if w_left_rect.collidepoint((mx,my)):
+                    weapons_selected = max(0, weapons_selected-1)
+                    focused_row = "weapons"
+                    # NEW: click SFX
+                    try: sounds.play_sfx('SelectSound')
+                    except Exception: pass
+                elif w_right_rect.collidepoint((mx,my)):
+                    weapons_selected = min(len(weapons)-1, weapons_selected+1)
+                    focused_row = "weapons"
+                    # NEW: click SFX
+                    try: sounds.play_sfx('SelectSound')
+                    except Exception: pass
+                else:
+                    # item clicks
+                    for i in range(len(weapons)):
+                        x = x_start_weapons + i * (item_w + spacing) + weapons_offset
+                        item_rect = pygame.Rect(x, y_weapons, item_w, 120)
+                        if item_rect.collidepoint((mx,my)):
+                            weapons_selected = i
+                            focused_row = "weapons"
+                            # NEW: click SFX on opening item page
+                            try: sounds.play_sfx('SelectSound')
+                            except Exception: pass
+                            # open item detail page
+                            try:
+                                res = show_item_page(weapons[i], weapons_imgs.get(weapons[i], sword_img))
+                                # persist purchase/equip if requested
+                                if res and res[0] == "equip":
+                                    weapons_purchased.add(res[1])
+                                    try:
+                                        idx = weapons.index(res[1])
+                                        weapons_equipped = idx  # remains in sync with border
+                                    except Exception:
+                                        pass
+                                # UPDATED: handle upgrade to max Level 4 (starts at 1, +3 upgrades)
+                                if res and res[0] == "upgrade":
+                                    try:
+                                        cur = weapons_upgrades.get(res[1], 0)
+                                        weapons_upgrades[res[1]] = min(4, cur + 1)
+                                    except Exception:
+                                        pass
+                            except Exception:
+                                pass
+                            clicked_pos = None
+                            break
+
+            # draw armors row
+            y_armors = y_weapons + row_gap
+            # center the "Armor" label above the armor row
+            a_label = item_f.render("Armors", True, (200,200,200))
+            # slightly lower the label so there's clearer space from the weapons row
+            screen_surface.blit(a_label, a_label.get_rect(center=(panel.left + panel_w//2, y_armors - 20)))
+
+            # left/right arrow rects for armors
+            # armor arrows also centered vertically relative to armor box
+            a_left_rect = pygame.Rect(panel.left + 24, y_armors + (item_w - arrow_h)//2, arrow_w, arrow_h)
+            a_right_rect = pygame.Rect(panel.right - 24 - arrow_w, y_armors + (item_w - arrow_h)//2, arrow_w, arrow_h)
+            pygame.draw.rect(screen_surface, (80,80,80), a_left_rect)
+            pygame.draw.rect(screen_surface, (80,80,80), a_right_rect)
+            screen_surface.blit(item_f.render("<", True, (220,220,220)), (a_left_rect.left+12, a_left_rect.top+6))
+            screen_surface.blit(item_f.render(">", True, (220,220,220)), (a_right_rect.left+12, a_right_rect.top+6))
+
+            # compute armors x_start (center when narrow)
+            total_armors_w = max(0, len(armors) * (item_w + spacing) - spacing)
+            if total_armors_w < visible_w:
+                x_start_armors = panel.left + (panel_w - total_armors_w) // 2
+            else:
+                x_start_armors = panel.left + margin_x
+
+            for i, name in enumerate(armors):
+                x = x_start_armors + i * (item_w + spacing) + armors_offset
+                item_rect = pygame.Rect(x, y_armors, item_w, 120)
+                if item_rect.right >= panel.left + 10 and item_rect.left <= panel.right - 10:
+                    pygame.draw.rect(screen_surface, (50,50,50), item_rect)
+                    # UPDATED: use armor-specific image
+                    img = armors_imgs.get(name, sword_img)
+                    screen_surface.blit(img, img.get_rect(center=item_rect.center))
+                    # draw name below, wrapped to two lines
                     try:
-                        lock_s = pygame.Surface((item_rect.width, item_rect.height), pygame.SRCALPHA)
-                        lock_s.fill((0,0,0,160))
-                        screen_surface.blit(lock_s, item_rect.topleft)
-                        lock_font = get_font(14)
-                        lock_surf = lock_font.render("Locked", True, (180,80,80))
-                        screen_surface.blit(lock_surf, lock_surf.get_rect(center=item_rect.center))
+                        max_name_w = item_w + 16
+                        name_lines = wrap_name_lines(name, item_f, max_name_w, 2)
+                        line_h = item_f.get_linesize()
+                        start_y = item_rect.bottom + 6
+                        for j, line in enumerate(name_lines):
+                            nm = item_f.render(line, True, (220,220,220))
+                            screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, start_y + j * (line_h + 2))))
                     except Exception:
-                        pygame.draw.rect(screen_surface, (30,30,30), item_rect)
-
-                # outline equipped (green) and focused (gold)
-                if armors_equipped == i:
-                    pygame.draw.rect(screen_surface, (0,200,0), item_rect, 3)
-                elif i == armors_selected and focused_row == "armors":
-                    pygame.draw.rect(screen_surface, (255,220,80), item_rect, 3)
-
-        # handle clicks on armor arrows/items
-        if clicked_pos:
-            mx,my = clicked_pos
-            if a_left_rect.collidepoint((mx,my)):
-                armors_selected = max(0, armors_selected-1)
-                focused_row = "armors"
-                # NEW: click SFX
-                try: sounds.play_sfx('SelectSound')
-                except Exception: pass
-            elif a_right_rect.collidepoint((mx,my)):
-                armors_selected = min(len(armors)-1, armors_selected+1)
-                focused_row = "armors"
-                # NEW: click SFX
-                try: sounds.play_sfx('SelectSound')
-                except Exception: pass
-            else:
-                for i in range(len(armors)):
-                    x = x_start_armors + i * (item_w + spacing) + armors_offset
-                    item_rect = pygame.Rect(x, y_armors, item_w, 120)
-                    if item_rect.collidepoint((mx,my)):
-                        armors_selected = i
-                        focused_row = "armors"
-                        try: sounds.play_sfx('SelectSound')
-                        except Exception: pass
+                        nm = item_f.render(name, True, (220,220,220))
+                        screen_surface.blit(nm, nm.get_rect(midtop=(item_rect.centerx, item_rect.bottom + 8)))
+
+                    # dim/lock overlay for unpurchased armors
+                    if name not in armors_purchased:
                         try:
-                            # UPDATED: pass the correct armor image to modal
-                            res = show_item_page(armors[i], armors_imgs.get(armors[i], sword_img))
-                            if res and res[0] == "equip":
-                                armors_purchased.add(res[1])
-                                try:
-                                    idx = armors.index(res[1])
-                                    armors_equipped = idx
-                                    persist_equipped_armor(res[1])
-                                except Exception:
-                                    pass
-                            if res and res[0] == "unequip":
-                                # clear equipped armor
-                                armors_equipped = None
-                                try:
-                                    persist_equipped_armor("")
-                                except Exception:
-                                    pass
+                            lock_s = pygame.Surface((item_rect.width, item_rect.height), pygame.SRCALPHA)
+                            lock_s.fill((0,0,0,160))
+                            screen_surface.blit(lock_s, item_rect.topleft)
+                            lock_font = get_font(14)
+                            lock_surf = lock_font.render("Locked", True, (180,80,80))
+                            screen_surface.blit(lock_surf, lock_surf.get_rect(center=item_rect.center))
                         except Exception:
-                            pass
-                        clicked_pos = None
-                        break
-
-        # center offsets on selection so focused selected item is visible
-        # compute desired offsets to center selected item
-        visible_left = panel.left + margin_x
-        visible_w = panel_w - margin_x*2
-        if focused_row == "weapons":
-            targ_x = x_start_weapons + weapons_selected * (item_w + spacing)
-            desired = visible_left + (visible_w - item_w)//2
-            weapons_offset = desired - targ_x
-        else:
-            targ_x = x_start_armors + armors_selected * (item_w + spacing)
-            desired = visible_left + (visible_w - item_w)//2
-            armors_offset = desired - targ_x
-
-        # clamp again after centering using per-row scroll limits
-        max_scroll_weapons = max(0, total_weapons_w - visible_w)
-        max_scroll_armors = max(0, total_armors_w - visible_w)
-        weapons_offset = max(-max_scroll_weapons, min(0, weapons_offset))
-        armors_offset = max(-max_scroll_armors, min(0, armors_offset))
-
-        # Description preview box at the bottom of the panel for the highlighted item.
-        # Place it above the Back button to avoid overlap.
-        desc_panel_h = 72
-        desc_panel_top = max(panel.top + 120, back_rect.top - 12 - desc_panel_h)
-        desc_panel = pygame.Rect(panel.left + 20, desc_panel_top, panel_w - 40, desc_panel_h)
-        pygame.draw.rect(screen_surface, (24,24,24), desc_panel)
-        pygame.draw.rect(screen_surface, (100,100,100), desc_panel, 2)
-        # determine highlighted item (by focused_row)
-        if focused_row == "weapons":
-            cur_name = weapons[weapons_selected] if 0 <= weapons_selected < len(weapons) else ""
-        else:
-            cur_name = armors[armors_selected] if 0 <= armors_selected < len(armors) else ""
-        # use same resolver as modal so preview and modal match
-        cur_desc = resolve_desc(cur_name)
-        # render wrapped description inside desc_panel with spacing between name and description
-        wrap_font = get_font(16)
-        def wrap_text_local(text: str, font: pygame.font.Font, max_w: int):
-            words = text.split()
-            if not words:
-                return []
-            lines = []
-            cur = words[0]
-            for w in words[1:]:
-                test = cur + " " + w
-                if font.size(test)[0] <= max_w:
-                    cur = test
+                            pygame.draw.rect(screen_surface, (30,30,30), item_rect)
+
+                    # outline equipped (green) and focused (gold)
+                    if armors_equipped == i:
+                        pygame.draw.rect(screen_surface, (0,200,0), item_rect, 3)
+                    elif i == armors_selected and focused_row == "armors":
+                        pygame.draw.rect(screen_surface, (255,220,80), item_rect, 3)
+
+            # handle clicks on armor arrows/items
+            if clicked_pos:
+                mx,my = clicked_pos
+                if a_left_rect.collidepoint((mx,my)):
+                    armors_selected = max(0, armors_selected-1)
+                    focused_row = "armors"
+                    # NEW: click SFX
+                    try: sounds.play_sfx('SelectSound')
+                    except Exception: pass
+                elif a_right_rect.collidepoint((mx,my)):
+                    armors_selected = min(len(armors)-1, armors_selected+1)
+                    focused_row = "armors"
+                    # NEW: click SFX
+                    try: sounds.play_sfx('SelectSound')
+                    except Exception: pass
                 else:
-                    lines.append(cur)
-                    cur = w
-            lines.append(cur)
-            return lines
-        pad = 10
-        # draw item name first (top of desc panel)
-        name_font = get_font(18)
-        name_s = name_font.render(cur_name, True, (200,200,120))
-        screen_surface.blit(name_s, (desc_panel.left + pad, desc_panel.top + 6))
-        # compute description start below the name with extra spacing
-        desc_start_y = desc_panel.top + 6 + name_font.get_linesize() + 6
-        max_w = desc_panel.width - pad*2
-        lines = wrap_text_local(cur_desc, wrap_font, max_w)
-        for i, ln in enumerate(lines[:3]):  # limit to 3 lines
-            surf = wrap_font.render(ln, True, (210,210,210))
-            screen_surface.blit(surf, (desc_panel.left + pad, desc_start_y + i * (wrap_font.get_linesize() + 2)))
-
-        # back button
-        pygame.draw.rect(screen_surface, (200,200,200), back_rect)
-        back_color = (0,200,0) if back_rect.collidepoint(pygame.mouse.get_pos()) else (0,0,0)
-        screen_surface.blit(btn_f.render("Back", True, back_color), btn_f.render("Back", True, back_color).get_rect(center=back_rect.center))
+                    for i in range(len(armors)):
+                        x = x_start_armors + i * (item_w + spacing) + armors_offset
+                        item_rect = pygame.Rect(x, y_armors, item_w, 120)
+                        if item_rect.collidepoint((mx,my)):
+                            armors_selected = i
+                            focused_row = "armors"
+                            try: sounds.play_sfx('SelectSound')
+                            except Exception: pass
+                            try:
+                                # UPDATED: pass the correct armor image to modal
+                                res = show_item_page(armors[i], armors_imgs.get(armors[i], sword_img))
+                                if res and res[0] == "equip":
+                                    armors_purchased.add(res[1])
+                                    try:
+                                        idx = armors.index(res[1])
+                                        armors_equipped = idx
+                                        persist_equipped_armor(res[1])
+                                    except Exception:
+                                        pass
+                                if res and res[0] == "unequip":
+                                    # clear equipped armor
+                                    armors_equipped = None
+                                    try:
+                                        persist_equipped_armor("")
+                                    except Exception:
+                                        pass
+                            except Exception:
+                                pass
+                            clicked_pos = None
+                            break
+
+            # center offsets on selection so focused selected item is visible
+            # compute desired offsets to center selected item
+            visible_left = panel.left + margin_x
+            visible_w = panel_w - margin_x*2
+            if focused_row == "weapons":
+                targ_x = x_start_weapons + weapons_selected * (item_w + spacing)
+                desired = visible_left + (visible_w - item_w)//2
+                weapons_offset = desired - targ_x
+            else:
+                targ_x = x_start_armors + armors_selected * (item_w + spacing)
+                desired = visible_left + (visible_w - item_w)//2
+                armors_offset = desired - targ_x
+
+            # clamp again after centering using per-row scroll limits
+            max_scroll_weapons = max(0, total_weapons_w - visible_w)
+            max_scroll_armors = max(0, total_armors_w - visible_w)
+            weapons_offset = max(-max_scroll_weapons, min(0, weapons_offset))
+            armors_offset = max(-max_scroll_armors, min(0, armors_offset))
+
+            # Description preview box at the bottom of the panel for the highlighted item.
+            # Place it above the Back button to avoid overlap.
+            desc_panel_h = 72
+            desc_panel_top = max(panel.top + 120, back_rect.top - 12 - desc_panel_h)
+            desc_panel = pygame.Rect(panel.left + 20, desc_panel_top, panel_w - 40, desc_panel_h)
+            pygame.draw.rect(screen_surface, (24,24,24), desc_panel)
+            pygame.draw.rect(screen_surface, (100,100,100), desc_panel, 2)
+            # determine highlighted item (by focused_row)
+            if focused_row == "weapons":
+                cur_name = weapons[weapons_selected] if 0 <= weapons_selected < len(weapons) else ""
+            else:
+                cur_name = armors[armors_selected] if 0 <= armors_selected < len(armors) else ""
+            # use same resolver as modal so preview and modal match
+            cur_desc = resolve_desc(cur_name)
+            # render wrapped description inside desc_panel with spacing between name and description
+            wrap_font = get_font(16)
+            def wrap_text_local(text: str, font: pygame.font.Font, max_w: int):
+                words = text.split()
+                if not words:
+                    return []
+                lines = []
+                cur = words[0]
+                for w in words[1:]:
+                    test = cur + " " + w
+                    if font.size(test)[0] <= max_w:
+                        cur = test
+                    else:
+                        lines.append(cur)
+                        cur = w
+                lines.append(cur)
+                return lines
+            pad = 10
+            # draw item name first (top of desc panel)
+            name_font = get_font(18)
+            name_s = name_font.render(cur_name, True, (200,200,120))
+            screen_surface.blit(name_s, (desc_panel.left + pad, desc_panel.top + 6))
+            # compute description start below the name with extra spacing
+            desc_start_y = desc_panel.top + 6 + name_font.get_linesize() + 6
+            max_w = desc_panel.width - pad*2
+            lines = wrap_text_local(cur_desc, wrap_font, max_w)
+            for i, ln in enumerate(lines[:3]):  # limit to 3 lines
+                surf = wrap_font.render(ln, True, (210,210,210))
+                screen_surface.blit(surf, (desc_panel.left + pad, desc_start_y + i * (wrap_font.get_linesize() + 2)))
+
+            # back button
+            pygame.draw.rect(screen_surface, (200,200,200), back_rect)
+            back_color = (0,200,0) if back_rect.collidepoint(pygame.mouse.get_pos()) else (0,0,0)
+            screen_surface.blit(btn_f.render("Back", True, back_color), btn_f.render("Back", True, back_color).get_rect(center=back_rect.center))
 
-        pygame.display.update()
-        clock_local.tick(60)
+            pygame.display.update()
+            clock_local.tick(60)
+    finally:
+        save.unsubscribe(_on_profile_changed)
 
 def show_difficulty(snapshot, screen_surface):
     """Modal to pick difficulty. Returns 'easy'|'normal'|'hard' or None if cancelled."""
@@ -1408,8 +1419,7 @@ def show_difficulty(snapshot, screen_surface):
         base = Path(__file__).parent
         p = base.joinpath("sprites", "heart_1.png")
         if p.exists():
-            heart_img = pygame.image.load(str(p)).convert_alpha()
-            heart_img = pygame.transform.smoothscale(heart_img, (28, 28))
+            heart_img = atlas.sprite("heart_1.png", 28, smooth=True)
     except Exception:
         heart_img = None
     if heart_img is None:
@@ -1835,6 +1845,7 @@ def show_play_mode(snapshot, screen_surface):
 
 def run_menu():
     global SCREEN, SCREEN_W, SCREEN_H, is_fullscreen
+    init()
     clock = pygame.time.Clock()
     # make fonts a bit smaller
     title_font = get_font(64)    # reduced from 80
@@ -1862,23 +1873,14 @@ def run_menu():
             Button("SAVE",    (btn_x, btn_y_start + 3*(btn_h+btn_gap)), btn_w, btn_h, button_font, (200,255,200), (255,255,255)),  # NEW
             Button("QUIT",    (btn_x, btn_y_start + 4*(btn_h+btn_gap)), btn_w, btn_h, button_font, (200,255,200), (255,255,255)),
         ]
-        # preload select sound (idempotent)
-        try:
-            sounds.preload('SelectSound')
-        except Exception:
-            pass
 
     # initial assets
     background = None
     buttons = []
     btn_w = btn_h = btn_x = btn_y_start = btn_gap = 0
     create_assets()
-    start_menu_music()  # start looping menu music
-    # ensure loaded master volume is applied to current music channel
-    try:
-        _apply_master_volume()
-    except Exception:
-        pass
+    # mixer, SFX and menu music are started after the first frame is shown
+    audio_started = False
 
     def run_options(snapshot):
         return show_options(snapshot, SCREEN)
@@ -2017,6 +2019,7 @@ def run_menu():
                     if res and res[0] == "menu":
                         stop_menu_music()
                         return
+                    warmup.start()  # purchases / equips change what the next run loads
                 elif buttons[2].is_clicked((mx, my)):
                     try:
                         sounds.play_sfx('SelectSound')
@@ -2115,6 +2118,10 @@ def run_menu():
                 pass
 
         pygame.display.update()
+        if not audio_started:
+            audio_started = True
+            start_audio()
+            warmup.start()
         clock.tick(60)   # limit to 60 FPS
 
 def show_quit_confirmation(snapshot, screen_surface):
@@ -0,0 +1,92 @@
+"""Shared backdrop compositor for modal screens (pause, options, power-up pick, shop, ...).
+
+A modal draws over a snapshot of the screen it interrupted: blurred (two smoothscales),
+dimmed, then a panel with its static title/labels. All of that depends only on the snapshot,
+so it is built once and cached on the snapshot (weakly); nested modals over the same snapshot
+(pause -> options -> pause) reuse the blur and each their own finished frame. A modal frame is
+then one blit of `compose(...)` plus its interactive widgets.
+"""
+import weakref
+from typing import Callable, Dict, Optional, Tuple
+
+import pygame
+
+BLUR_DIVISOR = 12  # downscale factor of the blur
+FALLBACK_FILL = (20, 20, 20)
+
+# base surface (snapshot or fallback background) -> {cache key: surface}
+_cache: "weakref.WeakKeyDictionary[pygame.Surface, Dict[tuple, pygame.Surface]]" = weakref.WeakKeyDictionary()
+_dark: Dict[Tuple[int, int], pygame.Surface] = {}  # plain backdrops when there is nothing to blur
+
+
+def _entries(base: pygame.Surface) -> Dict[tuple, pygame.Surface]:
+    per = _cache.get(base)
+    if per is None:
+        per = _cache[base] = {}
+    return per
+
+
+def _base(snapshot, size, fallback):
+    """(surface the backdrop is built from, whether to blur it)."""
+    if snapshot:
+        return snapshot, True
+    if fallback is not None:
+        return fallback, False
+    dark = _dark.get(size)
+    if dark is None:
+        dark = _dark[size] = pygame.Surface(size)
+        dark.fill(FALLBACK_FILL)
+    return dark, False
+
+
+def blurred(snapshot: Optional[pygame.Surface], size: Tuple[int, int],
+            fallback: Optional[pygame.Surface] = None) -> pygame.Surface:
+    """`snapshot` blurred and stretched to `size`; `fallback` (or a dark fill) without one."""
+    size = tuple(size)
+    base, blur = _base(snapshot, size, fallback)
+    if not blur:
+        return base
+    per = _entries(base)
+    surf = per.get(("blur", size))
+    if surf is None:
+        try:
+            sw, sh = base.get_size()
+            small = pygame.transform.smoothscale(base, (max(1, sw // BLUR_DIVISOR), max(1, sh // BLUR_DIVISOR)))
+            surf = pygame.transform.smoothscale(small, size)
+        except Exception:
+            return blurred(None, size, fallback)
+        per[("blur", size)] = surf
+    return surf
+
+
+def compose(snapshot: Optional[pygame.Surface], size: Tuple[int, int], dim: int = 0,
+            static_key=None, draw_static: Optional[Callable[[pygame.Surface], None]] = None,
+            fallback: Optional[pygame.Surface] = None) -> pygame.Surface:
+    """Blurred backdrop darkened by a black layer of alpha `dim`, with `draw_static(surface)`
+    drawn on top. Cached per snapshot under (size, dim, static_key): pass a key naming the
+    modal and anything its static content depends on."""
+    size = tuple(size)
+    base, _ = _base(snapshot, size, fallback)
+    per = _entries(base)
+    key = ("frame", size, dim, static_key)
+    surf = per.get(key)
+    if surf is None:
+        surf = blurred(snapshot, size, fallback).copy()
+        if dim:
+            shade = pygame.Surface(size, pygame.SRCALPHA)
+            shade.fill((0, 0, 0, dim))
+            surf.blit(shade, (0, 0))
+        if draw_static is not None:
+            draw_static(surf)
+        per[key] = surf
+    return surf
+
+
+def hover_labels(font: pygame.font.Font, text: str, color=(0, 0, 0), hover=(0, 200, 0)):
+    """(normal, hovered) renders of a button label."""
+    return font.render(text, True, color), font.render(text, True, hover)
+
+
+def clear():
+    _cache.clear()
+    _dark.clear()
@@ -0,0 +1,60 @@
+"""Cached sprite outlines (armor outlines around the player, red boss outlines).
+
+`pygame.mask.from_surface(...).outline()` is computed once per sprite frame, and each
+(frame, color, width) outline is pre-rendered into an overlay surface, so drawing an outline
+is a single blit at the sprite's position. Caches hang off the sprite surface weakly.
+"""
+import weakref
+from typing import Dict, List, Tuple
+
+import pygame
+
+MARGIN = 3  # overlay padding around the sprite so thick lines on the edge aren't clipped
+
+# outline drawn around the player for each armor
+ARMOR_COLORS = {
+    "Swiftness Armor": (255, 220, 40),
+    "Tank Armor": (245, 245, 245),
+    "Life Armor": (220, 60, 60),
+    "Regen Armor": (80, 160, 255),
+    "Thorns Armor": (60, 200, 80),
+}
+
+_points: "weakref.WeakKeyDictionary[pygame.Surface, List[Tuple[int, int]]]" = weakref.WeakKeyDictionary()
+_overlays: "weakref.WeakKeyDictionary[pygame.Surface, Dict[Tuple, pygame.Surface]]" = weakref.WeakKeyDictionary()
+
+
+def outline_points(img: pygame.Surface) -> List[Tuple[int, int]]:
+    """Mask outline of `img` in sprite-local coordinates (cached)."""
+    pts = _points.get(img)
+    if pts is None:
+        try:
+            pts = pygame.mask.from_surface(img).outline()
+        except Exception:
+            pts = []
+        _points[img] = pts
+    return pts
+
+
+def overlay(img: pygame.Surface, color, width: int = 3) -> pygame.Surface:
+    """Transparent surface with `img`'s outline drawn in `color`; blit it at sprite pos - MARGIN.
+    Empty (fully transparent) when the sprite has no usable outline."""
+    per_img = _overlays.get(img)
+    if per_img is None:
+        per_img = _overlays[img] = {}
+    key = (tuple(color), width)
+    surf = per_img.get(key)
+    if surf is None:
+        w, h = img.get_size()
+        surf = pygame.Surface((w + MARGIN * 2, h + MARGIN * 2), pygame.SRCALPHA)
+        pts = outline_points(img)
+        if len(pts) >= 3:
+            shifted = [(x + MARGIN, y + MARGIN) for x, y in pts]
+            pygame.draw.polygon(surf, color, shifted, width)
+        per_img[key] = surf
+    return surf
+
+
+def draw(surface: pygame.Surface, img: pygame.Surface, pos, color, width: int = 3) -> pygame.Rect:
+    """Draw `img`'s outline for a sprite blitted at `pos`; returns the rect touched."""
+    return surface.blit(overlay(img, color, width), (int(pos[0]) - MARGIN, int(pos[1]) - MARGIN))
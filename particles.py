@@ -0,0 +1,231 @@
+"""Death debris: the pixel particles an enemy bursts into when it dies.
+
+Particles live in a fixed-capacity pool stored as parallel arrays (x, y, vx, vy, size, color,
+life) -- NumPy arrays when NumPy is installed, plain lists otherwise -- so a tick integrates
+and culls the whole pool at once and drawing is one `Surface.fill` per particle. Debris colors
+come from the opaque pixels of the dying enemy's sprite, collected once per sprite frame.
+
+`draw()` reports the covered area as one rect per occupied CLUSTER_PX grid cell, so debris
+scattered across the map marks only the spots it is in as dirty, not their whole bounding box.
+"""
+import abc
+import weakref
+from typing import List, Tuple
+
+import pygame
+
+try:
+    import numpy as np
+    import pygame.surfarray
+except ImportError:  # optional: fall back to list-backed particles
+    np = None
+
+MAX_PARTICLES = 8192  # spawns beyond this are dropped
+FALLBACK_COLOR = (180, 60, 60)
+GRAVITY = 0.9  # px per 16 ms, per 16 ms
+CULL_MARGIN = 50  # px below the screen before a particle is dropped
+CLUSTER_PX = 64  # grid cell size the drawn areas are grouped by
+
+# sprite -> (xs, ys, colors) of its opaque pixels
+_palettes: "weakref.WeakKeyDictionary[pygame.Surface, Tuple[list, list, list]]" = weakref.WeakKeyDictionary()
+
+
+def opaque_pixels(surf: pygame.Surface) -> Tuple[List[int], List[int], List[Tuple[int, int, int]]]:
+    """Positions and colors of every non-transparent pixel of `surf` (cached per surface)."""
+    hit = _palettes.get(surf)
+    if hit is not None:
+        return hit
+    if np is not None:
+        try:
+            alpha = pygame.surfarray.array_alpha(surf)
+            xs, ys = np.nonzero(alpha)
+            rgb = pygame.surfarray.array3d(surf)[xs, ys]
+            hit = (xs.tolist(), ys.tolist(), [tuple(c) for c in rgb.tolist()])
+        except Exception:
+            hit = None
+    if hit is None:
+        xs, ys, cols = [], [], []
+        w, h = surf.get_size()
+        for px in range(w):
+            for py in range(h):
+                c = surf.get_at((px, py))
+                if c.a:
+                    xs.append(px)
+                    ys.append(py)
+                    cols.append((c.r, c.g, c.b))
+        hit = (xs, ys, cols)
+    _palettes[surf] = hit
+    return hit
+
+
+class _Pool(abc.ABC):
+    """Shared spawning; subclasses store the arrays and integrate / draw them."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def burst(self, surf: pygame.Surface, x: float, y: float, size: int, count: int, rng):
+        """`count` debris pixels from sprite `surf` drawn at (x, y) with entity size `size`
+        (bigger enemies throw bigger, faster debris). `rng` is a random.Random."""
+        count = min(count, self.capacity - self.n)
+        if count <= 0:
+            return
+        xs, ys, cols = opaque_pixels(surf)
+        scale = 1.0 + size / 48.0
+        psize = max(2, int(size * 0.12))
+        batch = []
+        for _ in range(count):
+            if xs:
+                i = rng.randrange(len(xs))
+                sx, sy, col = xs[i], ys[i], cols[i]
+            else:
+                sx = sy = size // 2
+                col = FALLBACK_COLOR
+            # scatter outward and upward a bit
+            vx = rng.uniform(-1.8, 1.8) * scale
+            vy = rng.uniform(-3.5, -1.0) * scale
+            batch.append((x + sx, y + sy, vx, vy, psize, col, rng.randint(900, 1800)))
+        self._append(batch)
+
+    @abc.abstractmethod
+    def _append(self, batch):
+        """Store a batch of (x, y, vx, vy, size, color, life) tuples."""
+
+    @abc.abstractmethod
+    def update(self, dt: float, bottom: float):
+        """Fall under gravity for dt ms; drop particles past `bottom` (the screen height)."""
+
+    @abc.abstractmethod
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Draw every particle as an opaque square; returns the areas covered, one rect per
+        occupied CLUSTER_PX cell (empty when there are no particles)."""
+
+    def clear(self):
+        self.n = 0
+
+
+class NumpyParticles(_Pool):
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        super().__init__(capacity)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def _append(self, batch):
+        n, m = self.n, self.n + len(batch)
+        x, y, vx, vy, size, col, life = zip(*batch)
+        self.x[n:m] = x
+        self.y[n:m] = y
+        self.vx[n:m] = vx
+        self.vy[n:m] = vy
+        self.size[n:m] = size
+        self.color[n:m] = col
+        self.life[n:m] = life
+        self.n = m
+
+    def update(self, dt: float, bottom: float):
+        n = self.n
+        if not n:
+            return
+        k = dt / 16.0
+        vy = self.vy[:n]
+        vy += GRAVITY * k
+        self.x[:n] += self.vx[:n] * k
+        self.y[:n] += vy * k
+        self.life[:n] -= dt
+        keep = self.y[:n] <= bottom + self.size[:n] + CULL_MARGIN
+        if keep.all():
+            return
+        m = int(keep.sum())
+        for arr in (self.x, self.y, self.vx, self.vy, self.life, self.size, self.color):
+            arr[:m] = arr[:n][keep]
+        self.n = m
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        n = self.n
+        if not n:
+            return []
+        xs = self.x[:n].astype(np.int64)
+        ys = self.y[:n].astype(np.int64)
+        sizes = self.size[:n]
+        fill = surface.fill
+        for px, py, s, col in zip(xs.tolist(), ys.tolist(), sizes.tolist(), self.color[:n].tolist()):
+            fill(col, (px, py, s, s))
+        # bounds of the particles in each grid cell
+        _, cell = np.unique(np.stack((xs // CLUSTER_PX, ys // CLUSTER_PX)), axis=1, return_inverse=True)
+        cell = cell.reshape(-1)
+        m = int(cell.max()) + 1
+        x0 = np.full(m, np.iinfo(np.int64).max)
+        y0 = np.full(m, np.iinfo(np.int64).max)
+        x1 = np.full(m, np.iinfo(np.int64).min)
+        y1 = np.full(m, np.iinfo(np.int64).min)
+        np.minimum.at(x0, cell, xs)
+        np.minimum.at(y0, cell, ys)
+        np.maximum.at(x1, cell, xs + sizes)
+        np.maximum.at(y1, cell, ys + sizes)
+        return [pygame.Rect(a, b, c - a, d - b) for a, b, c, d in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist())]
+
+
+class ListParticles(_Pool):
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        super().__init__(capacity)
+        self.x, self.y, self.vx, self.vy, self.size, self.color, self.life = [], [], [], [], [], [], []
+
+    def _append(self, batch):
+        for x, y, vx, vy, size, col, life in batch:
+            self.x.append(x)
+            self.y.append(y)
+            self.vx.append(vx)
+            self.vy.append(vy)
+            self.size.append(size)
+            self.color.append(col)
+            self.life.append(life)
+        self.n = len(self.x)
+
+    def update(self, dt: float, bottom: float):
+        if not self.n:
+            return
+        k = dt / 16.0
+        g = GRAVITY * k
+        self.vy = [v + g for v in self.vy]
+        self.x = [x + vx * k for x, vx in zip(self.x, self.vx)]
+        self.y = [y + vy * k for y, vy in zip(self.y, self.vy)]
+        self.life = [t - dt for t in self.life]
+        keep = [y <= bottom + s + CULL_MARGIN for y, s in zip(self.y, self.size)]
+        if all(keep):
+            return
+        for name in ("x", "y", "vx", "vy", "size", "color", "life"):
+            setattr(self, name, [v for v, ok in zip(getattr(self, name), keep) if ok])
+        self.n = len(self.x)
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        if not self.n:
+            return []
+        cells = {}
+        fill = surface.fill
+        for x, y, s, col in zip(self.x, self.y, self.size, self.color):
+            r = pygame.Rect(int(x), int(y), s, s)
+            fill(col, r)
+            key = (r.x // CLUSTER_PX, r.y // CLUSTER_PX)
+            area = cells.get(key)
+            cells[key] = r if area is None else area.union(r)
+        return list(cells.values())
+
+    def clear(self):
+        super().clear()
+        self.x, self.y, self.vx, self.vy, self.size, self.color, self.life = [], [], [], [], [], [], []
+
+
+def particle_pool(capacity: int = MAX_PARTICLES) -> _Pool:
+    """NumPy-backed pool when NumPy is available, list-backed otherwise."""
+    if np is not None:
+        return NumpyParticles(capacity)
+    return ListParticles(capacity)
@@ -2,12 +2,7 @@ import pygame
 import sys
 from pathlib import Path
 import sounds  # added for click SFX and master volume
-
-# preload select sound once
-try:
-    sounds.preload('SelectSound')
-except Exception:
-    pass
+import modal  # cached blurred/dimmed backdrops shared by all modals
 
 # ensure MASTER_VOLUME exists
 try:
@@ -46,13 +41,10 @@ if not hasattr(sounds, '_orig_play_sfx_wrapped_pause'):
     except Exception:
         pass
 
-# apply once at import
-_apply_master_volume()
-
-pygame.font.init()
-
 def get_font(size):
 	# small helper - prefer bundled font if present
+	if not pygame.font.get_init():
+		pygame.font.init()
 	base = Path(__file__).parent
 	for ext in ("ttf", "otf"):
 		p = base.joinpath("sprites", f"font.{ext}")
@@ -63,23 +55,13 @@ def get_font(size):
 				break
 	return pygame.font.SysFont("arial", size, bold=True)
 
-def _build_blur(snapshot, target_size):
-	if snapshot:
-		try:
-			sw, sh = snapshot.get_size()
-			small = pygame.transform.smoothscale(snapshot, (max(1, sw//12), max(1, sh//12)))
-			return pygame.transform.smoothscale(small, target_size)
-		except Exception:
-			pass
-	# fallback: dark surface
-	s = pygame.Surface(target_size)
-	s.fill((20,20,20))
-	return s
-
 def show_pause_overlay(snapshot, screen_surface):
 	"""Block until user chooses Resume / Options / Quit -> returns tuple like ("resume", None) etc."""
 	sw, sh = screen_surface.get_size()
-	blurred = _build_blur(snapshot, (sw, sh))
+	try:
+		sounds.preload('SelectSound')
+	except Exception:
+		pass
 	# smaller fonts so labels fit on smaller screens
 	title_f = get_font(40)
 	btn_f = get_font(22)
@@ -89,6 +71,22 @@ def show_pause_overlay(snapshot, screen_surface):
 	options_rect = pygame.Rect((sw//2 - 140, sh//2 - 10, 280, 48))
 	quit_rect = pygame.Rect((sw//2 - 140, sh//2 + 50, 280, 48))
 
+	def draw_static(surf):
+		panel_w, panel_h = 520, 300
+		panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
+		pygame.draw.rect(surf, (30,30,30), panel)
+		pygame.draw.rect(surf, (120,120,120), panel, 3)
+		title_surf = title_f.render("Paused", True, (220,220,220))
+		surf.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 40)))
+		pygame.draw.rect(surf, (200,200,200), resume_rect)
+		pygame.draw.rect(surf, (200,200,200), options_rect)
+		pygame.draw.rect(surf, (200,200,200), quit_rect)
+	# backdrop + panel are static: built once per snapshot (also reused after Options)
+	frame = modal.compose(snapshot, (sw, sh), 160, "pause", draw_static)
+	buttons = [(resume_rect, modal.hover_labels(btn_f, "Resume (Esc)")),
+			   (options_rect, modal.hover_labels(btn_f, "Options")),
+			   (quit_rect, modal.hover_labels(btn_f, "Quit to Menu"))]
+
 	while True:
 		mouse_pos = pygame.mouse.get_pos()
 		for ev in pygame.event.get():
@@ -121,30 +119,12 @@ def show_pause_overlay(snapshot, screen_surface):
 						pass
 					return ("menu", None)
 
-		screen_surface.blit(blurred, (0,0))
-		overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-		overlay.fill((0,0,0,160))
-		screen_surface.blit(overlay, (0,0))
-
-		panel_w, panel_h = 520, 300
-		panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
-		pygame.draw.rect(screen_surface, (30,30,30), panel)
-		pygame.draw.rect(screen_surface, (120,120,120), panel, 3)
-
-		title_surf = title_f.render("Paused", True, (220,220,220))
-		screen_surface.blit(title_surf, title_surf.get_rect(center=(sw//2, panel.top + 40)))
-
-		pygame.draw.rect(screen_surface, (200,200,200), resume_rect)
-		pygame.draw.rect(screen_surface, (200,200,200), options_rect)
-		pygame.draw.rect(screen_surface, (200,200,200), quit_rect)
+		screen_surface.blit(frame, (0,0))
 
 		# Hover feedback: render label green when hovered
-		res_color = (0,200,0) if resume_rect.collidepoint(mouse_pos) else (0,0,0)
-		opt_color = (0,200,0) if options_rect.collidepoint(mouse_pos) else (0,0,0)
-		quit_color = (0,200,0) if quit_rect.collidepoint(mouse_pos) else (0,0,0)
-		screen_surface.blit(btn_f.render("Resume (Esc)", True, res_color), btn_f.render("Resume (Esc)", True, res_color).get_rect(center=resume_rect.center))
-		screen_surface.blit(btn_f.render("Options", True, opt_color), btn_f.render("Options", True, opt_color).get_rect(center=options_rect.center))
-		screen_surface.blit(btn_f.render("Quit to Menu", True, quit_color), btn_f.render("Quit to Menu", True, quit_color).get_rect(center=quit_rect.center))
+		for rect, labels in buttons:
+			label = labels[1] if rect.collidepoint(mouse_pos) else labels[0]
+			screen_surface.blit(label, label.get_rect(center=rect.center))
 
 		pygame.display.update()
 		clock.tick(60)
@@ -174,10 +154,37 @@ def show_death_screen(screen_surface, score: int = 0, coins: int = 0, high_score
 			snap = screen_surface.copy()
 		except Exception:
 			snap = None
-		blurred = _build_blur(snap, (sw, sh))
 
 		btn_rect = pygame.Rect((sw//2 - 140, sh//2 + 40, 280, 56))
 
+		def draw_static(surf):
+			panel_w, panel_h = 520, 280  # slightly taller to fit info lines
+			panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
+			pygame.draw.rect(surf, (30,30,30), panel)
+			pygame.draw.rect(surf, (150,20,20), panel, 3)
+
+			title = title_f.render("Game Over", True, (220, 180, 180))
+			surf.blit(title, title.get_rect(center=(sw//2, panel.top + 56)))
+
+			# NEW: score and coins earned lines
+			try:
+				score_s = info_f.render(f"Score: {int(score)}", True, (220,220,220))
+				surf.blit(score_s, score_s.get_rect(center=(sw//2, panel.top + 110)))
+				# Endless mode: show High Score; hide coins when coins==0 and high_score is provided
+				if high_score is not None:
+					hs_s = info_f.render(f"High Score: {int(high_score)}", True, (180,220,180))
+					surf.blit(hs_s, hs_s.get_rect(center=(sw//2, panel.top + 140)))
+				elif int(coins) != 0:
+					coins_s = info_f.render(f"+{int(coins)} coins", True, (212,175,55))
+					surf.blit(coins_s, coins_s.get_rect(center=(sw//2, panel.top + 140)))
+			except Exception:
+				pass
+
+			pygame.draw.rect(surf, (200,200,200), btn_rect)
+		# everything but the button label is static: composed once
+		frame = modal.compose(snap, (sw, sh), 180, ("death", score, coins, high_score), draw_static)
+		btn_labels = modal.hover_labels(btn_f, "Quit to Menu")
+
 		while True:
 			mouse_pos = pygame.mouse.get_pos()
 			for ev in pygame.event.get():
@@ -200,36 +207,9 @@ def show_death_screen(screen_surface, score: int = 0, coins: int = 0, high_score
 							pass
 						return ("menu", None)
 
-			screen_surface.blit(blurred, (0,0))
-			overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-			overlay.fill((0,0,0,180))
-			screen_surface.blit(overlay, (0,0))
-
-			panel_w, panel_h = 520, 280  # slightly taller to fit info lines
-			panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
-			pygame.draw.rect(screen_surface, (30,30,30), panel)
-			pygame.draw.rect(screen_surface, (150,20,20), panel, 3)
-
-			title = title_f.render("Game Over", True, (220, 180, 180))
-			screen_surface.blit(title, title.get_rect(center=(sw//2, panel.top + 56)))
-
-			# NEW: score and coins earned lines
-			try:
-				score_s = info_f.render(f"Score: {int(score)}", True, (220,220,220))
-				screen_surface.blit(score_s, score_s.get_rect(center=(sw//2, panel.top + 110)))
-				# Endless mode: show High Score; hide coins when coins==0 and high_score is provided
-				if high_score is not None:
-					hs_s = info_f.render(f"High Score: {int(high_score)}", True, (180,220,180))
-					screen_surface.blit(hs_s, hs_s.get_rect(center=(sw//2, panel.top + 140)))
-				elif int(coins) != 0:
-					coins_s = info_f.render(f"+{int(coins)} coins", True, (212,175,55))
-					screen_surface.blit(coins_s, coins_s.get_rect(center=(sw//2, panel.top + 140)))
-			except Exception:
-				pass
-
-			pygame.draw.rect(screen_surface, (200,200,200), btn_rect)
-			btn_color = (0,200,0) if btn_rect.collidepoint(mouse_pos) else (0,0,0)
-			screen_surface.blit(btn_f.render("Quit to Menu", True, btn_color), btn_f.render("Quit to Menu", True, btn_color).get_rect(center=btn_rect.center))
+			screen_surface.blit(frame, (0,0))
+			label = btn_labels[1] if btn_rect.collidepoint(mouse_pos) else btn_labels[0]
+			screen_surface.blit(label, label.get_rect(center=btn_rect.center))
 
 			pygame.display.update()
 			clock.tick(60)
@@ -259,10 +239,32 @@ def show_victory_screen(screen_surface, score: int = 0, coins: int = 0):
 			snap = screen_surface.copy()
 		except Exception:
 			snap = None
-		blurred = _build_blur(snap, (sw, sh))
 
 		btn_rect = pygame.Rect((sw//2 - 140, sh//2 + 40, 280, 56))
 
+		def draw_static(surf):
+			panel_w, panel_h = 520, 280  # slightly taller to fit info lines
+			panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
+			pygame.draw.rect(surf, (30,30,30), panel)
+			pygame.draw.rect(surf, (20,150,20), panel, 3)
+
+			title = title_f.render("You Win!", True, (220, 220, 180))
+			surf.blit(title, title.get_rect(center=(sw//2, panel.top + 56)))
+
+			# NEW: score and coins earned lines
+			try:
+				score_s = info_f.render(f"Score: {int(score)}", True, (220,220,220))
+				coins_s = info_f.render(f"+{int(coins)} coins", True, (212,175,55))
+				surf.blit(score_s, score_s.get_rect(center=(sw//2, panel.top + 110)))
+				surf.blit(coins_s, coins_s.get_rect(center=(sw//2, panel.top + 140)))
+			except Exception:
+				pass
+
+			pygame.draw.rect(surf, (200,200,200), btn_rect)
+		# everything but the button label is static: composed once
+		frame = modal.compose(snap, (sw, sh), 180, ("victory", score, coins), draw_static)
+		btn_labels = modal.hover_labels(btn_f, "Quit to Menu")
+
 		while True:
 			mouse_pos = pygame.mouse.get_pos()
 			for ev in pygame.event.get():
@@ -285,31 +287,9 @@ def show_victory_screen(screen_surface, score: int = 0, coins: int = 0):
 							pass
 						return ("menu", None)
 
-			screen_surface.blit(blurred, (0,0))
-			overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-			overlay.fill((0,0,0,180))
-			screen_surface.blit(overlay, (0,0))
-
-			panel_w, panel_h = 520, 280  # slightly taller to fit info lines
-			panel = pygame.Rect((sw-panel_w)//2, (sh-panel_h)//2, panel_w, panel_h)
-			pygame.draw.rect(screen_surface, (30,30,30), panel)
-			pygame.draw.rect(screen_surface, (20,150,20), panel, 3)
-
-			title = title_f.render("You Win!", True, (220, 220, 180))
-			screen_surface.blit(title, title.get_rect(center=(sw//2, panel.top + 56)))
-
-			# NEW: score and coins earned lines
-			try:
-				score_s = info_f.render(f"Score: {int(score)}", True, (220,220,220))
-				coins_s = info_f.render(f"+{int(coins)} coins", True, (212,175,55))
-				screen_surface.blit(score_s, score_s.get_rect(center=(sw//2, panel.top + 110)))
-				screen_surface.blit(coins_s, coins_s.get_rect(center=(sw//2, panel.top + 140)))
-			except Exception:
-				pass
-
-			pygame.draw.rect(screen_surface, (200,200,200), btn_rect)
-			btn_color = (0,200,0) if btn_rect.collidepoint(mouse_pos) else (0,0,0)
-			screen_surface.blit(btn_f.render("Quit to Menu", True, btn_color), btn_f.render("Quit to Menu", True, btn_color).get_rect(center=btn_rect.center))
+			screen_surface.blit(frame, (0,0))
+			label = btn_labels[1] if btn_rect.collidepoint(mouse_pos) else btn_labels[0]
+			screen_surface.blit(label, label.get_rect(center=btn_rect.center))
 
 			pygame.display.update()
 			clock.tick(60)
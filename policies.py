@@ -0,0 +1,78 @@
+import pygame
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Dict, FrozenSet
+
+# Only these keys are read as "held" by the game loop (movement / dash direction)
+HELD_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+@dataclass
+class FrameInput:
+    """Everything run_game reads from the player for one frame."""
+    events: List[pygame.event.Event] = field(default_factory=list)
+    held: FrozenSet[int] = frozenset()
+    mouse: Tuple[int, int] = (0, 0)
+
+
+class InteractivePolicies:
+    """Default policies: real keyboard/mouse, 60 FPS clock and the blocking modal screens.
+    run_game only talks to the player through this object, so headless runs can swap it out."""
+
+    # whether run_game should draw and present frames
+    render = True
+    # LogicalScreen the game is drawn on (see use_screen), or None when drawing on the display
+    screen = None
+
+    def begin_session(self, observe, info):
+        """Called once before the first frame. `observe()` returns a read-only view of the run;
+        `info` describes the session (seed, difficulty, mode, window size, loadout)."""
+        pass
+
+    def end_session(self, summary):
+        """Called once with run_game's summary after the last frame."""
+        pass
+
+    def use_screen(self, screen):
+        """Called by run_game with its LogicalScreen (or None): mouse positions are reported on it."""
+        self.screen = screen
+
+    def frame_dt(self, clock) -> int:
+        return clock.tick(60)
+
+    def poll_input(self) -> FrameInput:
+        events = pygame.event.get()
+        pressed = pygame.key.get_pressed()
+        held = frozenset(k for k in HELD_KEYS if pressed[k])
+        mouse = pygame.mouse.get_pos()
+        if self.screen is not None:
+            mouse = self.screen.to_logical(mouse)
+        return FrameInput(events, held, mouse)
+
+    def on_tick(self, inp: FrameInput):
+        """Called with the input of every fixed simulation tick, just before it runs."""
+        pass
+
+    def choose_powerup(self, snapshot, surface, rng=None) -> Tuple[Optional[Dict], int]:
+        import powerups  # powerup selection UI (loaded on first use)
+        return powerups.choose_powerup(snapshot, surface, rng)
+
+    def pause(self, snapshot, surface):
+        import pause  # pause + death/victory screens (loaded on first use)
+        return pause.show_pause_overlay(snapshot, surface)
+
+    def options(self, snapshot, surface):
+        import menu  # ensure menu module is available before calling show_options
+        return menu.show_options(snapshot, surface)
+
+    def death_screen(self, surface, score: int = 0, coins: int = 0, high_score: Optional[int] = None):
+        import pause
+        pause.show_death_screen(surface, score=score, coins=coins, high_score=high_score)
+
+    def victory_screen(self, surface, score: int = 0, coins: int = 0):
+        import pause
+        pause.show_victory_screen(surface, score=score, coins=coins)
+
+    def on_frame(self, frame_no: int, sim_ms: float, render_ms: float, ticks: int = 1, phases=None):
+        """Per-frame timing hook: simulation and render cost in milliseconds, the number
+        of fixed simulation ticks run for the frame and `phases`, a {phase: ms} breakdown."""
+        pass
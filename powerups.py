@@ -2,6 +2,8 @@ import pygame
 from pathlib import Path
 import random
 from typing import Tuple, Optional, Dict
+import modal  # cached blurred/dimmed modal backdrops
+import atlas  # shared sprite atlas pages
 
 # optional sounds (fail-safe if unavailable)
 try:
@@ -29,18 +31,6 @@ def _apply_master_volume():
             except Exception: pass
     except Exception: pass
 
-def _build_blur(snapshot, target_size):
-    if snapshot:
-        try:
-            sw, sh = snapshot.get_size()
-            small = pygame.transform.smoothscale(snapshot, (max(1, sw//12), max(1, sh//12)))
-            return pygame.transform.smoothscale(small, target_size)
-        except Exception:
-            pass
-    s = pygame.Surface(target_size)
-    s.fill((18,18,20))
-    return s
-
 def _get_font(size):
     base = Path(__file__).parent
     for ext in ("ttf","otf"):
@@ -83,12 +73,26 @@ def _wrap_render(font, text, color, max_width, max_lines=2, line_spacing=2):
         y += s.get_height() + line_spacing
     return surf
 
-def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
-    """Display 3 cards (damage/attackspeed/dashspeed/speed). Returns (pick_dict_or_None, elapsed_ms)."""
+# candidate powerups
+POWERUP_POOL = [
+    {"id": "damage", "type": "damage", "amount": 2, "label": "+2 Damage"},
+    {"id": "attackspeed", "type": "attackspeed", "amount": 0.20, "label": "+20% Attack Recovery"},
+    {"id": "dashspeed", "type": "dashspeed", "amount": 0.20, "label": "+20% Dash Recovery"},
+    {"id": "speed", "type": "speed", "walk_mult": 0.25, "dash_mult": 0.20, "label": "+25% Speed"},
+    {"id": "shield", "type": "shield", "amount": 1, "label": "+1 Rotating Shield"},
+    {"id": "poison", "type": "poison", "amount": 1, "label": "+Poison Touch DMG"},  # NEW
+]
+
+def roll_choices(count: int = 3, rng=None):
+    """Return `count` distinct powerups (copies) from the pool, drawn with `rng` (default: random)."""
+    return [dict(p) for p in (rng or random).sample(POWERUP_POOL, count)]
+
+def choose_powerup(snapshot, screen_surface, rng=None) -> Tuple[Optional[Dict], int]:
+    """Display 3 cards (damage/attackspeed/dashspeed/speed). Returns (pick_dict_or_None, elapsed_ms).
+    The offered cards are drawn with `rng` (a random.Random; default: the global generator)."""
     sw, sh = screen_surface.get_size()
 
-    # --- load UI backdrop and fonts first (per request) ---
-    bg = _build_blur(snapshot, (sw, sh))
+    # --- fonts first (per request); the backdrop is composed once the layout is known ---
     title_f = _get_font(36)
     info_f = _get_font(18)
     clock = pygame.time.Clock()
@@ -98,9 +102,6 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
     except Exception:
         pass
 
-    # prepare overlay and title once
-    overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
     # layout will determine title position later, create surface now
     title_surf = title_f.render("Choose a Powerup", True, (230, 230, 230))
 
@@ -113,7 +114,7 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
     try:
         p = base.joinpath("sprites", "damage_card.png")
         if p.exists():
-            orig = pygame.image.load(str(p)).convert_alpha()
+            orig = atlas.sprite("damage_card.png")
             ow, oh = orig.get_size()
             if ow <= 40 and oh <= 56:
                 try:
@@ -151,27 +152,15 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
         fp = base.joinpath("sprites", fname)
         if fp.exists():
             try:
-                im = pygame.image.load(str(fp)).convert_alpha()
                 # scale to the chosen card base size for consistent layout
-                im = pygame.transform.smoothscale(im, (card_img.get_width(), card_img.get_height()))
-                card_images[key] = im
+                card_images[key] = atlas.sprite(fname, card_img.get_size(), smooth=True)
             except Exception:
                 card_images[key] = card_img
         else:
             card_images[key] = card_img
 
-    # define candidate powerups
-    pool = [
-        {"id": "damage", "type": "damage", "amount": 2, "label": "+2 Damage"},
-        {"id": "attackspeed", "type": "attackspeed", "amount": 0.20, "label": "+20% Attack Recovery"},
-        {"id": "dashspeed", "type": "dashspeed", "amount": 0.20, "label": "+20% Dash Recovery"},
-        {"id": "speed", "type": "speed", "walk_mult": 0.25, "dash_mult": 0.20, "label": "+25% Speed"},
-        {"id": "shield", "type": "shield", "amount": 1, "label": "+1 Rotating Shield"},
-        {"id": "poison", "type": "poison", "amount": 1, "label": "+Poison Touch DMG"},  # NEW
-    ]
-
     # randomly pick three distinct cards to show
-    choices = random.sample(pool, 3)
+    choices = roll_choices(rng=rng)
 
     # layout using the card's native size; increase vertical offset to avoid label overlap
     card_w, card_h = card_img.get_width(), card_img.get_height()
@@ -202,6 +191,85 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
     start_clicks = pygame.time.get_ticks()
     clicks_enabled = False
 
+    def draw_static(surf):
+        # title (no panel behind per previous request) placed above the moved-down cards
+        # ensure title does not overlap the top of the screen; reduced offset to bring title closer
+        title_y = max(12, y - card_h // 2 - 20)
+        surf.blit(title_surf, title_surf.get_rect(center=(sw // 2, title_y)))
+    frame = modal.compose(snapshot, (sw, sh), 160, ("powerup", card_w, card_h), draw_static)
+
+    # each card's blits (backing, image, outline, label) per hover state, built on first use
+    layer_cache = {}
+
+    def _outline(rect):
+        s = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(s, (0, 0, 0), s.get_rect(), 2)
+        return s
+
+    def _backing(size, alpha):
+        s = pygame.Surface(size, pygame.SRCALPHA)
+        s.fill((0, 0, 0, alpha))
+        return s
+
+    def card_layers(i, hovered):
+        key = (i, hovered)
+        if key in layer_cache:
+            return layer_cache[key]
+        r = cards[i]
+        # select the proper image for this choice
+        choice_id = choices[i].get("id", "damage")
+        img_src = card_images.get(choice_id, card_img)
+        layers = []
+        if hovered:
+            # enlarge hovered card (scale up) but respect safe hover_scale
+            scale = hover_scale
+            swidth = int(card_w * scale)
+            sheight = int(card_h * scale)
+            try:
+                img = pygame.transform.smoothscale(img_src, (swidth, sheight))
+            except Exception:
+                img = img_src
+            rect = img.get_rect(center=r.center)
+
+            # clamp horizontally so it doesn't draw off-screen
+            if rect.left < 8:
+                rect.left = 8
+            if rect.right > sw - 8:
+                rect.right = sw - 8
+
+            # backing for the card (slightly transparent black) to improve readability
+            layers.append((_backing((rect.width + 8, rect.height + 8), 160), (rect.left - 4, rect.top - 4)))
+            layers.append((img, rect.topleft))
+            layers.append((_outline(rect), rect.topleft))
+
+            # label with semi-transparent background below the scaled rect (wrapped, up to 2 lines)
+            max_label_w = max(80, min(swidth - 16, sw - 40))
+            lbl_surf = _wrap_render(info_f, choices[i].get("label", ""), label_color_hover, max_label_w)
+            lbl_rect = lbl_surf.get_rect(center=(rect.centerx, rect.bottom + label_margin_hover))
+            # clamp label to screen bottom
+            if lbl_rect.bottom > sh - 8:
+                lbl_rect.bottom = sh - 8
+            bg_rect = lbl_rect.inflate(10, 6)
+            layers.append((_backing(bg_rect.size, 160), bg_rect.topleft))
+            layers.append((lbl_surf, lbl_rect.topleft))
+        else:
+            # draw card at native size centered in slot, with small black backing and thin outline
+            rect = img_src.get_rect(center=r.center)
+            layers.append((_backing((rect.width + 6, rect.height + 6), 160), (rect.left - 3, rect.top - 3)))
+            layers.append((img_src, rect.topleft))
+            layers.append((_outline(rect), rect.topleft))
+
+            max_label_w = max(80, card_w - 16)
+            lbl_surf = _wrap_render(info_f, choices[i].get("label", ""), label_color_normal, max_label_w)
+            lbl_rect = lbl_surf.get_rect(center=(rect.centerx, rect.bottom + label_margin_normal))
+            if lbl_rect.bottom > sh - 8:
+                lbl_rect.bottom = sh - 8
+            bg_rect = lbl_rect.inflate(8, 6)
+            layers.append((_backing(bg_rect.size, 140), bg_rect.topleft))
+            layers.append((lbl_surf, lbl_rect.topleft))
+        layer_cache[key] = layers
+        return layers
+
     # main event/draw loop (single, consistent loop)
     while True:
         elapsed = pygame.time.get_ticks() - start_clicks
@@ -210,7 +278,7 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
         for ev in pygame.event.get():
             # Do NOT allow skip; QUIT picks a random card
             if ev.type == pygame.QUIT:
-                i = random.randint(0, 2)
+                i = (rng or random).randint(0, len(choices) - 1)
                 pick = choices[i]
                 elapsed = pygame.time.get_ticks() - start_ticks
                 try:
@@ -242,97 +310,11 @@ def choose_powerup(snapshot, screen_surface) -> Tuple[Optional[Dict], int]:
                             guard_s = info_f.render(txt, True, (200, 160, 60))
                             screen_surface.blit(guard_s, (10, 10))
 
-        # draw background + dark overlay
-        screen_surface.blit(bg, (0, 0))
-        screen_surface.blit(overlay, (0, 0))
-        # title (no panel behind per previous request) placed above the moved-down cards
-        # ensure title does not overlap the top of the screen; reduced offset to bring title closer
-        title_y = max(12, y - card_h // 2 - 20)
-        title_rect = title_surf.get_rect(center=(sw // 2, title_y))
-        screen_surface.blit(title_surf, title_rect)
-
+        # blurred, dimmed backdrop with the title (static), then the cards in their current state
+        screen_surface.blit(frame, (0, 0))
         mx, my = pygame.mouse.get_pos()
         for i, r in enumerate(cards):
-            hovered = r.collidepoint((mx, my))
-
-            # select the proper image for this choice
-            choice_id = choices[i].get("id", "damage")
-            img_src = card_images.get(choice_id, card_img)
-
-            if hovered:
-                # enlarge hovered card (scale up) but respect safe hover_scale
-                scale = hover_scale
-                swidth = int(card_w * scale)
-                sheight = int(card_h * scale)
-                try:
-                    img = pygame.transform.smoothscale(img_src, (swidth, sheight))
-                except Exception:
-                    img = img_src
-                rect = img.get_rect(center=r.center)
-
-                # clamp horizontally so it doesn't draw off-screen
-                if rect.left < 8:
-                    rect.left = 8
-                if rect.right > sw - 8:
-                    rect.right = sw - 8
-
-                # backing for the card (slightly transparent black) to improve readability
-                try:
-                    back = pygame.Surface((rect.width + 8, rect.height + 8), pygame.SRCALPHA)
-                    back.fill((0, 0, 0, 160))
-                    screen_surface.blit(back, (rect.left - 4, rect.top - 4))
-                except Exception:
-                    pygame.draw.rect(screen_surface, (0, 0, 0), rect.inflate(6, 6))
-
-                screen_surface.blit(img, rect.topleft)
-                try:
-                    pygame.draw.rect(screen_surface, (0, 0, 0), rect, 2)
-                except Exception:
-                    pass
-
-                # label with semi-transparent background below the scaled rect (wrapped, up to 2 lines)
-                max_label_w = max(80, min(swidth - 16, sw - 40))
-                lbl_surf = _wrap_render(info_f, choices[i].get("label", ""), label_color_hover, max_label_w)
-                lbl_rect = lbl_surf.get_rect(center=(rect.centerx, rect.bottom + label_margin_hover))
-                 # clamp label to screen bottom
-                if lbl_rect.bottom > sh - 8:
-                    lbl_rect.bottom = sh - 8
-                bg_rect = lbl_rect.inflate(10, 6)
-                try:
-                    s_bg = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                    s_bg.fill((0, 0, 0, 160))
-                    screen_surface.blit(s_bg, bg_rect.topleft)
-                except Exception:
-                    pygame.draw.rect(screen_surface, (0,0,0), bg_rect)
-                screen_surface.blit(lbl_surf, lbl_rect)
-            else:
-                # draw card at native size centered in slot, with small black backing and thin outline
-                rect = img_src.get_rect(center=r.center)
-                try:
-                    back = pygame.Surface((rect.width + 6, rect.height + 6), pygame.SRCALPHA)
-                    back.fill((0, 0, 0, 160))
-                    screen_surface.blit(back, (rect.left - 3, rect.top - 3))
-                except Exception:
-                    pygame.draw.rect(screen_surface, (0, 0, 0), rect.inflate(6, 6))
-                screen_surface.blit(img_src, rect.topleft)
-                try:
-                    pygame.draw.rect(screen_surface, (0, 0, 0), rect, 2)
-                except Exception:
-                    pass
-
-                max_label_w = max(80, card_w - 16)
-                lbl_surf = _wrap_render(info_f, choices[i].get("label", ""), label_color_normal, max_label_w)
-                lbl_rect = lbl_surf.get_rect(center=(rect.centerx, rect.bottom + label_margin_normal))
-                if lbl_rect.bottom > sh - 8:
-                    lbl_rect.bottom = sh - 8
-                bg_rect = lbl_rect.inflate(8, 6)
-                try:
-                    s_bg = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                    s_bg.fill((0, 0, 0, 140))
-                    screen_surface.blit(s_bg, bg_rect.topleft)
-                except Exception:
-                    pygame.draw.rect(screen_surface, (0,0,0), bg_rect)
-                screen_surface.blit(lbl_surf, lbl_rect)
+            screen_surface.blits(card_layers(i, r.collidepoint((mx, my))), doreturn=False)
 
         pygame.display.update()
         clock.tick(60)
@@ -0,0 +1,127 @@
+"""Per-phase frame profiler with a toggleable overlay (F3 in game).
+
+run_game brackets its phases with `mark()` / `lap(name)`. While collection is off both are
+no-ops, so the hooks cost next to nothing when the overlay is hidden. Laps accumulate over a
+frame (a frame may run several simulation ticks) and `end_frame()` files them away.
+"""
+import time
+from collections import deque
+from typing import Dict
+
+import pygame
+
+# phase key -> overlay label, in display order. Enemy.update is filed per kind as "enemy:<kind>",
+# the render queue flush per layer as "layer:<name>".
+PHASE_LABELS = {
+    "events": "Event handling",
+    "player": "Player physics",
+    "enemies": "Enemy.update",
+    "player_proj": "Player projectiles",
+    "enemy_proj": "Enemy projectiles",
+    "melee": "Melee hit tests",
+    "particles": "Particles",
+    "indicators": "Damage numbers",
+    "draw_map": "draw_map",
+    "submit": "Render submit",
+    "render": "Render queue flush",
+    "present": "display.update",
+    "overlay": "(this overlay)",
+}
+ENEMY_PREFIX = "enemy:"
+LAYER_PREFIX = "layer:"  # same as render_queue.LAYER_PREFIX
+
+BUDGET_MS = 1000.0 / 60.0  # one 60 FPS frame
+
+
+class FrameProfiler:
+    def __init__(self, history: int = 240):
+        self.enabled = False   # collect per-phase timings
+        self.visible = False   # draw the overlay
+        self.current: Dict[str, float] = {}
+        self.last: Dict[str, float] = {}
+        self.last_total = 0.0
+        self.frame_times = deque(maxlen=history)
+        self._t = 0.0
+        self._font = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.enabled = self.visible
+        self.current = {}
+
+    def mark(self):
+        """Start timing the next phase (code since the previous lap is not attributed)."""
+        if self.enabled:
+            self._t = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Add the time since the last mark/lap to `phase`."""
+        if self.enabled:
+            now = time.perf_counter()
+            self.current[phase] = self.current.get(phase, 0.0) + (now - self._t) * 1000.0
+            self._t = now
+
+    def end_frame(self, total_ms: float):
+        self.frame_times.append(total_ms)
+        if self.enabled:
+            self.last = self.current
+            self.last_total = total_ms
+            self.current = {}
+
+    def breakdown(self):
+        """[(label, ms, indent)] for the last frame, with Enemy.update split per kind and the
+        render flush per layer."""
+        rows = []
+        kinds = sorted((k[len(ENEMY_PREFIX):], v) for k, v in self.last.items() if k.startswith(ENEMY_PREFIX))
+        layers = [(k[len(LAYER_PREFIX):], v) for k, v in self.last.items() if k.startswith(LAYER_PREFIX)]
+        for key, label in PHASE_LABELS.items():
+            if key == "enemies":
+                rows.append((label, sum(v for _, v in kinds), 0))
+                rows.extend((kind, v, 1) for kind, v in kinds)
+            elif key == "render":
+                rows.append((label, sum(v for _, v in layers), 0))
+                rows.extend((name, v, 1) for name, v in layers)
+            else:
+                rows.append((label, self.last.get(key, 0.0), 0))
+        accounted = sum(self.last.values())
+        rows.append(("other", max(0.0, self.last_total - accounted), 0))
+        return rows
+
+    def draw(self, surface: pygame.Surface):
+        """Draw the frame-time graph and the last frame's breakdown in the top-left corner;
+        returns the rect drawn."""
+        if self._font is None:
+            self._font = pygame.font.SysFont("consolas,dejavusansmono,monospace", 14)
+        font = self._font
+        rows = self.breakdown()
+        line_h = font.get_linesize()
+        graph_w, graph_h = 240, 60
+        w = graph_w + 16
+        h = graph_h + 24 + line_h * len(rows)
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        # rolling frame-time graph; the line marks a 60 FPS frame, the scale tops out at 2x that
+        gx, gy = 8, 8
+        scale = graph_h / (BUDGET_MS * 2)
+        times = list(self.frame_times)[-graph_w:]
+        for i, ms in enumerate(times):
+            bar = min(graph_h, int(ms * scale))
+            color = (80, 220, 100) if ms <= BUDGET_MS else (240, 80, 60)
+            pygame.draw.line(panel, color, (gx + i, gy + graph_h), (gx + i, gy + graph_h - bar))
+        budget_y = gy + graph_h - int(BUDGET_MS * scale)
+        pygame.draw.line(panel, (255, 255, 255), (gx, budget_y), (gx + graph_w, budget_y))
+        total = times[-1] if times else 0.0
+        panel.blit(font.render(f"frame {total:.2f} ms", True, (255, 255, 255)), (gx, gy + graph_h + 4))
+
+        y = gy + graph_h + 4 + line_h
+        for label, ms, indent in rows:
+            panel.blit(font.render(label, True, (220, 220, 220)), (gx + indent * 12, y))
+            val = font.render(f"{ms:.3f}", True, (220, 220, 220))
+            panel.blit(val, (w - 8 - val.get_width(), y))
+            y += line_h
+        return surface.blit(panel, (10, 10))
+
+
+# shared instance used by run_game (and by bench for detailed phase timings)
+frame_profiler = FrameProfiler()
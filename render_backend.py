@@ -0,0 +1,299 @@
+"""Render backends: what run_game draws a frame with.
+
+`SurfaceBackend` is the software path: the map layer and the render queue are blitted onto a
+Surface (the display, or the LogicalScreen canvas) and the dirty rects are presented.
+
+`TextureBackend` draws the same frame through SDL's 2D renderer (pygame._sdl2): atlas pages and
+the baked map layer are uploaded once as textures, sprites are drawn straight from them, rotated
+by `Texture.draw(angle=...)`, tinted by an additive pass of the sprite's silhouette (color mod)
+and faded by alpha mod, so none of that needs CPU copies. Shapes and widgets (queue callables:
+particles, damage numbers, HUD, ...) are still drawn in software, onto one transparent surface
+per layer of which only the areas touched this frame or the last are cleared and uploaded.
+Frames are drawn into a target texture that is then copied (scaled, with a LogicalScreen) onto
+the window.
+
+pygame only lets a renderer share the display window in SCALED mode, so `create("sdl2", ...)`
+switches the display to SCALED (same size) and takes pygame's renderer, which may be SDL's
+software renderer on machines without a GPU. Modal screens keep drawing on the display surface;
+`sync()` copies the last frame there first. If no renderer can be had, `create()` falls back to
+the surface backend.
+"""
+import weakref
+from typing import List, Tuple
+
+import pygame
+
+import atlas
+from dirty_rects import merge
+from render_queue import LAYER_NAMES, LAYER_PREFIX
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # optional: pygame built without the SDL2 wrappers
+    video = None
+
+BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+BLENDMODE_ADD = 2    # SDL_BLENDMODE_ADD
+
+
+class SurfaceBackend:
+    name = "surface"
+
+    def __init__(self, display: pygame.Surface, logical=None):
+        self.display = display
+        self.logical = logical
+        self.target = logical.surface if logical else display
+
+    def begin_frame(self):
+        self.target.fill((0, 0, 0))
+
+    def background(self, surface: pygame.Surface, pos, changed: bool = False):
+        """Draw the (baked) map layer; `changed` says it was redrawn since the last frame."""
+        self.target.blit(surface, pos)
+
+    def flush(self, queue, dirty=None, prof=None):
+        queue.flush(self.target, dirty, prof)
+
+    def draw_over(self, draw):
+        """Draw `draw(surface)` over the finished frame (the profiler overlay)."""
+        draw(self.target)
+
+    def present(self, dirty, force_full: bool = False):
+        dirty.present(self.target, force_full=force_full, screen=self.logical)
+
+    def sync(self):
+        """Make the display surface hold the last frame (before a modal draws over it)."""
+        pass
+
+    def snapshot(self) -> pygame.Surface:
+        """Copy of the screen as shown, for modal backdrops."""
+        return self.display.copy()
+
+    def close(self):
+        pass
+
+
+class _Overlay:
+    """One layer's queue callables, drawn in software on a transparent surface. Each frame the
+    areas that held something are cleared before the callables draw again, and those plus the
+    areas drawn now are uploaded. Callables may report only what changed (the HUD does), so a
+    cleared area that wasn't reported but was painted again still counts as drawn."""
+
+    def __init__(self, renderer, size: Tuple[int, int]):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.texture = video.Texture(renderer, size, streaming=True)
+        self.texture.blend_mode = BLENDMODE_BLEND
+        self.bounds: List[pygame.Rect] = []  # areas holding something after the last use
+        self._now: List[pygame.Rect] = []
+        self.used = False
+
+    def draw(self, fn):
+        if not self.used:
+            self.used = True
+            for r in self.bounds:
+                self.surface.fill((0, 0, 0, 0), r)
+        try:
+            res = fn(self.surface)
+        except Exception:
+            return
+        for r in (res if isinstance(res, list) else [res]):
+            if r is None:
+                continue
+            r = pygame.Rect(r).clip(self.surface.get_rect())
+            if r.width and r.height:
+                self._now.append(r)
+
+    def finish(self):
+        if not self.used:
+            return
+        self.used = False
+        drawn = self._now
+        self._now = []
+        for r in self.bounds:
+            if any(n.contains(r) for n in drawn):
+                continue
+            painted = self.surface.subsurface(r).get_bounding_rect()
+            if painted.width and painted.height:
+                drawn.append(painted.move(r.topleft))
+        drawn = merge(drawn)
+        for r in merge(self.bounds + drawn):
+            self.texture.update(self.surface.subsurface(r), r)
+        for r in drawn:
+            self.texture.draw(srcrect=r, dstrect=r)
+        self.bounds = drawn
+
+
+class TextureBackend:
+    name = "sdl2"
+
+    def __init__(self, renderer, display: pygame.Surface, logical=None, restore=None):
+        self.renderer = renderer
+        self.display = display
+        self.logical = logical
+        self._restore = restore  # (size, flags) of the display before it was switched to SCALED
+        self.size = logical.surface.get_size() if logical else display.get_size()
+        self._frame = video.Texture(renderer, self.size, target=True)
+        # sprite root surface (atlas page, stamp, ...) -> [texture, atlas revision]
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, list]" = weakref.WeakKeyDictionary()
+        # sprite -> white silhouette texture, for additive tints
+        self._flash: "weakref.WeakKeyDictionary[pygame.Surface, object]" = weakref.WeakKeyDictionary()
+        self._map = None  # (surface, texture)
+        self._overlays = {}
+
+    @classmethod
+    def from_display(cls, display: pygame.Surface, logical=None) -> "TextureBackend":
+        """Take the renderer behind the display window (switching it to SCALED if needed)."""
+        if video is None:
+            raise pygame.error("pygame._sdl2 is not available")
+        restore = None
+        try:
+            renderer = video.Renderer.from_window(video.Window.from_display_module())
+        except pygame.error:
+            size, flags = display.get_size(), display.get_flags()
+            try:
+                pygame.display.set_mode(size, (flags & pygame.FULLSCREEN) | pygame.SCALED)
+                renderer = video.Renderer.from_window(video.Window.from_display_module())
+            except pygame.error:
+                pygame.display.set_mode(size, flags)
+                raise
+            restore = (size, flags)
+        return cls(renderer, display, logical, restore)
+
+    # --- textures ---
+    def _texture(self, surf: pygame.Surface):
+        """(texture, source rect) of a sprite: its whole atlas page, uploaded once per page."""
+        root = surf.get_abs_parent()
+        rev = atlas.revision(root)
+        entry = self._textures.get(root)
+        if entry is None:
+            tex = video.Texture.from_surface(self.renderer, root)
+            tex.blend_mode = BLENDMODE_BLEND
+            entry = self._textures[root] = [tex, rev]
+        elif entry[1] != rev:
+            entry[0].update(root)
+            entry[1] = rev
+        return entry[0], pygame.Rect(surf.get_abs_offset(), surf.get_size())
+
+    def _flash_texture(self, surf: pygame.Surface):
+        tex = self._flash.get(surf)
+        if tex is None:
+            white = surf.copy()
+            white.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            tex = video.Texture.from_surface(self.renderer, white)
+            tex.blend_mode = BLENDMODE_ADD
+            self._flash[surf] = tex
+        return tex
+
+    def _sprite(self, surf: pygame.Surface, pos, fx):
+        tex, src = self._texture(surf)
+        alpha = surf.get_alpha()
+        tex.alpha = 255 if alpha is None else alpha
+        dst = pygame.Rect(0, 0, src.width, src.height)
+        tint = angle = None
+        if fx is not None:
+            tint, angle = fx
+        if angle is None:
+            dst.topleft = (int(pos[0]), int(pos[1]))
+            tex.draw(srcrect=src, dstrect=dst)
+        else:
+            dst.center = (int(pos[0]), int(pos[1]))
+            tex.draw(srcrect=src, dstrect=dst, angle=angle)
+        if tint is not None:
+            flash = self._flash_texture(surf)
+            flash.color = tint[:3]
+            flash.alpha = tex.alpha
+            flash.draw(dstrect=dst, angle=angle or 0.0)
+
+    def _overlay(self, key) -> _Overlay:
+        ov = self._overlays.get(key)
+        if ov is None:
+            ov = self._overlays[key] = _Overlay(self.renderer, self.size)
+        return ov
+
+    # --- frame ---
+    def begin_frame(self):
+        r = self.renderer
+        r.target = self._frame
+        r.draw_color = (0, 0, 0, 255)
+        r.clear()
+
+    def background(self, surface: pygame.Surface, pos, changed: bool = False):
+        if self._map is None or self._map[0] is not surface:
+            self._map = (surface, video.Texture.from_surface(self.renderer, surface))
+        elif changed:
+            self._map[1].update(surface)
+        self._map[1].draw(dstrect=pygame.Rect(pos, surface.get_size()))
+
+    def flush(self, queue, dirty=None, prof=None):
+        layer_now = None
+        for layer, _, _, surf, arg, _, fx in queue.take():
+            if layer != layer_now:
+                if layer_now is not None:
+                    self._overlay(layer_now).finish()
+                    if prof is not None:
+                        prof.lap(LAYER_PREFIX + LAYER_NAMES[layer_now])
+                layer_now = layer
+            if surf is not None:
+                self._sprite(surf, arg, fx)
+            else:
+                self._overlay(layer).draw(arg)
+        if layer_now is not None:
+            self._overlay(layer_now).finish()
+            if prof is not None:
+                prof.lap(LAYER_PREFIX + LAYER_NAMES[layer_now])
+
+    def draw_over(self, draw):
+        ov = self._overlay("over")
+        ov.draw(draw)
+        ov.finish()
+
+    def present(self, dirty=None, force_full: bool = False):
+        r = self.renderer
+        r.target = None
+        r.draw_color = (0, 0, 0, 255)
+        r.clear()
+        self._frame.draw(dstrect=self.logical.dest if self.logical else None)
+        r.present()
+
+    def sync(self):
+        r = self.renderer
+        try:
+            r.target = self._frame
+            frame = r.to_surface()
+        except pygame.error:
+            return
+        finally:
+            r.target = None
+        if self.logical:
+            self.logical.surface.blit(frame, (0, 0))
+            self.logical.upscale()
+        else:
+            self.display.blit(frame, (0, 0))
+
+    def snapshot(self) -> pygame.Surface:
+        self.sync()
+        return self.display.copy()
+
+    def close(self):
+        self._textures.clear()
+        self._flash.clear()
+        self._overlays.clear()
+        self._map = None
+        if self._restore is not None:
+            size, flags = self._restore
+            self._restore = None
+            try:
+                pygame.display.set_mode(size, flags)
+            except pygame.error:
+                pass
+
+
+def create(kind: str, display: pygame.Surface, logical=None):
+    """Backend `kind` ("surface" or "sdl2") for `display` (and its LogicalScreen, if any);
+    the surface backend when the SDL renderer isn't available."""
+    if kind == "sdl2":
+        try:
+            return TextureBackend.from_display(display, logical)
+        except Exception:
+            pass
+    return SurfaceBackend(display, logical)
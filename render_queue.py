@@ -0,0 +1,120 @@
+"""Render queue: everything in a frame above the map is drawn in one sorted pass.
+
+Draw code submits items instead of drawing: a sprite blit, or a callable for shapes and
+widgets, each with a layer and a sort key (feet y for entities, so whatever stands lower on
+screen is drawn over what stands behind it). `flush()` draws layer by layer, by sort key and
+then submission order, registers every drawn rect with the dirty-rect presenter and times each
+layer for the profiler ("layer:<name>").
+
+Tinted and rotated sprites are submitted as the plain sprite plus the effect; `flush()` draws
+them from the tints.py / rotations.py caches, a texture backend (render_backend.py) draws them
+on the GPU instead.
+"""
+from operator import itemgetter
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+import rotations
+import tints
+
+# layers, bottom to top
+GROUND, ENTITIES, PROJECTILES, EFFECTS, HUD = range(5)
+LAYER_NAMES = ("ground", "entities", "projectiles", "effects", "hud")
+LAYER_PREFIX = "layer:"
+
+_order = itemgetter(0, 1, 2)
+
+
+class RenderQueue:
+    def __init__(self):
+        # (layer, sort_key, seq, surface or None, pos or callable, pad, (tint, angle) or None)
+        self._items: List[tuple] = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def blit(self, layer: int, sort_key: float, surface: pygame.Surface, pos, pad: int = 0,
+             tint: Optional[Tuple[int, int, int, int]] = None):
+        """Queue `surface` at `pos` (top-left), with an additive `tint` (see tints.py) if given.
+        `pad` grows its dirty rect."""
+        fx = None if tint is None else (tint, None)
+        self._items.append((layer, sort_key, len(self._items), surface, pos, pad, fx))
+
+    def blit_rotated(self, layer: int, sort_key: float, surface: pygame.Surface, center, angle: float,
+                     pad: int = 0):
+        """Queue `surface` turned clockwise by `angle` degrees, centred on `center`."""
+        self._items.append((layer, sort_key, len(self._items), surface, center, pad, (None, angle)))
+
+    def call(self, layer: int, sort_key: float, draw: Callable[[pygame.Surface], object]):
+        """Queue `draw(target)`; it may return the rect it touched, a list of rects, or None."""
+        self._items.append((layer, sort_key, len(self._items), None, draw, 0, None))
+
+    def clear(self):
+        self._items = []
+
+    def take(self) -> List[tuple]:
+        """Empty the queue and return its items in draw order (for other backends)."""
+        items = self._items
+        self._items = []
+        items.sort(key=_order)
+        return items
+
+    def flush(self, target: pygame.Surface, dirty=None, prof=None):
+        """Draw and empty the queue. `dirty` (a DirtyRects) gets every drawn rect; `prof` (a
+        FrameProfiler) gets one lap per layer. Runs of consecutive sprite blits go through one
+        `Surface.blits` call."""
+        items = self.take()
+        track = dirty is not None and dirty.enabled
+        layer_now: Optional[int] = None
+        run: List[tuple] = []  # pending (surface, pos)
+        pads: List[int] = []
+
+        def flush_run():
+            rects = target.blits(run, doreturn=track)
+            if track:
+                for r, pad in zip(rects, pads):
+                    dirty.add(r, pad)
+            run.clear()
+            pads.clear()
+
+        for layer, _, _, surf, arg, pad, fx in items:
+            if layer != layer_now:
+                if run:
+                    flush_run()
+                if layer_now is not None and prof is not None:
+                    prof.lap(LAYER_PREFIX + LAYER_NAMES[layer_now])
+                layer_now = layer
+            if surf is not None:
+                if fx is not None:
+                    surf, arg = _apply(surf, arg, fx)
+                run.append((surf, arg))
+                pads.append(pad)
+                continue
+            if run:
+                flush_run()
+            try:
+                res = arg(target)
+            except Exception:
+                res = None
+            if track and res is not None:
+                if isinstance(res, list):
+                    for r in res:
+                        dirty.add(r)
+                else:
+                    dirty.add(res)
+        if run:
+            flush_run()
+        if layer_now is not None and prof is not None:
+            prof.lap(LAYER_PREFIX + LAYER_NAMES[layer_now])
+
+
+def _apply(surf: pygame.Surface, pos, fx):
+    """(surface, top-left) of a tinted / rotated submission, from the shared caches."""
+    tint, angle = fx
+    if tint is not None:
+        surf = tints.tinted(surf, tint)
+    if angle is not None:
+        surf = rotations.rotated(surf, angle)
+        pos = surf.get_rect(center=pos).topleft
+    return surf, pos
@@ -0,0 +1,282 @@
+"""Input recording and exact replay of game sessions.
+
+A recording holds the run's seed and setup (difficulty, mode, window size, loadout) plus the
+input of every fixed simulation tick: held movement keys, mouse position, key/click events,
+and the answers given to modal screens (powerup picks, pause menu, options). Replaying feeds
+the same input back through run_game, one tick per frame, so the session plays out identically.
+
+Record every run started from the menu:   DESCEND_RECORD_DIR=recordings python main.py
+Replay one (headless, reports timings):   python replay.py recordings/run-....rec.gz [--render]
+"""
+import sys
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pygame
+from policies import InteractivePolicies, FrameInput, HELD_KEYS
+
+FORMAT_VERSION = 1
+
+# only these event types affect the simulation
+_EV_QUIT, _EV_KEYDOWN, _EV_KEYUP, _EV_CLICK = "q", "kd", "ku", "mb"
+
+
+def _encode_event(ev) -> Optional[list]:
+    if ev.type == pygame.QUIT:
+        return [_EV_QUIT]
+    if ev.type == pygame.KEYDOWN:
+        return [_EV_KEYDOWN, ev.key, getattr(ev, "unicode", "")]
+    if ev.type == pygame.KEYUP:
+        return [_EV_KEYUP, ev.key]
+    if ev.type == pygame.MOUSEBUTTONDOWN:
+        pos = getattr(ev, "pos", (0, 0))
+        return [_EV_CLICK, ev.button, int(pos[0]), int(pos[1])]
+    return None
+
+
+def _decode_event(data) -> pygame.event.Event:
+    kind = data[0]
+    if kind == _EV_QUIT:
+        return pygame.event.Event(pygame.QUIT)
+    if kind == _EV_KEYDOWN:
+        return pygame.event.Event(pygame.KEYDOWN, key=data[1], unicode=data[2])
+    if kind == _EV_KEYUP:
+        return pygame.event.Event(pygame.KEYUP, key=data[1])
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=data[1], pos=(data[2], data[3]))
+
+
+def _held_mask(held) -> int:
+    mask = 0
+    for bit, key in enumerate(HELD_KEYS):
+        if key in held:
+            mask |= 1 << bit
+    return mask
+
+
+def _held_from_mask(mask: int) -> frozenset:
+    return frozenset(key for bit, key in enumerate(HELD_KEYS) if mask & (1 << bit))
+
+
+class InputRecorder:
+    """Collects per-tick input compactly: runs of identical event-free ticks are stored once
+    as [count, held_mask, mouse_x, mouse_y]; ticks with events as [1, mask, x, y, events]."""
+
+    def __init__(self):
+        self.info: Dict = {}
+        self.ticks: List[list] = []
+        self.answers: List[list] = []   # [tick, kind, value]
+        self.summary: Optional[Dict] = None
+        self.tick_count = 0
+
+    def record_tick(self, inp: FrameInput):
+        mask = _held_mask(inp.held)
+        mx, my = int(inp.mouse[0]), int(inp.mouse[1])
+        events = [e for e in (_encode_event(ev) for ev in inp.events) if e is not None]
+        last = self.ticks[-1] if self.ticks else None
+        if not events and last is not None and len(last) == 4 and last[1:] == [mask, mx, my]:
+            last[0] += 1
+        elif events:
+            self.ticks.append([1, mask, mx, my, events])
+        else:
+            self.ticks.append([1, mask, mx, my])
+        self.tick_count += 1
+
+    def record_answer(self, kind: str, value):
+        # answers are given while the current tick (tick_count - 1) is being simulated
+        self.answers.append([self.tick_count - 1, kind, value])
+
+    def to_dict(self) -> Dict:
+        return {"version": FORMAT_VERSION, "info": self.info, "ticks": self.ticks,
+                "answers": self.answers, "summary": self.summary, "tick_count": self.tick_count}
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        return path
+
+
+def load_recording(path) -> Dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported recording version: {data.get('version')}")
+    return data
+
+
+class RecordingPolicies:
+    """Wraps another policies object and records everything the run reads from it."""
+
+    def __init__(self, inner, out_dir=None, path=None):
+        self.inner = inner
+        self.recorder = InputRecorder()
+        self.out_dir = out_dir
+        self.path = path
+        self.saved_path = None
+
+    def __getattr__(self, name):
+        # render flag, frame_dt, poll_input, options, death/victory screens, on_frame ...
+        return getattr(self.inner, name)
+
+    def begin_session(self, observe, info):
+        self.recorder.info = dict(info)
+        self.inner.begin_session(observe, info)
+
+    def on_tick(self, inp):
+        self.recorder.record_tick(inp)
+        self.inner.on_tick(inp)
+
+    def choose_powerup(self, snapshot, surface, rng=None):
+        pick, elapsed = self.inner.choose_powerup(snapshot, surface, rng)
+        self.recorder.record_answer("powerup", pick.get("id") if pick else None)
+        return pick, elapsed
+
+    def pause(self, snapshot, surface):
+        res = self.inner.pause(snapshot, surface)
+        self.recorder.record_answer("pause", res[0] if res else None)
+        return res
+
+    def options(self, snapshot, surface):
+        res = self.inner.options(snapshot, surface)
+        # e.g. ("resolution_changed", (w, h)): run_game re-centres the map, which moves mouse aim
+        self.recorder.record_answer("options", [res[0], list(res[1]) if isinstance(res[1], (tuple, list)) else res[1]]
+                                    if res else None)
+        return res
+
+    def end_session(self, summary):
+        self.recorder.summary = dict(summary)
+        self.inner.end_session(summary)
+        try:
+            path = self.path
+            if path is None:
+                stamp = time.strftime("%Y%m%d-%H%M%S")
+                path = Path(self.out_dir or ".") / f"run-{stamp}-{summary.get('seed')}.rec.gz"
+            self.saved_path = self.recorder.save(path)
+        except Exception as exc:
+            print(f"Warning: could not save input recording: {exc}")
+
+
+class ReplayPolicies(InteractivePolicies):
+    """Feeds a recording back into run_game: exactly one simulation tick per frame."""
+
+    def __init__(self, recording: Dict, render: bool = False, realtime: bool = False):
+        self.recording = recording
+        self.render = render
+        self.realtime = realtime
+        self._ticks = self._expand(recording.get("ticks", []))
+        self._answers = {}
+        for tick, kind, value in recording.get("answers", []):
+            self._answers.setdefault((tick, kind), []).append(value)
+        self._current = -1
+        self.sim_ms = []
+        self.render_ms = []
+
+    @staticmethod
+    def _expand(ticks):
+        for entry in ticks:
+            count, mask, mx, my = entry[:4]
+            events = entry[4] if len(entry) > 4 else []
+            for i in range(count):
+                yield mask, (mx, my), (events if i == 0 else [])
+
+    @property
+    def tick_count(self) -> int:
+        return int(self.recording.get("tick_count", 0))
+
+    def frame_dt(self, clock):
+        import main
+        if self.realtime:
+            clock.tick(main.SIM_HZ)
+        return main.SIM_STEP_MS
+
+    def poll_input(self) -> FrameInput:
+        pygame.event.pump()
+        pygame.event.clear()
+        try:
+            mask, mouse, events = next(self._ticks)
+        except StopIteration:
+            return FrameInput(mouse=(0, 0))
+        return FrameInput([_decode_event(e) for e in events], _held_from_mask(mask), mouse)
+
+    def on_tick(self, inp):
+        self._current += 1
+
+    def _answer(self, kind):
+        values = self._answers.get((self._current, kind))
+        return values.pop(0) if values else None
+
+    def choose_powerup(self, snapshot, surface, rng=None):
+        import powerups
+        # draw the offer exactly as the recorded run did (keeps the powerup stream in step)
+        offered = powerups.roll_choices(rng=rng)
+        pick_id = self._answer("powerup")
+        for p in offered:
+            if p.get("id") == pick_id:
+                return p, 0
+        return None, 0
+
+    def pause(self, snapshot, surface):
+        res = self._answer("pause")
+        return (res or "resume", None)
+
+    def options(self, snapshot, surface):
+        res = self._answer("options")
+        if not res:
+            return None
+        kind, value = res
+        return (kind, tuple(value) if isinstance(value, list) else value)
+
+    def death_screen(self, surface, score: int = 0, coins: int = 0, high_score=None):
+        pass
+
+    def victory_screen(self, surface, score: int = 0, coins: int = 0):
+        pass
+
+    def on_frame(self, frame_no: int, sim_ms: float, render_ms: float, ticks: int = 1, phases=None):
+        self.sim_ms.append(sim_ms)
+        if self.render:
+            self.render_ms.append(render_ms)
+
+
+def run_replay(path, render: bool = False, realtime: bool = False):
+    """Replay a recording; returns (replayed summary, recorded summary, policies)."""
+    recording = load_recording(path)
+    info = recording.get("info", {})
+    if not render:
+        import headless  # selects SDL's dummy drivers before pygame opens anything
+        screen = headless.init_display(tuple(info.get("size") or headless.HEADLESS_SIZE))
+    else:
+        pygame.init()
+        screen = pygame.display.set_mode(tuple(info.get("size") or (1280, 800)))
+    import main
+    import save
+    # play with the recorded loadout (staged only; never written to disk)
+    if info.get("profile"):
+        save.save_player_data(info["profile"])
+    policies = ReplayPolicies(recording, render=render, realtime=realtime)
+    summary = main.run_game(screen, difficulty=info.get("difficulty", "normal"), mode=info.get("mode", "main"),
+                            policies=policies, max_frames=policies.tick_count, seed=info.get("seed"),
+                            start=info.get("start"))
+    return summary, recording.get("summary"), policies
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Replay a recorded Descend session.")
+    parser.add_argument("recording")
+    parser.add_argument("--render", action="store_true", help="open a window and watch the replay in real time")
+    args = parser.parse_args()
+    replayed, recorded, pol = run_replay(args.recording, render=args.render, realtime=args.render)
+    print(f"recorded: {recorded}")
+    print(f"replayed: {replayed}")
+    same = bool(recorded) and all(replayed.get(k) == recorded.get(k) for k in ("result", "score", "level"))
+    print("replay matches recording" if same else "replay DIVERGED from recording")
+    if pol.sim_ms:
+        mean = sum(pol.sim_ms) / len(pol.sim_ms)
+        print(f"simulate: mean {mean:.3f} ms over {len(pol.sim_ms)} ticks")
+    pygame.quit()
+    sys.exit(0 if same else 1)
@@ -0,0 +1,21 @@
+import random
+from typing import Dict, Optional
+
+# Independent random streams per subsystem. Each is seeded from the run seed and its own name,
+# so e.g. spawning an extra particle never shifts where the next enemy spawns.
+STREAMS = ("maps", "spawn", "enemy_ai", "particles", "powerups")
+
+
+class RunRandom:
+    """Per-run seed plus one random.Random per subsystem (see STREAMS)."""
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = int(seed)
+        self._streams: Dict[str, random.Random] = {
+            name: random.Random(f"{self.seed}:{name}") for name in STREAMS
+        }
+
+    def stream(self, name: str) -> random.Random:
+        return self._streams[name]
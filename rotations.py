@@ -0,0 +1,99 @@
+"""Rotation atlases: pre-rotated copies of a sprite at quantized angles (sword swings, sunballs,
+mage projectiles).
+
+`rotated(img, angle)` snaps the angle to STEP degrees and returns the cached rotation. The first
+request for an image builds just that angle on the spot and queues the rest of the atlas for a
+background thread (`pygame.transform.rotate` releases the GIL, so the build overlaps the game
+loop). The thread rotates a private copy of the sprite: atlas sprites are subsurfaces of shared
+pages, and a rotation locks its source, page and all, for as long as it runs. Atlases hang off
+the source surface weakly, so they go away with their sprites.
+"""
+import queue
+import threading
+import weakref
+from typing import Dict
+
+import pygame
+
+STEP = 3  # degrees between atlas entries
+
+_atlases: "weakref.WeakKeyDictionary[pygame.Surface, Dict[int, pygame.Surface]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+_jobs: "queue.Queue[tuple]" = queue.Queue()
+_worker = None
+
+
+def quantize(angle: float, step: int = STEP) -> int:
+    """Nearest atlas angle in [0, 360)."""
+    return (int(round(angle / step)) * step) % 360
+
+
+def _atlas(img: pygame.Surface):
+    """(atlas dict, created) for img; created is True the first time the image is seen."""
+    with _lock:
+        atlas = _atlases.get(img)
+        if atlas is not None:
+            return atlas, False
+        atlas = _atlases[img] = {}
+        return atlas, True
+
+
+def rotated(img: pygame.Surface, angle: float, step: int = STEP) -> pygame.Surface:
+    """`img` turned clockwise on screen by `angle` degrees (y-down, same as atan2 on screen
+    coordinates), snapped to `step`."""
+    q = quantize(angle, step)
+    atlas, created = _atlas(img)
+    surf = atlas.get(q)
+    if surf is None:
+        surf = pygame.transform.rotate(img, -q)
+        with _lock:
+            surf = atlas.setdefault(q, surf)
+    if created:
+        _submit(img, step)
+    return surf
+
+
+def prewarm(img: pygame.Surface, step: int = STEP):
+    """Queue a full atlas build for img (e.g. right after loading a weapon sprite)."""
+    if img is None:
+        return
+    _atlas(img)
+    _submit(img, step)
+
+
+def _submit(img: pygame.Surface, step: int):
+    global _worker
+    try:
+        src = img.copy()
+    except Exception:
+        return
+    _jobs.put((weakref.ref(img), src, step))
+    if _worker is None or not _worker.is_alive():
+        _worker = threading.Thread(target=_work, name="rotation-atlas", daemon=True)
+        _worker.start()
+
+
+def _work():
+    while True:
+        ref, src, step = _jobs.get()
+        img = ref()
+        if img is None:
+            continue
+        try:
+            for q in range(0, 360, step):
+                with _lock:
+                    atlas = _atlases.get(img)
+                    if atlas is None or q in atlas:
+                        continue
+                surf = pygame.transform.rotate(src, -q)
+                with _lock:
+                    atlas.setdefault(q, surf)
+        except Exception:
+            pass
+        finally:
+            del img, src
+
+
+def clear():
+    with _lock:
+        _atlases.clear()
@@ -2,8 +2,9 @@ import json
 import os
 import sys
 import shutil
+import copy
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Iterable, List, Tuple
 
 # Determine a persistent, user‑writable directory (handles PyInstaller onefile).
 def _user_data_dir(app_name: str = "Descend") -> Path:
@@ -23,14 +24,21 @@ def _user_data_dir(app_name: str = "Descend") -> Path:
 # Legacy path (old behavior) – inside the code directory (non‑persistent for onefile)
 _LEGACY_PATH = Path(__file__).parent / "save.json"
 
-# New persistent path
+# New persistent path (the directory is created on first read/write, not at import)
 _SAVE_DIR = _user_data_dir()
-_SAVE_DIR.mkdir(parents=True, exist_ok=True)
 SAVE_PATH = _SAVE_DIR / "save.json"   # public constant (kept)
+_dir_ready = False
 
 # NEW: in‑memory staging (only written on explicit commit)
 _staged_data: Dict[str, Any] = {}
 
+# Parsed copy of what is on disk. Loaded once, then kept in sync by commit_player_data(),
+# so reads never touch the file again (load_player_data() is called from hot paths).
+_disk_data: Optional[Dict[str, Any]] = None
+
+# Change listeners: (callback, keys or None for "any key")
+_listeners: List[Tuple[Callable[[Dict[str, Any]], None], Optional[frozenset]]] = []
+
 def _maybe_migrate_legacy():
     """Copy legacy save.json (beside code) to new location if user has progress there and
     no new save exists yet."""
@@ -41,102 +49,162 @@ def _maybe_migrate_legacy():
     except Exception:
         pass
 
-_maybe_migrate_legacy()
+def _prepare_dir():
+    """Create the save directory and migrate a legacy save, once, before the first disk access."""
+    global _dir_ready
+    if _dir_ready:
+        return
+    _dir_ready = True
+    try:
+        _SAVE_DIR.mkdir(parents=True, exist_ok=True)
+    except Exception:
+        pass
+    _maybe_migrate_legacy()
 
 def get_save_path() -> Path:
     """Return the resolved save file path (helper, optional)."""
     return SAVE_PATH
 
+def _read_disk() -> Dict[str, Any]:
+    _prepare_dir()
+    try:
+        if SAVE_PATH.exists():
+            data = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass
+    return {}
+
+def _disk_snapshot() -> Dict[str, Any]:
+    """Return the cached on-disk profile, parsing save.json on first use only."""
+    global _disk_data
+    if _disk_data is None:
+        _disk_data = _read_disk()
+    return _disk_data
+
+def _effective(key: str, default: Any = None) -> Any:
+    if key in _staged_data:
+        return _staged_data[key]
+    return _disk_snapshot().get(key, default)
+
+def subscribe(callback: Callable[[Dict[str, Any]], None], keys: Optional[Iterable[str]] = None):
+    """
+    Register `callback(changes)` to be called whenever the effective profile changes.
+    `changes` maps each changed key to its new value. If `keys` is given, the callback
+    only fires for (and only receives) those keys. Returns the callback so it can be
+    passed to unsubscribe() later.
+    """
+    key_set = frozenset(keys) if keys is not None else None
+    _listeners.append((callback, key_set))
+    return callback
+
+def unsubscribe(callback) -> None:
+    """Remove every registration of `callback` (no-op if it was never subscribed). Compared
+    with ==, so a bound method (a new object on every attribute access) matches itself."""
+    _listeners[:] = [(cb, ks) for cb, ks in _listeners if cb != callback]
+
+def _publish(changes: Dict[str, Any]) -> None:
+    if not changes:
+        return
+    # iterate a copy so listeners may (un)subscribe while being notified
+    for cb, key_set in list(_listeners):
+        if key_set is None:
+            payload = dict(changes)
+        else:
+            payload = {k: v for k, v in changes.items() if k in key_set}
+            if not payload:
+                continue
+        try:
+            cb(payload)
+        except Exception:
+            pass
+
+def _apply_and_collect(update) -> Dict[str, Any]:
+    """Run `update()` (which mutates staged/disk state) and return keys whose effective value changed."""
+    before = load_player_data()
+    update()
+    after = load_player_data()
+    return {k: after.get(k) for k in set(before) | set(after) if before.get(k) != after.get(k)}
+
 def save_player_data(data: dict) -> bool:
     """
     STAGED save: merge incoming data into in-memory _staged_data only.
     Disk is NOT updated until commit_player_data() is called.
+    Publishes a change event for every key whose value actually changed.
     Always returns True (staging can't easily fail).
     """
+    changes: Dict[str, Any] = {}
     try:
         if data:
-            _staged_data.update(data)
+            for k, v in data.items():
+                old = _effective(k)
+                # copy so later mutation of the caller's list/dict can't alter the profile
+                _staged_data[k] = copy.deepcopy(v)
+                if old != v:
+                    changes[k] = copy.deepcopy(v)
     except Exception:
         pass
+    _publish(changes)
     return True
 
 def commit_player_data(extra: Optional[dict] = None) -> bool:
     """
+    Write the on-disk profile merged with staged data (and `extra`) to save.json.
     Keeps staged data in memory.
     """
-    try:
-        if SAVE_PATH.exists():
-            existing = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
-        else:
-            existing = {}
-    except Exception:
-        existing = {}
     merged: Dict[str, Any] = {}
-    merged.update(existing)
+    merged.update(_disk_snapshot())
     merged.update(_staged_data)          # staged overwrites file
     if extra:
-        merged.update(extra)             # explicit extra overwrites everything
+        merged.update(copy.deepcopy(extra))  # explicit extra overwrites everything
     merged.setdefault("coins", 0)
     payload = json.dumps(merged, ensure_ascii=False, indent=2)
+    _prepare_dir()
     try:
         SAVE_PATH.write_text(payload, encoding="utf-8")
-        return True
     except Exception:
         return False
 
+    def _update():
+        global _disk_data
+        _disk_data = merged
+    _publish(_apply_and_collect(_update))
+    return True
+
 def load_player_data() -> dict:
     """
     Load player data merged with any staged (unsaved) changes.
-    Guarantees a dict with at least 'coins'.
+    Served from the in-memory profile; the save file is only parsed once.
+    Guarantees a dict with at least 'coins'. The result is a copy and safe to mutate.
     """
+    data: Dict[str, Any] = {}
     try:
-        if SAVE_PATH.exists():
-            data = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
-        else:
-            data = {}
-    except Exception:
-        data = {}
-    # overlay staged (unsaved) values
-    try:
+        data.update(_disk_snapshot())
+        # overlay staged (unsaved) values
         if _staged_data:
             data.update(_staged_data)
+        data = copy.deepcopy(data)
     except Exception:
         pass
     data.setdefault("coins", 0)
     return data
 
+def reload_player_data() -> dict:
+    """Re-read save.json from disk (e.g. after it was edited externally) and publish any changes."""
+    def _update():
+        global _disk_data
+        _disk_data = _read_disk()
+    _publish(_apply_and_collect(_update))
+    return load_player_data()
+
 def has_uncommitted_changes() -> bool:
     """
     Return True if there is staged data that would change the on‑disk save.json.
     """
     if not _staged_data:
         return False
-    try:
-        on_disk = {}
-        if SAVE_PATH.exists():
-            on_disk = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        on_disk = {}
-    for k, v in _staged_data.items():
-        if on_disk.get(k) != v:
-            return True
-    return False
-
-def discard_staged_changes():
-    """
-    Forget any staged (unsaved) changes.
-    """
-    try:
-        _staged_data.clear()
-    except Exception:
-        pass
-        return False
-    try:
-        on_disk = {}
-        if SAVE_PATH.exists():
-            on_disk = json.loads(SAVE_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        on_disk = {}
+    on_disk = _disk_snapshot()
     for k, v in _staged_data.items():
         if on_disk.get(k) != v:
             return True
@@ -147,6 +215,6 @@ def discard_staged_changes():
     Forget any staged (unsaved) changes.
     """
     try:
-        _staged_data.clear()
+        _publish(_apply_and_collect(_staged_data.clear))
     except Exception:
         pass
@@ -5,17 +5,30 @@ from typing import Optional, Dict
 BASE_DIR = Path(__file__).parent
 SOUND_DIRS = [BASE_DIR / 'sounds', BASE_DIR / 'audio']
 SUPPORTED_SFX_EXT = ('.wav', '.ogg', '.mp3')
+# (frequency, size, channels) the mixer is always opened with; SDL converts to the device's
+# own format. Fixed so SFX baked into assets.bundle (bundle.py) match on every machine.
+MIXER_FORMAT = (44100, -16, 2)
 
 
 class SoundManager:
+    """Nothing is opened at construction: `init()` starts the mixer and applies the saved
+    master volume, explicitly (menu, after its first frame) or on the first play/preload."""
+
     def __init__(self):
         self._mixer_ready = False
-        self._ensure_mixer()
+        self._started = False  # init() ran (or audio was disabled): don't try again
         self.sfx_cache: Dict[str, pygame.mixer.Sound] = {}
         self.music_volume = 1.0
         self.sfx_volume = 1.0
         self.master_volume = 1.0
 
+    def init(self):
+        """Open the mixer and load the persisted master volume (idempotent)."""
+        if self._started:
+            return
+        self._started = True
+        self._ensure_mixer()
+
         # Try to load persisted master volume from save.py (non-fatal)
         try:
             # local import to avoid coupling at module import time elsewhere
@@ -25,12 +38,19 @@ class SoundManager:
             if mv is not None:
                 try:
                     mvf = float(mv)
-                    self.master_volume = max(0.0, min(1.0, mvf))
+                    _set_master_volume_wrapper(max(0.0, min(1.0, mvf)))
                 except Exception:
                     pass
         except Exception:
             pass
 
+        # Follow later master_volume changes (options slider, reloads) via profile change events
+        try:
+            import save
+            save.subscribe(self._on_profile_changed, keys=("master_volume",))
+        except Exception:
+            pass
+
         # Apply loaded master volume to mixer if available
         try:
             if self._mixer_ready:
@@ -51,12 +71,23 @@ class SoundManager:
         except Exception:
             pass
 
+    def _on_profile_changed(self, changes):
+        mv = changes.get("master_volume")
+        if mv is None:
+            return
+        try:
+            _set_master_volume_wrapper(float(mv))
+        except Exception:
+            pass
+
     def _ensure_mixer(self):
         if self._mixer_ready:
             return
         try:
-            pygame.init()
-            pygame.mixer.init()
+            # pygame.init() may already have opened it in whatever format the device prefers
+            if pygame.mixer.get_init() and pygame.mixer.get_init() != MIXER_FORMAT:
+                pygame.mixer.quit()
+            pygame.mixer.init(*MIXER_FORMAT, allowedchanges=0)
             self._mixer_ready = True
         except Exception:
             self._mixer_ready = False
@@ -80,6 +111,7 @@ class SoundManager:
 
     # ---------- Music ----------
     def play_music(self, filename: str, volume: float = 1.0, loops: int = -1, fade_ms: int = 600):
+        self.init()
         if not self._mixer_ready:
             return
         path = self._find_file(filename)
@@ -108,6 +140,7 @@ class SoundManager:
 
     # ---------- SFX ----------
     def load_sfx(self, name: str) -> Optional[pygame.mixer.Sound]:
+        self.init()
         if not self._mixer_ready:
             return None
         key = name.lower()
@@ -117,7 +150,9 @@ class SoundManager:
         if not path:
             return None
         try:
-            snd = pygame.mixer.Sound(str(path))
+            # decoded PCM from the baked asset bundle when it has this file, else decode it
+            import bundle
+            snd = bundle.sound(path) or pygame.mixer.Sound(str(path))
             self.sfx_cache[key] = snd
             return snd
         except Exception:
@@ -167,6 +202,20 @@ class SoundManager:
         except Exception:
             pass
 
+    def disable(self):
+        """Shut the mixer down and turn every playback call into a no-op (headless runs)."""
+        try:
+            pygame.mixer.quit()
+        except Exception:
+            pass
+        self._started = True
+        self._mixer_ready = False
+        self.sfx_cache.clear()
+
+    def is_enabled(self) -> bool:
+        self.init()
+        return self._mixer_ready
+
 
 # Global singleton
 manager = SoundManager()
@@ -175,6 +224,7 @@ manager = SoundManager()
 MASTER_VOLUME = manager.master_volume
 
 # Convenience functions
+init = manager.init
 play_music = manager.play_music
 stop_music = manager.stop_music
 play_sfx = manager.play_sfx
@@ -198,8 +248,11 @@ pause_all = manager.pause_all
 resume_all = manager.resume_all
 stop_all_sfx = manager.stop_all_sfx
 preload = manager.preload
+disable_audio = manager.disable
+audio_enabled = manager.is_enabled
 
 __all__ = [
-    'play_music', 'stop_music', 'play_sfx', 'set_music_volume', 'set_sfx_volume',
-    'set_master_volume', 'pause_all', 'resume_all', 'stop_all_sfx', 'preload', 'manager', 'MASTER_VOLUME'
+    'init', 'play_music', 'stop_music', 'play_sfx', 'set_music_volume', 'set_sfx_volume',
+    'set_master_volume', 'pause_all', 'resume_all', 'stop_all_sfx', 'preload', 'disable_audio',
+    'audio_enabled', 'manager', 'MASTER_VOLUME'
 ]
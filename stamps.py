@@ -0,0 +1,51 @@
+"""Small pre-drawn stamps (ground shadows, the crosshair ring) shared by all draw code.
+
+Instead of allocating an SRCALPHA surface and drawing an ellipse/circle for every entity every
+frame, draw code blits a stamp from here. Stamps are built lazily, keyed by their integer
+dimensions (jumping slimes shrink their shadow continuously, so sizes are quantized to whole
+pixels) and kept in a bounded LRU.
+"""
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+MAX_STAMPS = 256
+
+_stamps: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+
+
+def _get(key, build) -> pygame.Surface:
+    surf = _stamps.get(key)
+    if surf is not None:
+        _stamps.move_to_end(key)
+        return surf
+    surf = build()
+    _stamps[key] = surf
+    if len(_stamps) > MAX_STAMPS:
+        _stamps.popitem(last=False)
+    return surf
+
+
+def shadow(width: float, height: float, alpha: int) -> pygame.Surface:
+    """Black ellipse of the given size and alpha."""
+    w, h = max(1, int(width)), max(1, int(height))
+
+    def build():
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, (0, 0, 0, alpha), surf.get_rect())
+        return surf
+    return _get(("shadow", w, h, int(alpha)), build)
+
+
+def ring(radius: int, width: int, color=(255, 255, 255)) -> pygame.Surface:
+    """Circle outline centred in a (2*radius+1)^2 surface (blit it at center - radius)."""
+    def build():
+        surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius, width)
+        return surf
+    return _get(("ring", radius, width, tuple(color)), build)
+
+
+def clear():
+    _stamps.clear()
@@ -0,0 +1,43 @@
+"""Tinted sprite variants (hit flash, poison, spawn grace) built once per (frame, tint).
+
+Draw code used to `copy()` the sprite and `fill(tint, BLEND_RGBA_ADD)` every frame an entity
+flashed. `tinted()` returns the same result from a cache attached to the source surface (weakly,
+so variants go away with their sprites). Loaders pre-tint frequent tints with `pretint()`; rare
+ones are built on first use.
+"""
+import weakref
+from typing import Dict, Iterable, Tuple
+
+import pygame
+
+# additive RGBA tints
+ENEMY_HIT = (200, 40, 40, 0)
+ENEMY_POISON = (60, 200, 60, 0)
+PLAYER_HIT = (180, 40, 40, 0)
+PLAYER_GRACE = (200, 180, 60, 0)
+
+_variants: "weakref.WeakKeyDictionary[pygame.Surface, Dict[Tuple[int, ...], pygame.Surface]]" = weakref.WeakKeyDictionary()
+
+
+def tinted(img: pygame.Surface, tint: Tuple[int, int, int, int]) -> pygame.Surface:
+    """`img` with `tint` added to every pixel (alpha untouched for tint alpha 0)."""
+    per_img = _variants.get(img)
+    if per_img is None:
+        per_img = _variants[img] = {}
+    surf = per_img.get(tint)
+    if surf is None:
+        try:
+            surf = img.copy()
+            surf.fill(tint, special_flags=pygame.BLEND_RGBA_ADD)
+        except Exception:
+            surf = img
+        per_img[tint] = surf
+    return surf
+
+
+def pretint(images: Iterable[pygame.Surface], tints: Iterable[Tuple[int, int, int, int]]):
+    """Build the given tints for every image up front (use for tints seen every fight)."""
+    tints = list(tints)
+    for img in images:
+        for tint in tints:
+            tinted(img, tint)
@@ -0,0 +1,131 @@
+"""Background asset warmup while the main menu is idle.
+
+`start()` (called by the menu once its first frame is up, and again whenever it is back in
+front) runs one daemon thread that loads, scales and pre-tints what the next run_game will ask
+for: map tiles, player frames with their tints and the equipped armor's outline, hearts,
+shield, portal, trap and stun sprites, every owned weapon with its rotation atlas, and every
+enemy family at the normal and boss sizes (minions and projectiles included). Everything lands
+in the shared caches (atlas, tints, outlines, rotations, the enemy sprite registry), so the
+loaders in run_game then only hit caches.
+
+`wait()` is run_game's fallback: if PLAY is clicked before the thread is done, it joins it
+(bounded). If the thread is still busy after that, it is told to stop and joined once it has
+finished the sprite in hand (it checks between items), so run_game never loads while the thread
+still fills the caches. Without a start() (headless, replays) it returns at once.
+"""
+import threading
+from typing import Optional
+
+import atlas
+
+TILE_SIZE = 48    # main.run_game's TILE_SIZE / char_size
+BOSS_SIZE = 64    # enemy_size of boss-level spawns
+WAIT_TIMEOUT_S = 5.0
+
+TILE_SPRITES = (
+    "wall_edge.png", "wall_side.png", "lava.png", "wall_corner_1.png", "wall_corner_2.png",
+    "wall_middle_1.png", "wall_middle_2.png", "trap_off.png", "trap_on.png", "portal.png",
+    "shield.png", "stunned.png", "heart_0.png", "heart_1.png",
+    "floor_1.png", "floor_2.png", "floor_3.png", "floor_4.png", "floor_5.png", "floor_6.png",
+)
+PLAYER_FRAMES = tuple(f"{d}_{f}.png" for d in ("up", "down", "left", "right") for f in ("idle", "walk1", "walk2"))
+PROJECTILE_SIZES = (32, 48)  # player projectiles: reloaded at 32 on stat changes, 48 at start
+
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()  # of the current thread; set by wait() when it gives up
+
+
+def _profile():
+    try:
+        import save
+        return save.load_player_data() or {}
+    except Exception:
+        return {}
+
+
+def _player(data, stop):
+    import outlines
+    import tints
+    frames = []
+    for name in PLAYER_FRAMES:
+        try:
+            frames.append(atlas.sprite(name, TILE_SIZE))
+        except Exception:
+            pass
+    color = outlines.ARMOR_COLORS.get((data.get("equipped_armor") or "").strip())
+    for img in frames:
+        if stop.is_set():
+            return
+        tints.pretint([img], (tints.PLAYER_GRACE, tints.PLAYER_HIT))
+        if color is not None:
+            outlines.overlay(img, color, 3)
+
+
+def _weapons(data, stop):
+    import rotations
+    from weapons import WEAPON_LIST
+    owned = set(data.get("weapons_owned") or []) | {"Sword"}
+    for w in WEAPON_LIST:
+        if w.name not in owned:
+            continue
+        if stop.is_set():
+            return
+        try:
+            rotations.prewarm(atlas.sprite(w.sprite_name, TILE_SIZE))
+        except Exception:
+            pass
+        if w.projectile_damage > 0:
+            for size in PROJECTILE_SIZES:
+                try:
+                    rotations.prewarm(atlas.sprite(w.projectile_sprite or "sunball.png", size))
+                except Exception:
+                    pass
+
+
+def _run(stop: threading.Event):
+    try:
+        data = _profile()
+        atlas.sprite("stunned.png")
+        for name in TILE_SPRITES:
+            if stop.is_set():
+                return
+            try:
+                atlas.sprite(name, TILE_SIZE)
+            except Exception:
+                pass
+        _player(data, stop)
+        _weapons(data, stop)
+        import enemies
+        for size in (TILE_SIZE, BOSS_SIZE):
+            enemies.warm_sprites(size, stop)
+    except Exception:
+        pass  # never let a warmup failure surface in the menu; run_game loads what's missing
+
+
+def start():
+    """Start warming up in the background (no-op while a warmup is still running)."""
+    global _thread, _stop
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop = threading.Event()
+    _thread = threading.Thread(target=_run, args=(_stop,), name="asset-warmup", daemon=True)
+    _thread.start()
+
+
+def wait(timeout: float = WAIT_TIMEOUT_S) -> bool:
+    """Block until a running warmup is done (at most `timeout` s), else stop it at its next
+    item and wait for that. Either way nothing is left running on return; True if the warmup
+    got to finish."""
+    t = _thread
+    if t is None:
+        return True
+    t.join(timeout)
+    if not t.is_alive():
+        return True
+    _stop.set()
+    t.join()
+    return False
+
+
+def done() -> bool:
+    return _thread is None or not _thread.is_alive()